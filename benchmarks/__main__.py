@@ -0,0 +1,81 @@
+import argparse
+import importlib
+import json
+import pkgutil
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import benchmarks
+from benchmarks import harness
+
+type Results = dict[str, dict[str, dict[str, Any]]]
+
+
+def discover() -> list[str]:
+    return sorted(info.name for info in pkgutil.iter_modules(benchmarks.__path__) if info.name.startswith("bench_"))
+
+
+def run(names: list[str]) -> Results:
+    results: Results = {}
+    for name in names:
+        print(f"== {name}")
+        harness.RESULTS.clear()
+        importlib.import_module(f"benchmarks.{name}").main()
+        results[name] = dict(harness.RESULTS)
+    return results
+
+
+def compare(results: Results, baseline: Results, threshold: float) -> list[str]:
+    regressions: list[str] = []
+    for module, entries in results.items():
+        for name, entry in entries.items():
+            base = baseline.get(module, {}).get(name)
+            if base is None or base["unit"] != entry["unit"] or base["value"] <= 0:
+                continue
+            ratio = entry["value"] / base["value"]
+            status = ""
+            if ratio > 1 + threshold:
+                status = "REGRESSION"
+                regressions.append(f"{module}: {name}")
+            elif ratio < 1 / (1 + threshold):
+                status = "improved"
+            print(f"{module:<16} {name:<56} {ratio:>6.2f}x  {status}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("names", nargs="*", help="benchmarks to run, all of them by default")
+    parser.add_argument("-o", "--output", type=Path, help="write the results as JSON")
+    parser.add_argument("-c", "--compare", type=Path, help="JSON results to compare against")
+    parser.add_argument("-t", "--threshold", type=float, default=0.2, help="allowed slowdown ratio (default 0.2)")
+    args = parser.parse_args()
+
+    available = discover()
+    names = [name if name.startswith("bench_") else f"bench_{name}" for name in args.names] or available
+    if unknown := [name for name in names if name not in available]:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = run(names)
+    if args.output is not None:
+        document = {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "created": time.time(),
+            "results": results,
+        }
+        args.output.write_text(json.dumps(document, indent=2) + "\n")
+    if args.compare is not None:
+        print(f"== compared with {args.compare}")
+        regressions = compare(results, json.loads(args.compare.read_text())["results"], args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regressions over {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+import gc
+import importlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_persist import CLASS_COUNT, write_models
+from benchmarks.harness import report
+from peritype import clear_cache, wrap_type
+
+REPEAT = 5
+
+
+def _wrap_all(models: object) -> float:
+    clear_cache()
+    gc.collect()
+    start = time.perf_counter()
+    for i in range(CLASS_COUNT):
+        twrap = wrap_type(getattr(models, f"Entity{i}"))
+        _ = twrap.attribute_hints
+        _ = twrap.get_method("method").get_signature_hints()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        write_models(Path(tmp) / "bench_annotation_models.py")
+        sys.path.insert(0, tmp)
+        try:
+            models = importlib.import_module("bench_annotation_models")
+            seconds = min(_wrap_all(models) for _ in range(REPEAT))
+        finally:
+            sys.path.remove(tmp)
+            sys.modules.pop("bench_annotation_models", None)
+    report(f"{CLASS_COUNT} PEP 563 classes, hints and method", seconds, ops=CLASS_COUNT)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from collections.abc import Iterator
+from typing import Any
+
+from benchmarks.harness import measure, report
+from peritype import TWrap, wrap_type
+from peritype.collections import TypeBag
+
+QUERIES = 1_000
+ROUNDS = 20
+
+
+class Repository[T]: ...
+
+
+class Missing: ...
+
+
+def _populate(size: int) -> tuple[TypeBag, list[type]]:
+    models = [type(f"Model{i}", (), {}) for i in range(size)]
+    bag = TypeBag()
+    for model in models:
+        bag.add(wrap_type(Repository[model]))
+    for model in models[::10]:
+        bag.add(wrap_type(Repository[dict[str, model]]))
+    return bag, models
+
+
+def _query(bag: TypeBag, queries: list[TWrap[Any]]) -> None:
+    for query in queries:
+        bag.get_matching(query)
+
+
+def _query_between_adds(bag: TypeBag, queries: list[TWrap[Any]], others: Iterator[TWrap[Any]]) -> None:
+    for _ in range(ROUNDS):
+        bag.add(next(others))
+        _query(bag, queries)
+
+
+def _run(size: int) -> None:
+    bag, models = _populate(size)
+    picked = models[:: size // QUERIES]
+    hits = [wrap_type(Repository[model | Missing]) for model in picked]
+    misses = [wrap_type(Repository[list[model]]) for model in picked]
+    wildcards = [wrap_type(Repository[dict[Any, model]]) for model in picked]
+    report(f"{size} Repository[X], {QUERIES} union hits", measure(lambda: _query(bag, hits)), ops=QUERIES)
+    report(f"{size} Repository[X], {QUERIES} misses", measure(lambda: _query(bag, misses)), ops=QUERIES)
+    report(f"{size} Repository[X], {QUERIES} Any queries", measure(lambda: _query(bag, wildcards)), ops=QUERIES)
+    others = iter([wrap_type(type(f"Other{i}", (), {})) for i in range(ROUNDS * 5)])
+    report(
+        f"{size} Repository[X], {ROUNDS} adds between queries",
+        measure(lambda: _query_between_adds(bag, hits + misses, others)),
+        ops=ROUNDS * QUERIES * 2,
+    )
+
+
+def main() -> None:
+    for size in (10_000, 100_000):
+        _run(size)
+
+
+if __name__ == "__main__":
+    main()
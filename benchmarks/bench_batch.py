@@ -0,0 +1,44 @@
+import gc
+from collections.abc import Callable
+from typing import Annotated, Any
+
+from benchmarks.harness import measure, report
+from benchmarks.models import make_classes
+from peritype import TWrap, clear_cache, wrap_type, wrap_types
+
+SIZES = (1_000, 10_000, 100_000)
+CLASS_COUNT = 500
+
+
+def make_annotations(count: int) -> list[Any]:
+    classes = make_classes(CLASS_COUNT)
+    shapes: list[Callable[[Any], Any]] = [
+        lambda c: list[c],
+        lambda c: dict[str, c],
+        lambda c: c | None,
+        lambda c: Annotated[list[c], "meta"],
+        lambda c: dict[str, list[c]] | None,
+    ]
+    return [shapes[i % len(shapes)](classes[(i // len(shapes)) % CLASS_COUNT]) for i in range(count)]
+
+
+def _cold(func: Callable[[], list[TWrap[Any]]]) -> Callable[[], None]:
+    def run() -> None:
+        clear_cache()
+        gc.collect()
+        func()
+
+    return run
+
+
+def main() -> None:
+    for size in SIZES:
+        annotations = make_annotations(size)
+        loop = measure(_cold(lambda: [wrap_type(a) for a in annotations]), repeat=3)  # noqa: B023
+        batch = measure(_cold(lambda: wrap_types(annotations)), repeat=3)  # noqa: B023
+        report(f"{size} annotations, wrap_type loop", loop, ops=size)
+        report(f"{size} annotations, wrap_types", batch, ops=size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import types
+from typing import Any, Literal, NotRequired, TypedDict, Union, get_args, get_origin, get_type_hints, is_typeddict
+
+from benchmarks.harness import measure, report
+from peritype import wrap_type
+
+ROUNDS = 1_000
+HUGE = 1_000_000
+SAMPLE = 100
+
+
+class Record(TypedDict):
+    id: int
+    name: str
+    kind: Literal["a", "b"]
+    tags: list[str]
+    parent: NotRequired[int | None]
+
+
+def naive_check(value: Any, annotation: Any) -> bool:
+    if annotation is Any:
+        return True
+    if annotation is None:
+        return value is None
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in (Union, types.UnionType):
+        return any(naive_check(value, arg) for arg in args)
+    if origin is NotRequired:
+        return naive_check(value, args[0])
+    if origin is Literal:
+        return any(type(value) is type(arg) and value == arg for arg in args)
+    if is_typeddict(annotation):
+        if not isinstance(value, dict):
+            return False
+        hints = get_type_hints(annotation)
+        if not annotation.__required_keys__ <= value.keys():
+            return False
+        return all(naive_check(v, hints[k]) for k, v in value.items() if k in hints)
+    if origin is None:
+        return isinstance(value, annotation)
+    if not isinstance(value, origin):
+        return False
+    if origin is dict:
+        return all(naive_check(k, args[0]) and naive_check(v, args[1]) for k, v in value.items())
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return all(naive_check(v, args[0]) for v in value)
+        return len(value) == len(args) and all(naive_check(v, a) for v, a in zip(value, args, strict=True))
+    return all(naive_check(v, args[0]) for v in value)
+
+
+def main() -> None:
+    record: Record = {"id": 1, "name": "a", "kind": "a", "tags": ["x", "y"], "parent": None}
+    cases: dict[str, tuple[Any, Any]] = {
+        "flat": (int, 1),
+        "wide union": (int | str | bytes | float | None, None),
+        "dict[str, list[int]]": (dict[str, list[int]], {str(i): [*range(10)] for i in range(10)}),
+        "TypedDict": (Record, record),
+        "list[TypedDict] (10)": (list[Record], [record] * 10),
+    }
+    for name, (annotation, value) in cases.items():
+        validator = wrap_type(annotation).validator()
+        assert validator(value) and naive_check(value, annotation)
+        naive = measure(lambda: [naive_check(value, annotation) for _ in range(ROUNDS)])  # noqa: B023
+        compiled = measure(lambda: [validator(value) for _ in range(ROUNDS)])  # noqa: B023
+        report(f"{name}, naive", naive, ops=ROUNDS)
+        report(f"{name}, compiled", compiled, ops=ROUNDS)
+
+    huge = [*range(HUGE)]
+    twrap = wrap_type(list[int])
+    report(f"list[int] ({HUGE}), naive", measure(lambda: naive_check(huge, list[int]), repeat=3))
+    report(f"list[int] ({HUGE}), compiled", measure(lambda: twrap.check(huge), repeat=3))
+    report(f"list[int] ({HUGE}), sampled {SAMPLE}", measure(lambda: twrap.check(huge, sample=SAMPLE)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from types import new_class
+from typing import Any
+
+from benchmarks.harness import measure, report
+from peritype import TWrap, wrap_type
+from peritype.collections import TypeBag, TypeSuperTree
+
+SIZE = 10_000
+CHURN = 1_000
+DEPTH = 14
+
+
+class Service: ...
+
+
+class Handler[T](Service): ...
+
+
+class Reloadable(Service): ...
+
+
+def _plugins(size: int) -> list[TWrap[Any]]:
+    models = [type(f"Model{i}", (), {}) for i in range(size)]
+    return [wrap_type(new_class(f"Plugin{i}", (Handler[model], Reloadable))) for i, model in enumerate(models)]
+
+
+def _ladder(depth: int) -> TWrap[Any]:
+    top: type = Service
+    for i in range(depth):
+        left = type(f"Left{i}", (top,), {})
+        right = type(f"Right{i}", (top,), {})
+        top = type(f"Join{i}", (left, right), {})
+    return wrap_type(top)
+
+
+def _build_bag(twraps: list[TWrap[Any]]) -> TypeBag:
+    bag = TypeBag()
+    for twrap in twraps:
+        bag.add(twrap)
+    return bag
+
+
+def _build_tree(twraps: list[TWrap[Any]]) -> TypeSuperTree:
+    tree = TypeSuperTree()
+    for twrap in twraps:
+        tree.add(twrap)
+    return tree
+
+
+def _churn_bag(bag: TypeBag, twraps: list[TWrap[Any]]) -> None:
+    for twrap in twraps:
+        bag.remove(twrap)
+        bag.add(twrap)
+
+
+def _churn_tree(tree: TypeSuperTree, twraps: list[TWrap[Any]]) -> None:
+    for twrap in twraps:
+        tree.remove(twrap)
+        tree.add(twrap)
+
+
+def main() -> None:
+    plugins = _plugins(SIZE)
+    handlers = [base for plugin in plugins for base in plugin.nodes[0].bases[:1]]
+    report(f"rebuild bag of {SIZE} handlers", measure(lambda: _build_bag(handlers), repeat=3))
+    report(f"rebuild super tree of {SIZE} plugins", measure(lambda: _build_tree(plugins), repeat=3))
+    ladder = _ladder(DEPTH)
+    report(f"super tree add, diamond ladder of depth {DEPTH}", measure(lambda: _build_tree([ladder]), repeat=3))
+
+    bag = _build_bag(handlers)
+    tree = _build_tree(plugins)
+    churned = plugins[:: SIZE // CHURN]
+    report(
+        f"bag of {SIZE}, {CHURN} remove/add",
+        measure(lambda: _churn_bag(bag, handlers[:: SIZE // CHURN])),
+        ops=CHURN,
+    )
+    report(f"super tree of {SIZE}, {CHURN} remove/add", measure(lambda: _churn_tree(tree, churned)), ops=CHURN)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.harness import measure, report
+from peritype import TWrap, wrap_type
+from peritype.collections import TypeBag, TypeMap, TypeSuperTree
+
+CYCLES = 1_000
+BASES = 100
+
+
+class Scoped: ...
+
+
+def _classes(size: int) -> list[TWrap[Any]]:
+    bases = [type(f"Base{i}", (), {}) for i in range(BASES)]
+    return [wrap_type(type(f"Model{i}", (bases[i % BASES],), {})) for i in range(size)]
+
+
+def _cycles(cycle: Callable[[], object]) -> None:
+    for _ in range(CYCLES):
+        cycle()
+
+
+def _run(size: int) -> None:
+    scoped = wrap_type(Scoped)
+    twraps = _classes(size)
+    type_map = TypeMap[Any, int]()
+    bag = TypeBag()
+    tree = TypeSuperTree()
+    for i, twrap in enumerate(twraps):
+        type_map[twrap] = i
+        bag.add(twrap)
+        tree.add(twrap)
+    report(
+        f"TypeMap of {size}, copy + write",
+        measure(lambda: _cycles(lambda: type_map.copy().add(scoped, 0))),
+        ops=CYCLES,
+    )
+    report(f"TypeBag of {size}, copy + add", measure(lambda: _cycles(lambda: bag.copy().add(scoped))), ops=CYCLES)
+    report(
+        f"TypeSuperTree of {size}, copy + add",
+        measure(lambda: _cycles(lambda: tree.copy().add(scoped))),
+        ops=CYCLES,
+    )
+
+
+def main() -> None:
+    for size in (1_000, 10_000, 100_000):
+        _run(size)
+
+
+if __name__ == "__main__":
+    main()
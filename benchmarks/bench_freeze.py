@@ -0,0 +1,67 @@
+from collections.abc import Callable
+from types import new_class
+from typing import Any
+
+from benchmarks.harness import measure, record, report
+from peritype import TWrap, wrap_type
+from peritype.collections import FreezeReport, TypeBag, TypeSuperTree
+
+SIZE = 10_000
+
+
+class Service: ...
+
+
+class Handler[T](Service): ...
+
+
+def _lookups(twraps: list[TWrap[Any]], lookup: Callable[[TWrap[Any]], object]) -> None:
+    for twrap in twraps:
+        lookup(twrap)
+
+
+def _memory(name: str, freeze_report: FreezeReport) -> None:
+    record(name, freeze_report.saved, "bytes")
+    print(f"{name:<48} {freeze_report.before:>12,} -> {freeze_report.after:,} bytes")
+
+
+def main() -> None:
+    models = [type(f"Model{i}", (), {}) for i in range(SIZE)]
+    handlers = [wrap_type(Handler[model]) for model in models]
+    plugins = [wrap_type(new_class(f"Plugin{i}", (Handler[model],))) for i, model in enumerate(models)]
+    queries = [wrap_type(Handler[model | None]) for model in models]
+    bag = TypeBag()
+    tree = TypeSuperTree()
+    for handler, plugin in zip(handlers, plugins, strict=True):
+        bag.add(handler)
+        tree.add(plugin)
+
+    report(f"TypeBag of {SIZE}, freeze", measure(bag.freeze, repeat=3))
+    report(f"TypeSuperTree of {SIZE}, freeze", measure(tree.freeze, repeat=3))
+    frozen_bag = bag.freeze()
+    frozen_tree = tree.freeze()
+    _lookups(queries, bag.get_matching)
+    _lookups(queries, frozen_bag.get_matching)
+
+    report("TypeBag.get_matching, registered", measure(lambda: _lookups(handlers, bag.get_matching)), ops=SIZE)
+    report(
+        "FrozenTypeBag.get_matching, registered",
+        measure(lambda: _lookups(handlers, frozen_bag.get_matching)),
+        ops=SIZE,
+    )
+    report("TypeBag.get_matching, cached union", measure(lambda: _lookups(queries, bag.get_matching)), ops=SIZE)
+    report(
+        "FrozenTypeBag.get_matching, cached union",
+        measure(lambda: _lookups(queries, frozen_bag.get_matching)),
+        ops=SIZE,
+    )
+    report("TypeBag.get_all, registered", measure(lambda: _lookups(handlers, bag.get_all)), ops=SIZE)
+    report("FrozenTypeBag.get_all, registered", measure(lambda: _lookups(handlers, frozen_bag.get_all)), ops=SIZE)
+    report("TypeSuperTree lookup", measure(lambda: _lookups(handlers, tree.__getitem__)), ops=SIZE)
+    report("FrozenTypeSuperTree lookup", measure(lambda: _lookups(handlers, frozen_tree.__getitem__)), ops=SIZE)
+    _memory(f"TypeBag of {SIZE}, memory", frozen_bag.report)
+    _memory(f"TypeSuperTree of {SIZE}, memory", frozen_tree.report)
+
+
+if __name__ == "__main__":
+    main()
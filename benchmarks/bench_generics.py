@@ -0,0 +1,92 @@
+import gc
+from typing import Any
+
+from benchmarks.harness import measure, report
+from benchmarks.models import Pair, make_classes
+from peritype import TWrap, clear_cache, wrap_type
+
+SPECIALISATIONS = 1_000
+INIT_SPECIALISATIONS = 100
+INIT_CALLS = 10
+
+
+class Base[T]:
+    id: int
+    value: T
+
+    def get(self, key: str) -> T | None: ...
+
+
+class Listing[T](Base[T]):
+    items: list[T]
+
+
+class Indexed[T](Listing[T]):
+    index: dict[str, T]
+
+
+class Paged[T](Indexed[T]):
+    page: tuple[T, ...]
+
+    def first(self) -> T: ...
+
+
+class Cached[T](Paged[T]):
+    cache: dict[str, T | None]
+
+
+class Audited[T](Cached[T]):
+    history: Pair[str, T]
+
+
+class Versioned[K, T](Audited[T]):
+    versions: dict[K, T]
+
+
+class Repository[T](Versioned[int, T]):
+    def find(self, value: T) -> list[T]: ...
+
+
+class Service[T]:
+    def __init__(self, repository: Repository[T], items: list[T], cache: dict[str, T] | None = None) -> None: ...
+
+
+def _touch(twrap: TWrap[Any]) -> None:
+    _ = twrap.attribute_hints
+    _ = twrap.get_method("find").get_signature_hints()
+    _ = twrap.get_method("get").get_signature_hints()
+
+
+def _specialise(classes: list[type[Any]]) -> None:
+    clear_cache()
+    gc.collect()
+    for cls in classes:
+        _touch(wrap_type(Repository[cls]))
+
+
+def _init_hints(classes: list[type[Any]]) -> None:
+    clear_cache()
+    gc.collect()
+    for cls in classes:
+        twrap = wrap_type(Service[cls])
+        for _ in range(INIT_CALLS):
+            _ = twrap.init.get_signature_hints()
+            _ = twrap.get_method("__init__").get_signature_hints()
+
+
+def main() -> None:
+    classes = make_classes(SPECIALISATIONS, "Stored")
+    report(
+        f"{SPECIALISATIONS} specialisations of an 8-level hierarchy",
+        measure(lambda: _specialise(classes), repeat=3),
+        ops=SPECIALISATIONS,
+    )
+    report(
+        f"{INIT_SPECIALISATIONS} specialisations, init hints x{INIT_CALLS}",
+        measure(lambda: _init_hints(classes[:INIT_SPECIALISATIONS]), repeat=5),
+        ops=INIT_SPECIALISATIONS,
+    )
+
+
+if __name__ == "__main__":
+    main()
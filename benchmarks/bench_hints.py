@@ -0,0 +1,65 @@
+import gc
+import time
+import types
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.bench_workloads import make_diamonds
+from benchmarks.harness import report
+from peritype import clear_cache, wrap_type
+
+CHAIN_DEPTH = 10
+DIAMOND_DEPTHS = (6, 10)
+FIELDS = 5
+VARIANTS = 200
+
+
+def make_chain(depth: int) -> type[Any]:
+    cls: type[Any] = object
+    for i in range(depth):
+        annotations = {f"field{i}_{j}": (int, str | None, list[int], dict[str, float], bytes)[j] for j in range(FIELDS)}
+        cls = types.new_class(f"Chain{i}", (cls,), exec_body=lambda ns, a=annotations: ns.update(__annotations__=a))
+    return cls
+
+
+def measure_cold(func: Callable[[], object], *, repeat: int = 5) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        clear_cache()
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _variants(cls: type[Any]) -> None:
+    for annotation in (cls, cls | None, list[cls], dict[str, cls]):
+        twrap = wrap_type(annotation)
+        for node in twrap.nodes:
+            _ = node.attribute_hints
+            for param in node.generic_params:
+                _ = param.nodes[0].attribute_hints
+
+
+def main() -> None:
+    chain = make_chain(CHAIN_DEPTH)
+    report(f"{CHAIN_DEPTH}-level chain, attribute_hints", measure_cold(lambda: wrap_type(chain).attribute_hints))
+    report(
+        f"{CHAIN_DEPTH}-level chain, one attribute hint",
+        measure_cold(lambda: wrap_type(chain).get_attribute_hint("field0_0")),
+    )
+    levels = [make_chain(CHAIN_DEPTH) for _ in range(VARIANTS)]
+    report(
+        f"{VARIANTS} {CHAIN_DEPTH}-level chains, every level",
+        measure_cold((lambda: [wrap_type(c).attribute_hints for top in levels for c in top.__mro__[:-1]]), repeat=3),
+        ops=VARIANTS * CHAIN_DEPTH,
+    )
+    report(f"{CHAIN_DEPTH}-level chain, 4 wrap shapes", measure_cold(lambda: _variants(chain)), ops=4)
+    for depth in DIAMOND_DEPTHS:
+        bottom = make_diamonds(depth)
+        report(f"diamond ({depth}), attribute_hints", measure_cold(lambda: wrap_type(bottom).attribute_hints))  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import weakref
+from typing import Any
+
+from benchmarks.harness import measure, report
+from peritype import wrap_type
+
+HITS = 100_000
+BUDGET = 1.0
+ROUNDS = 9
+
+
+def main() -> None:
+    for hint in (int, dict[str, list[int]]):
+        twrap = wrap_type(hint)
+        reference = weakref.WeakValueDictionary[Any, Any]({hint: twrap})
+
+        def lookup(cls: Any, *, lookup: Any = None, reference: Any = reference) -> Any:
+            if cls in reference:
+                return reference[cls]
+            return None
+
+        def baseline(hint: Any = hint, lookup: Any = lookup) -> None:
+            for _ in range(HITS):
+                _ = lookup(hint)
+
+        def hits(hint: Any = hint) -> None:
+            for _ in range(HITS):
+                _ = wrap_type(hint)
+
+        expected = elapsed = float("inf")
+        for _ in range(ROUNDS):
+            expected = min(expected, measure(baseline, repeat=1))
+            elapsed = min(elapsed, measure(hits, repeat=1))
+        report(f"wrap_type cache hit, {hint}", elapsed, ops=HITS)
+        report(f"weak dictionary hit, {hint}", expected, ops=HITS)
+        assert elapsed <= expected * BUDGET, f"{hint} hits take {elapsed / expected:.2f}x a weak dictionary lookup"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from typing import Any
+
+from benchmarks.harness import measure, report
+from benchmarks.models import Box, Pair, make_classes
+from peritype import clear_cache, configure_match_cache, wrap_type
+from peritype.collections import TypeBag, TypeMap
+
+MAP_SIZE = 2_000
+BAG_SIZE = 200
+
+
+def main() -> None:
+    classes = make_classes(MAP_SIZE)
+    aliases: list[Any] = [Box[cls] for cls in classes]
+    keys = [wrap_type(alias) for alias in aliases]
+    type_map = TypeMap[Any, int]()
+    for i, key in enumerate(keys):
+        type_map[key] = i
+
+    def lookup_warm() -> None:
+        for key in keys:
+            _ = type_map[key]
+
+    def lookup_rewrapped() -> None:
+        clear_cache()
+        for alias in aliases:
+            _ = type_map[wrap_type(alias)]
+
+    report("TypeMap lookup, same wraps", measure(lookup_warm), ops=MAP_SIZE)
+    report("TypeMap lookup, rewrapped keys", measure(lookup_rewrapped), ops=MAP_SIZE)
+
+    bag = TypeBag()
+    for cls in classes[:BAG_SIZE]:
+        bag.add(wrap_type(Pair[cls, Any]))
+    queries = [wrap_type(Pair[cls, int]) for cls in classes[:BAG_SIZE]]
+
+    def bag_matching() -> None:
+        for query in queries:
+            _ = bag.get_matching(query)
+
+    report("TypeBag.get_matching", measure(bag_matching), ops=BAG_SIZE)
+
+    deep_bag = TypeBag()
+    for cls in classes[:BAG_SIZE]:
+        deep_bag.add(wrap_type(Pair[Box[list[dict[str, cls]]], int]))
+    deep_queries = [wrap_type(Pair[Box[list[dict[str, cls]]], Any]) for cls in classes[:BAG_SIZE]]
+
+    def deep_bag_all() -> None:
+        for query in deep_queries:
+            _ = deep_bag.get_all(query)
+
+    report("TypeBag.get_all, nested generics", measure(deep_bag_all), ops=BAG_SIZE)
+    configure_match_cache(enabled=True, maxsize=BAG_SIZE * BAG_SIZE)
+    try:
+        report("TypeBag.get_matching, match cache", measure(bag_matching), ops=BAG_SIZE)
+        report("TypeBag.get_all, nested generics, match cache", measure(deep_bag_all), ops=BAG_SIZE)
+    finally:
+        configure_match_cache(enabled=False)
+
+
+if __name__ == "__main__":
+    main()
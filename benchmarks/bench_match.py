@@ -0,0 +1,55 @@
+from typing import Any
+
+from benchmarks.harness import measure, report
+from benchmarks.models import Box, Pair, make_classes
+from peritype import TWrap, wrap_type
+from peritype.twrap import TypeNode
+
+ROUNDS = 10_000
+
+
+def interpreted_match(a: TWrap[Any], b: TWrap[Any]) -> bool:
+    for x in a.nodes:
+        for y in b.nodes:
+            if _nodes_intersect(x, y):
+                return True
+    return False
+
+
+def _nodes_intersect(a: TypeNode[Any], b: TypeNode[Any]) -> bool:
+    if a.origin is Any or b.origin is Any or a.origin is Ellipsis or b.origin is Ellipsis:
+        return True
+    if a.inner_type is not b.inner_type:
+        return False
+    if len(a.origin_params) != len(b.origin_params):
+        return False
+    a_params = a.generic_params
+    b_params = b.generic_params
+    for i in range(len(a_params)):
+        if not interpreted_match(a_params[i], b_params[i]):
+            return False
+    return True
+
+
+def main() -> None:
+    classes = make_classes(32)
+    wide: Any = classes[0]
+    for cls in classes[1:]:
+        wide = wide | cls
+    cases: dict[str, tuple[Any, Any]] = {
+        "flat": (int, int),
+        "nested generic": (dict[str, list[Pair[int, Box[str]]]], dict[str, list[Pair[int, Box[str]]]]),
+        "wide union (32)": (wide, classes[-1]),
+    }
+    for name, (pattern, value) in cases.items():
+        a, b = wrap_type(pattern), wrap_type(value)
+        matcher = a.compile_matcher()
+        assert interpreted_match(a, b) == matcher(b)
+        interpreted = measure(lambda: [interpreted_match(a, b) for _ in range(ROUNDS)])  # noqa: B023
+        compiled = measure(lambda: [matcher(b) for _ in range(ROUNDS)])  # noqa: B023
+        report(f"{name}, interpreted", interpreted, ops=ROUNDS)
+        report(f"{name}, compiled", compiled, ops=ROUNDS)
+
+
+if __name__ == "__main__":
+    main()
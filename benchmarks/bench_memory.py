@@ -0,0 +1,53 @@
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.harness import record
+from benchmarks.models import Box, Pair, make_classes
+from peritype import TWrap, clear_cache, wrap_type
+
+COUNT = 2_000
+
+
+def _touch(twrap: TWrap[Any]) -> None:
+    _ = hash(twrap)
+    _ = str(twrap)
+    _ = repr(twrap)
+    _ = twrap.contains_any
+    _ = twrap.nullable
+    for node in twrap.nodes:
+        _ = node.bases
+        _ = node.type_var_lookup
+
+
+def _bytes_per_wrap(shape: Callable[[type[Any]], Any]) -> float:
+    annotations = [shape(cls) for cls in make_classes(COUNT, "Memory")]
+    clear_cache()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    wraps = [wrap_type(annotation) for annotation in annotations]
+    for twrap in wraps:
+        _touch(twrap)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / len(wraps)
+
+
+def main() -> None:
+    shapes: dict[str, Callable[[type[Any]], Any]] = {
+        "flat class": lambda c: c,
+        "generic, Box[C]": lambda c: Box[c],
+        "optional union, C | None": lambda c: c | None,
+        "nested, dict[str, list[Pair[C, Box[C]]]]": lambda c: dict[str, list[Pair[c, Box[c]]]],
+    }
+    for name, shape in shapes.items():
+        size = _bytes_per_wrap(shape)
+        record(name, size, "bytes")
+        print(f"{name:<48} {size:>10,.0f} bytes per wrap")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import gc
+from dataclasses import dataclass
+
+from benchmarks.harness import measure, report
+from peritype import clear_cache, wrap_func
+
+INSTANCES = 10_000
+CALLS = 3
+
+
+@dataclass
+class Account:
+    id: int
+    owner: str
+
+    def deposit(self, amount: float, note: str | None = None) -> "Account": ...
+
+
+def _wrap_methods(instances: list[Account]) -> None:
+    clear_cache()
+    gc.collect()
+    for instance in instances:
+        for _ in range(CALLS):
+            fwrap = wrap_func(instance.deposit)
+            _ = fwrap.parameters
+            _ = fwrap.get_signature_hints()
+
+
+def main() -> None:
+    instances = [Account(i, f"owner{i}") for i in range(INSTANCES)]
+    report(
+        f"{INSTANCES} instances, wrap_func(method) x{CALLS}",
+        measure(lambda: _wrap_methods(instances), repeat=3),
+        ops=INSTANCES * CALLS,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.harness import record, report
+
+CLASS_COUNT = 2_000
+REPEAT = 5
+
+CHILD = """
+import sys
+import time
+
+start = time.perf_counter()
+import peritype
+
+if sys.argv[1] != "-":
+    peritype.persist.configure(sys.argv[1])
+import bench_persisted_models as models
+
+for i in range({count}):
+    twrap = peritype.wrap_type(getattr(models, f"Entity{{i}}"))
+    _ = twrap.attribute_hints
+    _ = twrap.get_method("method").get_signature_hints()
+print(time.perf_counter() - start)
+"""
+
+
+def write_models(path: Path) -> None:
+    lines = [
+        "from __future__ import annotations",
+        "from collections.abc import Mapping",
+        "from typing import Any, Literal",
+        "from benchmarks.models import Box, Pair",
+    ]
+    for i in range(CLASS_COUNT):
+        other = f"Entity{i - 1}" if i else "int"
+        lines += [
+            f"class Entity{i}:",
+            "    id: int",
+            "    name: str | None",
+            "    kind: Literal['a', 'b']",
+            f"    parent: {other} | None",
+            f"    children: list[{other}]",
+            f"    index: dict[str, list[Mapping[str, tuple[{other}, ...]]]]",
+            f"    pairs: list[Pair[str, Box[{other}]]]",
+            "    extra: dict[str, Any] | None",
+            f"    def method(self, a: int, b: {other} | None = None) -> list[{other}]: ...",
+        ]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def run(directory: Path, cache: str) -> float:
+    env = {"PYTHONPATH": f"{directory}:{Path.cwd()}", "PYTHONDONTWRITEBYTECODE": "1"}
+    code = CHILD.format(count=CLASS_COUNT)
+    output = subprocess.run([sys.executable, "-c", code, cache], env=env, capture_output=True, text=True, check=True)
+    return float(output.stdout)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        write_models(directory / "bench_persisted_models.py")
+        cache = str(directory / "hints.bin")
+        cold = min(run(directory, "-") for _ in range(REPEAT))
+        populate = run(directory, cache)
+        warm = min(run(directory, cache) for _ in range(REPEAT))
+        size = Path(cache).stat().st_size
+    report(f"{CLASS_COUNT} classes, no persistent cache", cold, ops=CLASS_COUNT)
+    report(f"{CLASS_COUNT} classes, populating cache", populate, ops=CLASS_COUNT)
+    report(f"{CLASS_COUNT} classes, warm persistent cache", warm, ops=CLASS_COUNT)
+    record("cache file", size, "bytes")
+    print(f"cache file: {size / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import gc
+from typing import Any
+
+from benchmarks.harness import measure, report
+from benchmarks.models import make_models
+from peritype import clear_cache, use_lazy_params, wrap_type
+
+MODEL_COUNT = 1_000
+DEEP_RATIO = 10
+
+
+def _startup(models: list[type[Any]]) -> None:
+    for i, model in enumerate(models):
+        for hint in wrap_type(model).attribute_hints.values():
+            _ = hint.nullable
+            if not hint.union:
+                _ = hint.inner_type
+                if i % DEEP_RATIO == 0:
+                    _ = hint.generic_params
+
+
+def _cold_startup(models: list[type[Any]], lazy: bool) -> None:
+    clear_cache()
+    gc.collect()
+    use_lazy_params(lazy)
+    try:
+        _startup(models)
+    finally:
+        use_lazy_params(False)
+
+
+def main() -> None:
+    models = make_models(MODEL_COUNT)
+    hints = MODEL_COUNT * len(models[0].__annotations__)
+    report("eager wrapping", measure(lambda: _cold_startup(models, False)), ops=hints)
+    report("lazy wrapping", measure(lambda: _cold_startup(models, True)), ops=hints)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from benchmarks.harness import report
+from benchmarks.models import Box, Pair, make_classes
+from peritype import TWrap, clear_cache, wrap_type
+
+TYPE_COUNT = 500
+THREAD_COUNTS = (1, 2, 4, 8)
+ROUNDS = 3
+
+
+def _resolve(aliases: list[Any], offset: int) -> list[TWrap[Any]]:
+    resolved: list[TWrap[Any]] = []
+    for alias in aliases[offset:] + aliases[:offset]:
+        twrap = wrap_type(alias)
+        _ = twrap.attribute_hints
+        resolved.append(twrap)
+    return resolved
+
+
+def _round(aliases: list[Any], threads: int) -> float:
+    clear_cache()
+    barrier = threading.Barrier(threads)
+
+    def run(index: int) -> list[TWrap[Any]]:
+        barrier.wait()
+        return _resolve(aliases, index * len(aliases) // threads)
+
+    with ThreadPoolExecutor(threads) as pool:
+        start = time.perf_counter()
+        _ = [*pool.map(run, range(threads))]
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    classes = make_classes(TYPE_COUNT)
+    aliases: list[Any] = [Box[Pair[cls, list[cls]] | None] for cls in classes]
+    for threads in THREAD_COUNTS:
+        seconds = min(_round(aliases, threads) for _ in range(ROUNDS))
+        report(f"{threads} threads, overlapping types", seconds, ops=threads * TYPE_COUNT)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import asyncio
+import gc
+import importlib
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from benchmarks.bench_persist import CLASS_COUNT, write_models
+from benchmarks.harness import record, report
+from peritype import WarmupReport, clear_cache, warmup, warmup_async, wrap_type
+
+
+def _handle(cls: type[Any]) -> None:
+    twrap = wrap_type(cls)
+    _ = twrap.attribute_hints
+    _ = twrap.get_method("method").get_signature_hints()
+
+
+def _latencies(classes: list[type[Any]]) -> list[float]:
+    latencies: list[float] = []
+    for cls in classes:
+        start = time.perf_counter()
+        _handle(cls)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _percentiles(name: str, latencies: list[float]) -> None:
+    cuts = statistics.quantiles(latencies, n=100)
+    record(f"{name}, p50", cuts[49], "s")
+    record(f"{name}, p99", cuts[98], "s")
+    print(f"{name:<48} p50 {cuts[49] * 1e6:>8.1f} us  p99 {cuts[98] * 1e6:>8.1f} us")
+
+
+def _reset() -> None:
+    clear_cache()
+    gc.collect()
+
+
+def _load_models(name: str) -> list[type[Any]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        write_models(Path(tmp) / f"{name}.py")
+        sys.path.insert(0, tmp)
+        try:
+            module = importlib.import_module(name)
+        finally:
+            sys.path.remove(tmp)
+    return [getattr(module, f"Entity{i}") for i in range(CLASS_COUNT)]
+
+
+async def _loop_gaps(work: Callable[[], Awaitable[WarmupReport]]) -> tuple[list[float], float]:
+    gaps: list[float] = []
+
+    async def probe() -> None:
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    prober = asyncio.create_task(probe())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    warmed = await work()
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0)
+    prober.cancel()
+    assert not warmed.failures
+    return gaps, elapsed
+
+
+def _event_loop(name: str, work: Callable[[Any], Awaitable[WarmupReport]]) -> None:
+    _load_models(name)
+    _reset()
+    gaps, elapsed = asyncio.run(_loop_gaps(lambda: work(sys.modules[name])))
+    p99 = statistics.quantiles(gaps, n=100)[98] if len(gaps) > 1 else gaps[0]
+    record(f"{name}, loop stall p99", p99, "s")
+    print(f"{name:<40} loop stall p99 {p99 * 1e3:>8.2f} ms  max {max(gaps) * 1e3:>8.2f} ms  total {elapsed:.2f} s")
+
+
+async def _blocking(module: Any) -> WarmupReport:
+    return warmup(module)
+
+
+def main() -> None:
+    classes = _load_models("bench_warmup_cold")
+    _reset()
+    _percentiles("first touch, cold", _latencies(classes))
+
+    classes = _load_models("bench_warmup_warm")
+    _reset()
+    start = time.perf_counter()
+    warmed = warmup(sys.modules["bench_warmup_warm"])
+    report("warmup", time.perf_counter() - start, ops=CLASS_COUNT)
+    assert not warmed.failures
+    _percentiles("first touch, after warmup", _latencies(classes))
+
+    _event_loop("bench_warmup_sync_in_loop", _blocking)
+    _event_loop("bench_warmup_async_1ms", lambda m: warmup_async(m, slice_seconds=0.001))
+    _event_loop("bench_warmup_async_5ms", lambda m: warmup_async(m, slice_seconds=0.005))
+
+
+if __name__ == "__main__":
+    main()
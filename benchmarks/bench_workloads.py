@@ -0,0 +1,152 @@
+import gc
+import types
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.harness import measure, report
+from benchmarks.models import Box, Pair, make_classes
+from peritype import TWrap, clear_cache, wrap_func, wrap_type
+from peritype.collections import TypeBag, TypeSuperTree
+
+HIERARCHY_DEPTH = 30
+UNION_WIDTH = 64
+REGISTRY_SIZE = 10_000
+REGISTRY_MISSES = 20
+DIAMOND_DEPTH = 6
+FUNCTION_COUNT = 1_000
+MATCH_ROUNDS = 1_000
+
+
+class Level0[T]:
+    value: T
+
+
+def make_hierarchy(depth: int) -> list[Any]:
+    var: Any = Level0.__type_params__[0]
+    levels: list[Any] = [Level0]
+    for i in range(1, depth):
+        levels.append(
+            types.new_class(
+                f"Level{i}",
+                (levels[-1][var],),
+                exec_body=lambda ns, i=i: ns.update(
+                    __annotations__={f"field{i}": list[var], f"optional{i}": var | None}
+                ),
+            )
+        )
+    return levels
+
+
+def make_diamonds(depth: int) -> type[Any]:
+    level = [types.new_class("Root", (), exec_body=lambda ns: ns.update(__annotations__={"root": int}))]
+    for i in range(depth):
+        level = [
+            types.new_class(
+                f"{side}{i}",
+                (*level,),
+                exec_body=lambda ns, name=f"{side}{i}": ns.update(__annotations__={name.lower(): str | None}),
+            )
+            for side in ("Left", "Right")
+        ]
+    return types.new_class("Bottom", (*level,))
+
+
+def make_functions(count: int) -> list[Callable[..., Any]]:
+    functions: list[Callable[..., Any]] = []
+    for i, cls in enumerate(make_classes(count, "Argument")):
+
+        def func(a: int, b: Any, c: Any = None, *args: Any, **kwargs: Any) -> Any: ...
+
+        func.__name__ = func.__qualname__ = f"func{i}"
+        func.__annotations__ = {
+            "a": int,
+            "b": Box[cls],
+            "c": list[Pair[str, cls]] | None,
+            "args": cls,
+            "kwargs": Any,
+            "return": cls,
+        }
+        functions.append(func)
+    return functions
+
+
+def _cold(func: Callable[[], object]) -> Callable[[], None]:
+    def run() -> None:
+        clear_cache()
+        gc.collect()
+        func()
+
+    return run
+
+
+def _registry(wraps: list[TWrap[Any]]) -> TypeBag:
+    bag = TypeBag()
+    for twrap in wraps:
+        bag.add(twrap)
+    return bag
+
+
+def main() -> None:
+    deepest = make_hierarchy(HIERARCHY_DEPTH)[-1][int]
+    report(
+        f"deep generic hierarchy ({HIERARCHY_DEPTH}), attribute_hints",
+        measure(_cold(lambda: wrap_type(deepest).attribute_hints), repeat=3),
+    )
+
+    members = make_classes(UNION_WIDTH, "Member")
+    union = wrap_type(members[0] | members[1] | Box[members[2]] | None)
+    for cls in members[3:]:
+        union = wrap_type(union.origin | cls)
+    other = wrap_type(members[-1] | Box[Any])
+    report(
+        f"wide union ({UNION_WIDTH}), wrap_type",
+        measure(_cold(lambda: wrap_type(union.origin)), repeat=3),
+    )
+    report(
+        f"wide union ({UNION_WIDTH}), match",
+        measure(lambda: [union.match(other) for _ in range(MATCH_ROUNDS)]),
+        ops=MATCH_ROUNDS,
+    )
+
+    classes = make_classes(REGISTRY_SIZE, "Registered")
+    aliases: list[Any] = [*classes, *(Box[cls] for cls in classes)]
+    misses = [wrap_type(Box[cls | None]) for cls in classes[:REGISTRY_MISSES]]
+    wraps = [wrap_type(alias) for alias in aliases]
+    bag = _registry(wraps)
+    report(
+        f"registry ({REGISTRY_SIZE} classes), wrap_type",
+        measure(_cold(lambda: [wrap_type(alias) for alias in aliases]), repeat=3),
+        ops=len(aliases),
+    )
+    report(f"registry ({REGISTRY_SIZE} classes), TypeBag.add", measure(lambda: _registry(wraps)), ops=len(wraps))
+    report(
+        f"registry ({REGISTRY_SIZE} classes), get_matching hit",
+        measure(lambda: [bag.get_matching(twrap) for twrap in wraps]),
+        ops=len(wraps),
+    )
+    report(
+        f"registry ({REGISTRY_SIZE} classes), get_matching miss",
+        measure(lambda: [bag.get_matching(twrap) for twrap in misses], repeat=3),
+        ops=REGISTRY_MISSES,
+    )
+
+    bottom = make_diamonds(DIAMOND_DEPTH)
+    report(
+        f"diamond inheritance ({DIAMOND_DEPTH}), attribute_hints",
+        measure(_cold(lambda: wrap_type(bottom).attribute_hints)),
+    )
+    report(
+        f"diamond inheritance ({DIAMOND_DEPTH}), TypeSuperTree.add",
+        measure(_cold(lambda: TypeSuperTree().add(wrap_type(bottom))), repeat=3),
+    )
+
+    functions = make_functions(FUNCTION_COUNT)
+    report(
+        f"{FUNCTION_COUNT} functions, get_signature_hints",
+        measure(_cold(lambda: [wrap_func(func).get_signature_hints() for func in functions]), repeat=3),
+        ops=FUNCTION_COUNT,
+    )
+
+
+if __name__ == "__main__":
+    main()
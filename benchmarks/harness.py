@@ -0,0 +1,18 @@
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+RESULTS: dict[str, dict[str, Any]] = {}
+
+
+def measure(func: Callable[[], object], *, number: int = 1, repeat: int = 5) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def record(name: str, value: float, unit: str) -> None:
+    RESULTS[name] = {"value": value, "unit": unit}
+
+
+def report(name: str, seconds: float, *, ops: int = 1) -> None:
+    record(name, seconds / ops, "s/op")
+    print(f"{name:<48} {seconds * 1e3:>10.3f} ms  {ops / seconds:>14,.0f} ops/s")
@@ -0,0 +1,33 @@
+from collections.abc import Mapping
+from typing import Any
+
+
+class Box[T]:
+    value: T
+
+
+class Pair[K, V]:
+    key: K
+    value: V
+
+
+def make_classes(count: int, prefix: str = "Model") -> list[type[Any]]:
+    return [type(f"{prefix}{i}", (), {"__annotations__": {"id": int, "name": str}}) for i in range(count)]
+
+
+def make_models(count: int, prefix: str = "Entity") -> list[type[Any]]:
+    models: list[type[Any]] = []
+    for i in range(count):
+        other = models[i - 1] if models else int
+        annotations: dict[str, Any] = {
+            "id": int,
+            "name": str | None,
+            "tags": list[str],
+            "parent": other | None,
+            "children": list[other],
+            "index": dict[str, list[Mapping[str, tuple[other, ...]]]],
+            "pairs": list[Pair[str, Box[other]]],
+            "extra": dict[str, Any] | None,
+        }
+        models.append(type(f"{prefix}{i}", (), {"__annotations__": annotations}))
+    return models
@@ -1,4 +1,24 @@
+from peritype import stats as stats
+from peritype import persist as persist
+from peritype import forward as forward
 from peritype.twrap import TWrap as TWrap
 from peritype.fwrap import FWrap as FWrap
-from peritype.wrap import wrap_type as wrap_type, wrap_func as wrap_func
-from peritype.utils import use_cache as use_cache
+from peritype.wrap import (
+    wrap_type as wrap_type,
+    wrap_func as wrap_func,
+    wrap_types as wrap_types,
+    wrap_funcs as wrap_funcs,
+    use_lazy_params as use_lazy_params,
+    configure_cache as configure_cache,
+    configure_match_cache as configure_match_cache,
+    pin_type as pin_type,
+    unpin_type as unpin_type,
+    evict_type as evict_type,
+    clear_cache as clear_cache,
+    clear_match_cache as clear_match_cache,
+)
+from peritype.warm import (
+    warmup as warmup,
+    warmup_async as warmup_async,
+    WarmupReport as WarmupReport,
+)
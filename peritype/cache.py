@@ -0,0 +1,275 @@
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from peritype import stats
+
+
+class CacheEntry[V]:
+    __slots__ = ("used", "value")
+
+    def __init__(self, value: V) -> None:
+        self.value = value
+        self.used = False
+
+
+class WrapCache[K: Hashable, V]:
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 0:
+            raise ValueError("Cache size cannot be negative")
+        self.enabled = True
+        self._maxsize = maxsize
+        self._weak: dict[K, weakref.KeyedRef[K, V]] = {}
+        self._strong = OrderedDict[K, CacheEntry[V]]()
+        self.strong_entry = self._strong.get
+        self._pinned: dict[K, V] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._listeners: list[Callable[[V], None]] = []
+        self._lock = threading.RLock()
+
+    def on_evict(self, listener: Callable[[V], None]) -> None:
+        self._listeners.append(listener)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("Cache size cannot be negative")
+        with self._lock:
+            self._maxsize = maxsize
+            self._trim()
+
+    def __len__(self) -> int:
+        return len(self._weak)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._weak
+
+    def get(self, key: K) -> V | None:
+        if not self.enabled:
+            return None
+        entry = self._strong.get(key)
+        if entry is not None:
+            entry.used = True
+            value = entry.value
+        elif (value := self._lookup(key)) is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        elif self._maxsize and key not in self._pinned:
+            with self._lock:
+                self._touch(key, value)
+        if stats.ENABLED:
+            with self._lock:
+                self.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._store(key, value)
+            if key in self._pinned:
+                self._pinned[key] = value
+            else:
+                self._touch(key, value)
+
+    def pin(self, key: K, value: V) -> None:
+        with self._lock:
+            self._store(key, value)
+            self._strong.pop(key, None)
+            self._pinned[key] = value
+
+    def unpin(self, key: K) -> None:
+        with self._lock:
+            if key not in self._pinned:
+                return
+            value = self._pinned.pop(key)
+            self._touch(key, value)
+
+    def is_pinned(self, key: K) -> bool:
+        return key in self._pinned
+
+    def evict(self, key: K) -> bool:
+        with self._lock:
+            ref = self._weak.pop(key, None)
+            value = None if ref is None else ref()
+            self._strong.pop(key, None)
+            self._pinned.pop(key, None)
+            if value is None:
+                return False
+            self.evictions += 1
+            self._notify(value)
+            return True
+
+    def peek(self, key: K) -> V | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._lookup(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            values = [value for ref in self._weak.values() if (value := ref()) is not None]
+            self._weak.clear()
+            for value in values:
+                self._notify(value)
+            self._strong.clear()
+            self._pinned.clear()
+
+    def _touch(self, key: K, value: V) -> None:
+        if not self._maxsize:
+            return
+        entry = self._strong.get(key)
+        if entry is None:
+            self._strong[key] = CacheEntry(value)
+        else:
+            entry.value = value
+            self._strong.move_to_end(key)
+        self._trim()
+
+    def _trim(self) -> None:
+        while len(self._strong) > self._maxsize:
+            key, entry = self._strong.popitem(last=False)
+            if entry.used:
+                entry.used = False
+                self._strong[key] = entry
+
+    def _lookup(self, key: K) -> V | None:
+        ref = self._weak.get(key)
+        return None if ref is None else ref()
+
+    def _store(self, key: K, value: V) -> None:
+        ref = self._weak.get(key)
+        if ref is None or ref() is not value:
+            self._weak[key] = weakref.KeyedRef(value, self._expire, key)
+
+    def _expire(self, ref: weakref.KeyedRef[K, V]) -> None:
+        with self._lock:
+            if self._weak.get(ref.key) is ref:
+                del self._weak[ref.key]
+                self.evictions += 1
+
+    def _notify(self, value: V) -> None:
+        for listener in self._listeners:
+            listener(value)
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self) -> dict[str, Any]:
+        with self._lock:
+            values = [value for ref in self._weak.values() if (value := ref()) is not None]
+            info: dict[str, Any] = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(values),
+                "strong_entries": len(self._strong),
+                "pinned_entries": len(self._pinned),
+                "maxsize": self._maxsize,
+            }
+        info["approx_bytes"] = sum(stats.approx_size(v) for v in values)
+        return info
+
+
+class MatchCache[V]:
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 0:
+            raise ValueError("Cache size cannot be negative")
+        self.enabled = False
+        self._maxsize = maxsize
+        self._results = OrderedDict[tuple[int, int], tuple[V, V, bool]]()
+        self._keys_by_id: dict[int, set[tuple[int, int]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("Cache size cannot be negative")
+        with self._lock:
+            self._maxsize = maxsize
+            self._trim()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, a: V, b: V) -> bool | None:
+        key = (id(a), id(b))
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._results.move_to_end(key)
+            return entry[2]
+
+    def set(self, a: V, b: V, result: bool) -> None:
+        if not self._maxsize:
+            return
+        key = (id(a), id(b))
+        with self._lock:
+            if key not in self._results:
+                self._keys_by_id.setdefault(key[0], set()).add(key)
+                self._keys_by_id.setdefault(key[1], set()).add(key)
+            self._results[key] = (a, b, result)
+            self._trim()
+
+    def discard(self, value: V) -> None:
+        with self._lock:
+            for key in self._keys_by_id.pop(id(value), ()):
+                if self._results.pop(key, None) is not None:
+                    self.evictions += 1
+                    self._unindex(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self._keys_by_id.clear()
+
+    def _trim(self) -> None:
+        while len(self._results) > self._maxsize:
+            key, _ = self._results.popitem(last=False)
+            self.evictions += 1
+            self._unindex(key)
+
+    def _unindex(self, key: tuple[int, int]) -> None:
+        for part in key:
+            keys = self._keys_by_id.get(part)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_id[part]
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._results),
+                "maxsize": self._maxsize,
+                "enabled": self.enabled,
+            }
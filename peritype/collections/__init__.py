@@ -1,3 +1,10 @@
 from peritype.collections.bag import TypeBag as TypeBag
 from peritype.collections.map import TypeMap as TypeMap, TypeSetMap as TypeSetMap
 from peritype.collections.tree import TypeSuperTree as TypeSuperTree
+from peritype.collections.frozen import (
+    FreezeReport as FreezeReport,
+    FrozenTypeBag as FrozenTypeBag,
+    FrozenTypeMap as FrozenTypeMap,
+    FrozenTypeSetMap as FrozenTypeSetMap,
+    FrozenTypeSuperTree as FrozenTypeSuperTree,
+)
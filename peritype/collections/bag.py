@@ -1,52 +1,158 @@
+from collections.abc import Iterator
 from typing import Any
 
 from peritype import TWrap
+from peritype.collections.frozen import FrozenTypeBag, footprint
+from peritype.collections.index import TypeIndex
+
+_MISSING: Any = object()
+_MAX_DEPTH = 16
 
 
 class TypeBag:
     def __init__(self) -> None:
         self._bag = set[TWrap[Any]]()
-        self._raw_types = dict[type[Any], set[TWrap[Any]]]()
+        self._index = TypeIndex()
+        self._removed = set[TWrap[Any]]()
+        self._parent: TypeBag | None = None
+        self._snapshot: TypeBag | None = None
+        self._depth = 0
+        self._matching: dict[TWrap[Any], TWrap[Any] | None] = {}
+        self._all: dict[TWrap[Any], frozenset[TWrap[Any]]] = {}
+        self._queries: dict[int, set[TWrap[Any]]] = {}
 
     def add(self, twrap: TWrap[Any]) -> None:
-        self._bag.add(twrap)
-        for node in twrap.nodes:
-            raw_type = node.inner_type
-            if raw_type not in self._raw_types:
-                self._raw_types[raw_type] = set()
-            self._raw_types[raw_type].add(twrap)
+        if twrap in self:
+            return
+        self._detach()
+        if twrap in self._removed:
+            self._removed.remove(twrap)
+        else:
+            self._bag.add(twrap)
+            self._index.add(twrap)
+        self._invalidate(twrap)
+
+    def remove(self, twrap: TWrap[Any]) -> None:
+        if twrap not in self:
+            raise KeyError(twrap)
+        self.discard(twrap)
+
+    def discard(self, twrap: TWrap[Any]) -> None:
+        if twrap not in self:
+            return
+        self._detach()
+        if twrap in self._bag:
+            self._bag.remove(twrap)
+            self._index.remove(twrap)
+        else:
+            self._removed.add(twrap)
+        self._invalidate(twrap)
 
     def __contains__(self, twrap: TWrap[Any]) -> bool:
-        return twrap in self._bag
+        if twrap in self._bag:
+            return True
+        return self._parent is not None and twrap not in self._removed and twrap in self._parent
 
     def get_matching(self, twrap: TWrap[Any]) -> TWrap[Any] | None:
-        if twrap in self._bag:
+        if twrap in self:
             return twrap
-        for node in twrap.nodes:
-            raw_type = node.inner_type
-            if raw_type in self._raw_types:
-                for wrap in self._raw_types[raw_type]:
-                    if twrap.match(wrap):
-                        return wrap
-        return None
+        result = self._matching.get(twrap, _MISSING)
+        if result is _MISSING:
+            result = self._matching[twrap] = self._find(twrap)
+            self._track(twrap)
+        return result
 
     def contains_matching(self, twrap: TWrap[Any]) -> bool:
         return self.get_matching(twrap) is not None
 
     def get_all(self, twrap: TWrap[Any]) -> set[TWrap[Any]]:
         if not twrap.contains_any:
-            return {twrap} if twrap in self._bag else set()
-        result = set[TWrap[Any]]()
-        for node in twrap.nodes:
-            raw_type = node.inner_type
-            if raw_type in self._raw_types:
-                for wrap in self._raw_types[raw_type]:
-                    if twrap.match(wrap):
-                        result.add(wrap)
-        return result
+            return {twrap} if twrap in self else set()
+        result = self._all.get(twrap)
+        if result is None:
+            result = frozenset(self._index.search(twrap))
+            if self._parent is not None:
+                result |= self._parent.get_all(twrap) - self._removed
+            self._all[twrap] = result
+            self._track(twrap)
+        return set(result)
 
     def copy(self) -> "TypeBag":
         new_bag = TypeBag()
-        new_bag._bag = self._bag.copy()
-        new_bag._raw_types = {k: v.copy() for k, v in self._raw_types.items()}
+        new_bag._parent = parent = self._share()
+        new_bag._depth = parent._depth + 1
         return new_bag
+
+    def freeze(self) -> FrozenTypeBag:
+        entries = [*self._entries()]
+        index = TypeIndex()
+        for twrap in entries:
+            index.add(twrap)
+        matching = self._matching | {twrap: twrap for twrap in entries}
+        all_matching = {query: tuple(result) for query, result in self._all.items()}
+        for twrap in entries:
+            if twrap.contains_any:
+                all_matching[twrap] = tuple(set(index.search(twrap)))
+        index.compact()
+        return FrozenTypeBag(matching, all_matching, index, footprint(self))
+
+    def _find(self, twrap: TWrap[Any]) -> TWrap[Any] | None:
+        if (found := next(self._index.search(twrap), None)) is not None or self._parent is None:
+            return found
+        found = self._parent.get_matching(twrap)
+        if found is None or found not in self._removed:
+            return found
+        return next((match for match in self._parent._search(twrap) if match not in self._removed), None)
+
+    def _search(self, twrap: TWrap[Any]) -> Iterator[TWrap[Any]]:
+        yield from self._index.search(twrap)
+        if self._parent is not None:
+            for match in self._parent._search(twrap):
+                if match not in self._removed:
+                    yield match
+
+    def _entries(self) -> Iterator[TWrap[Any]]:
+        yield from self._bag
+        if self._parent is not None:
+            for twrap in self._parent._entries():
+                if twrap not in self._removed:
+                    yield twrap
+
+    def _share(self) -> "TypeBag":
+        if self._snapshot is not None:
+            return self._snapshot
+        if self._parent is not None and not self._bag and not self._removed:
+            return self._parent
+        layer = TypeBag()
+        if self._depth >= _MAX_DEPTH:
+            for twrap in self._entries():
+                layer._bag.add(twrap)
+                layer._index.add(twrap)
+        else:
+            layer._bag, layer._index, layer._removed, layer._parent = (
+                self._bag,
+                self._index,
+                self._removed,
+                self._parent,
+            )
+            layer._matching, layer._all, layer._queries = self._matching, self._all, self._queries
+            layer._depth = self._depth
+        self._snapshot = layer
+        return layer
+
+    def _detach(self) -> None:
+        if (layer := self._snapshot) is not None:
+            self._bag, self._index, self._removed, self._parent = set(), TypeIndex(), set(), layer
+            self._matching, self._all, self._queries = {}, {}, {}
+            self._depth = layer._depth + 1
+            self._snapshot = None
+
+    def _track(self, query: TWrap[Any]) -> None:
+        for node in query.nodes:
+            self._queries.setdefault(id(node.inner_type), set()).add(query)
+
+    def _invalidate(self, twrap: TWrap[Any]) -> None:
+        for node in twrap.nodes:
+            for query in self._queries.pop(id(node.inner_type), ()):
+                self._matching.pop(query, None)
+                self._all.pop(query, None)
@@ -0,0 +1,151 @@
+import sys
+from collections.abc import Iterator
+from typing import Any, overload
+
+from peritype.collections.index import TypeIndex
+from peritype.twrap import TWrap
+
+_MISSING: Any = object()
+
+
+class FreezeReport:
+    def __init__(self, entries: int, before: int, after: int) -> None:
+        self.entries = entries
+        self.before = before
+        self.after = after
+
+    @property
+    def saved(self) -> int:
+        return self.before - self.after
+
+    def __repr__(self) -> str:
+        return f"<FreezeReport {self.entries} entries, {self.before} -> {self.after} bytes, {self.saved} saved>"
+
+
+class FrozenTypeMap[K, V]:
+    __slots__ = ("_content", "report")
+
+    def __init__(self, content: dict[TWrap[K], V], before: int) -> None:
+        self._content = content
+        self.report = FreezeReport(len(content), before, footprint(self))
+
+    def __contains__(self, twrap: TWrap[Any], /) -> bool:
+        return twrap in self._content
+
+    def __getitem__(self, twrap: TWrap[K], /) -> V:
+        return self._content[twrap]
+
+    def __len__(self) -> int:
+        return len(self._content)
+
+    def __iter__(self) -> Iterator[tuple[TWrap[K], V]]:
+        yield from self._content.items()
+
+    @overload
+    def get[D](self, twrap: TWrap[K], /, *, default: D) -> V | D: ...
+    @overload
+    def get(
+        self,
+        twrap: TWrap[K],
+        /,
+    ) -> V | None: ...
+    def get(
+        self,
+        twrap: TWrap[K],
+        /,
+        *,
+        default: Any = None,
+    ) -> Any:
+        return self._content.get(twrap, default)
+
+    def freeze(self) -> "FrozenTypeMap[K, V]":
+        return self
+
+
+class FrozenTypeSetMap[K, V](FrozenTypeMap[K, tuple[V, ...]]):
+    __slots__ = ()
+
+    def count(self, twrap: TWrap[K], /) -> int:
+        return len(self._content.get(twrap, ()))
+
+    def freeze(self) -> "FrozenTypeSetMap[K, V]":
+        return self
+
+
+class FrozenTypeBag:
+    __slots__ = ("_all", "_index", "_matching", "report")
+
+    def __init__(
+        self,
+        matching: dict[TWrap[Any], TWrap[Any] | None],
+        all_matching: dict[TWrap[Any], tuple[TWrap[Any], ...]],
+        index: TypeIndex,
+        before: int,
+    ) -> None:
+        self._matching = matching
+        self._all = all_matching
+        self._index = index
+        self.report = FreezeReport(sum(key is value for key, value in matching.items()), before, footprint(self))
+
+    def __contains__(self, twrap: TWrap[Any]) -> bool:
+        return self._matching.get(twrap) == twrap
+
+    def get_matching(self, twrap: TWrap[Any]) -> TWrap[Any] | None:
+        result = self._matching.get(twrap, _MISSING)
+        if result is _MISSING:
+            return next(self._index.search(twrap), None)
+        return result
+
+    def contains_matching(self, twrap: TWrap[Any]) -> bool:
+        return self.get_matching(twrap) is not None
+
+    def get_all(self, twrap: TWrap[Any]) -> set[TWrap[Any]]:
+        if not twrap.contains_any:
+            return {twrap} if twrap in self else set()
+        result = self._all.get(twrap)
+        if result is None:
+            return set(self._index.search(twrap))
+        return {*result}
+
+    def freeze(self) -> "FrozenTypeBag":
+        return self
+
+
+class FrozenTypeSuperTree:
+    __slots__ = ("_content", "report")
+
+    def __init__(self, content: dict[TWrap[Any], tuple[TWrap[Any], ...]], before: int) -> None:
+        self._content = content
+        self.report = FreezeReport(len(content), before, footprint(self))
+
+    def __contains__(self, twrap: TWrap[Any]) -> bool:
+        return twrap in self._content
+
+    def __getitem__(self, twrap: TWrap[Any]) -> tuple[TWrap[Any], ...]:
+        return self._content[twrap]
+
+    def freeze(self) -> "FrozenTypeSuperTree":
+        return self
+
+
+def footprint(obj: object) -> int:
+    seen = set[int]()
+    pending = [obj]
+    size = 0
+    while pending:
+        item = pending.pop()
+        if isinstance(item, TWrap) or id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, list | tuple | set | frozenset):
+            pending.extend(item)
+        elif type(item).__module__.startswith("peritype.collections"):
+            if hasattr(item, "__dict__"):
+                pending.append(vars(item))
+            for cls in type(item).__mro__:
+                pending.extend(getattr(item, name, None) for name in cls.__dict__.get("__slots__", ()))
+    return size
@@ -0,0 +1,175 @@
+from collections.abc import Hashable, Iterator
+from typing import Any
+
+from peritype.twrap import TWrap, TypeNode
+
+type _Path = tuple[tuple[Hashable, int], ...]
+type _Bucket = set[TWrap[Any]] | tuple[TWrap[Any], ...]
+
+_WILDCARD = object()
+_MAX_PATHS = 64
+
+
+class _Branch:
+    __slots__ = ("arity", "children", "entries")
+
+    def __init__(self, arity: int) -> None:
+        self.arity = arity
+        self.children: dict[Hashable, _Branch] = {}
+        self.entries: _Bucket = ()
+
+
+class TypeIndex:
+    def __init__(self) -> None:
+        self._roots: dict[Hashable, _Branch] = {}
+        self._unindexed: dict[Hashable, _Bucket] = {}
+        self._raw_types: dict[int, _Bucket] = {}
+        self._wildcards: dict[int, _Bucket] = {}
+
+    def add(self, twrap: TWrap[Any]) -> None:
+        wildcard = _is_wildcard(twrap)
+        for node in twrap.nodes:
+            _insert(self._raw_types, id(node.inner_type), twrap)
+            if wildcard:
+                _insert(self._wildcards, id(node.inner_type), twrap)
+                continue
+            paths = _params_paths(node.generic_params)
+            if paths is None:
+                _insert(self._unindexed, _symbol(node), twrap)
+                continue
+            root = self._roots.setdefault(_symbol(node), _Branch(0))
+            for path in paths:
+                branch = root
+                for symbol, arity in path:
+                    if (child := branch.children.get(symbol)) is None:
+                        child = branch.children[symbol] = _Branch(arity)
+                    branch = child
+                branch.entries = entries = _mutable(branch.entries)
+                entries.add(twrap)
+
+    def remove(self, twrap: TWrap[Any]) -> None:
+        wildcard = _is_wildcard(twrap)
+        for node in twrap.nodes:
+            _discard(self._raw_types, id(node.inner_type), twrap)
+            if wildcard:
+                _discard(self._wildcards, id(node.inner_type), twrap)
+                continue
+            symbol = _symbol(node)
+            paths = _params_paths(node.generic_params)
+            if paths is None:
+                _discard(self._unindexed, symbol, twrap)
+                continue
+            if (root := self._roots.get(symbol)) is None:
+                continue
+            for path in paths:
+                trail = [root]
+                for step, _ in path:
+                    if (child := trail[-1].children.get(step)) is None:
+                        break
+                    trail.append(child)
+                else:
+                    trail[-1].entries = entries = _mutable(trail[-1].entries)
+                    entries.discard(twrap)
+                    for (step, _), parent, branch in reversed([*zip(path, trail[:-1], trail[1:], strict=True)]):
+                        if branch.entries or branch.children:
+                            break
+                        del parent.children[step]
+            if not root.entries and not root.children:
+                del self._roots[symbol]
+
+    def compact(self) -> None:
+        _compact(self._unindexed)
+        _compact(self._raw_types)
+        _compact(self._wildcards)
+        pending = [*self._roots.values()]
+        while pending:
+            branch = pending.pop()
+            branch.entries = tuple(branch.entries)
+            pending.extend(branch.children.values())
+
+    def search(self, twrap: TWrap[Any]) -> Iterator[TWrap[Any]]:
+        if _is_wildcard(twrap):
+            for node in twrap.nodes:
+                yield from self._raw_types.get(id(node.inner_type), ())
+            return
+        for node in twrap.nodes:
+            symbol = _symbol(node)
+            if (root := self._roots.get(symbol)) is not None:
+                for branch in _search(root, node.generic_params):
+                    yield from branch.entries
+            yield from self._wildcards.get(id(node.inner_type), ())
+            for candidate in self._unindexed.get(symbol, ()):
+                if twrap.match(candidate):
+                    yield candidate
+
+
+def _mutable(bucket: _Bucket) -> set[TWrap[Any]]:
+    return bucket if isinstance(bucket, set) else set(bucket)
+
+
+def _insert[K](buckets: dict[K, _Bucket], key: K, twrap: TWrap[Any]) -> None:
+    bucket = buckets[key] = _mutable(buckets.get(key, ()))
+    bucket.add(twrap)
+
+
+def _compact[K](buckets: dict[K, _Bucket]) -> None:
+    for key, bucket in buckets.items():
+        buckets[key] = tuple(bucket)
+
+
+def _discard[K](buckets: dict[K, _Bucket], key: K, twrap: TWrap[Any]) -> None:
+    if (bucket := buckets.get(key)) is not None:
+        bucket = buckets[key] = _mutable(bucket)
+        bucket.discard(twrap)
+        if not bucket:
+            del buckets[key]
+
+
+def _symbol(node: TypeNode[Any]) -> Hashable:
+    return (id(node.inner_type), len(node.origin_params))
+
+
+def _is_wildcard(twrap: TWrap[Any]) -> bool:
+    return any(node.origin is Any or node.origin is Ellipsis for node in twrap.nodes)
+
+
+def _params_paths(params: tuple[TWrap[Any], ...]) -> list[_Path] | None:
+    paths: list[_Path] = [()]
+    for param in params:
+        if _is_wildcard(param):
+            paths = [(*path, (_WILDCARD, 0)) for path in paths]
+            continue
+        alternatives: list[_Path] = []
+        for node in param.nodes:
+            if (sub_paths := _params_paths(node.generic_params)) is None:
+                return None
+            step = (_symbol(node), len(node.origin_params))
+            alternatives += [(step, *sub_path) for sub_path in sub_paths]
+        if len(paths) * len(alternatives) > _MAX_PATHS:
+            return None
+        paths = [(*path, *alternative) for path in paths for alternative in alternatives]
+    return paths
+
+
+def _search(branch: _Branch, pending: tuple[TWrap[Any], ...]) -> Iterator[_Branch]:
+    if not pending:
+        yield branch
+        return
+    param, rest = pending[0], pending[1:]
+    if _is_wildcard(param):
+        for skipped in _skip(branch, 1):
+            yield from _search(skipped, rest)
+        return
+    if (wildcard := branch.children.get(_WILDCARD)) is not None:
+        yield from _search(wildcard, rest)
+    for node in param.nodes:
+        if (child := branch.children.get(_symbol(node))) is not None:
+            yield from _search(child, (*node.generic_params, *rest))
+
+
+def _skip(branch: _Branch, count: int) -> Iterator[_Branch]:
+    if not count:
+        yield branch
+        return
+    for child in branch.children.values():
+        yield from _skip(child, count - 1 + child.arity)
@@ -1,30 +1,74 @@
 from collections.abc import Iterator
-from typing import Any, overload
+from typing import Any, Self, overload, override
 
+from peritype.collections.frozen import FrozenTypeMap, FrozenTypeSetMap, footprint
 from peritype.twrap import TWrap
 
+_MISSING: Any = object()
+_MAX_DEPTH = 16
+
 
 class TypeMap[K, V]:
     def __init__(self) -> None:
         self._content: dict[TWrap[K], V] = {}
+        self._removed = set[TWrap[K]]()
+        self._parent: TypeMap[K, V] | None = None
+        self._snapshot: TypeMap[K, V] | None = None
+        self._size = 0
+        self._depth = 0
 
     def __contains__(self, twrap: TWrap[Any], /) -> bool:
-        return twrap in self._content
+        if twrap in self._content:
+            return True
+        return self._parent is not None and self._lookup(twrap) is not _MISSING
 
     def __getitem__(self, twrap: TWrap[K], /) -> V:
-        return self._content[twrap]
+        if self._snapshot is None:
+            try:
+                return self._content[twrap]
+            except KeyError:
+                if self._parent is None:
+                    raise
+        value = self._lookup(twrap)
+        if value is _MISSING:
+            raise KeyError(twrap)
+        return value
 
     def __setitem__(self, twrap: TWrap[K], value: V, /) -> None:
+        self._detach()
+        if twrap not in self._content and (self._parent is None or self._lookup(twrap) is _MISSING):
+            self._size += 1
         self._content[twrap] = value
+        self._removed.discard(twrap)
 
     def __delitem__(self, twrap: TWrap[K], /) -> None:
-        del self._content[twrap]
+        self._detach()
+        if self._parent is None:
+            del self._content[twrap]
+        else:
+            if self._lookup(twrap) is _MISSING:
+                raise KeyError(twrap)
+            self._content.pop(twrap, None)
+            if self._parent._lookup(twrap) is not _MISSING:
+                self._removed.add(twrap)
+        self._size -= 1
 
     def __len__(self) -> int:
-        return len(self._content)
+        return self._size
 
     def __iter__(self) -> Iterator[tuple[TWrap[K], V]]:
-        yield from self._content.items()
+        if self._parent is None and self._snapshot is None:
+            yield from self._content.items()
+            return
+        seen = set[TWrap[K]]()
+        layer: TypeMap[K, V] | None = self
+        while layer is not None:
+            for twrap, value in layer._content.items():
+                if twrap not in seen:
+                    seen.add(twrap)
+                    yield twrap, value
+            seen |= layer._removed
+            layer = layer._parent
 
     @overload
     def get[D](self, twrap: TWrap[K], /, *, default: D) -> V | D: ...
@@ -41,24 +85,110 @@ class TypeMap[K, V]:
         *,
         default: Any = None,
     ) -> Any:
-        return self._content.get(twrap, default)
+        if self._snapshot is None:
+            value: Any = self._content.get(twrap, _MISSING)
+            if value is not _MISSING or self._parent is None:
+                return default if value is _MISSING else value
+        value = self._lookup(twrap)
+        return default if value is _MISSING else value
 
     def add(self, twrap: TWrap[K], value: V, /) -> None:
-        self._content[twrap] = value
+        self[twrap] = value
 
-    def copy(self) -> "TypeMap[K, V]":
-        new_map = TypeMap[K, V]()
-        new_map._content = self._content.copy()
+    def copy(self) -> Self:
+        new_map = type(self)()
+        new_map._parent = parent = self._share()
+        new_map._size = self._size
+        new_map._depth = parent._depth + 1
         return new_map
 
+    def freeze(self) -> FrozenTypeMap[K, V]:
+        return FrozenTypeMap(dict(self), footprint(self))
+
+    def _lookup(self, twrap: TWrap[Any]) -> Any:
+        layer: TypeMap[K, V] | None = self
+        while layer is not None:
+            value = layer._content.get(twrap, _MISSING)
+            if value is not _MISSING or twrap in layer._removed:
+                return value
+            layer = layer._parent
+        return _MISSING
+
+    def _share(self) -> "TypeMap[K, V]":
+        if self._snapshot is not None:
+            return self._snapshot
+        if self._parent is not None and not self._content and not self._removed:
+            return self._parent
+        layer = type(self)()
+        if self._depth >= _MAX_DEPTH:
+            layer._content = dict(self)
+        else:
+            layer._content, layer._removed, layer._parent = self._content, self._removed, self._parent
+            layer._depth = self._depth
+        layer._size = self._size
+        self._snapshot = layer
+        return layer
+
+    def _detach(self) -> None:
+        if (layer := self._snapshot) is not None:
+            self._content, self._removed, self._parent = {}, set(), layer
+            self._depth = layer._depth + 1
+            self._snapshot = None
+
 
 class TypeSetMap[K, V](TypeMap[K, set[V]]):
+    """Reads through indexing, `get` and iteration always return a new set, whether the map owns the values or
+    shares them with the map it was copied from. Use `push` and `discard` to change the stored values."""
+
+    @override
+    def __getitem__(self, twrap: TWrap[K], /) -> set[V]:
+        return set(super().__getitem__(twrap))
+
+    @override
+    def __iter__(self) -> Iterator[tuple[TWrap[K], set[V]]]:
+        for twrap, values in super().__iter__():
+            yield twrap, set(values)
+
+    @overload
+    def get[D](self, twrap: TWrap[K], /, *, default: D) -> set[V] | D: ...
+    @overload
+    def get(
+        self,
+        twrap: TWrap[K],
+        /,
+    ) -> set[V] | None: ...
+    @override
+    def get(
+        self,
+        twrap: TWrap[K],
+        /,
+        *,
+        default: Any = None,
+    ) -> Any:
+        values = super().get(twrap, default=_MISSING)
+        return default if values is _MISSING else set(values)
+
     def push(self, twrap: TWrap[K], value: V, /) -> None:
+        self._detach()
         if twrap not in self._content:
-            self._content[twrap] = set()
+            values = self._lookup(twrap)
+            self[twrap] = set() if values is _MISSING else set(values)
         self._content[twrap].add(value)
 
-    def count(self, twrap: TWrap[K], /) -> int:
+    def discard(self, twrap: TWrap[K], value: V, /) -> None:
+        values = self._lookup(twrap)
+        if values is _MISSING or value not in values:
+            return
+        self._detach()
         if twrap not in self._content:
-            return 0
-        return len(self._content[twrap])
+            self[twrap] = values = set(values)
+        values.discard(value)
+        if not values:
+            del self[twrap]
+
+    def count(self, twrap: TWrap[K], /) -> int:
+        values = self._lookup(twrap)
+        return 0 if values is _MISSING else len(values)
+
+    def freeze(self) -> FrozenTypeSetMap[K, V]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return FrozenTypeSetMap({twrap: tuple(values) for twrap, values in super().__iter__()}, footprint(self))
@@ -1,6 +1,7 @@
 from typing import Any, ForwardRef, Generic, get_origin
 
 from peritype.collections import TypeSetMap
+from peritype.collections.frozen import FrozenTypeSuperTree, footprint
 from peritype.wrap import TWrap
 
 
@@ -9,12 +10,17 @@ class TypeSuperTree:
         self._content = TypeSetMap[Any, TWrap[Any]]()
 
     def add(self, twrap: TWrap[Any]) -> None:
-        bases = set[TWrap[Any]]()
-        self._recurse_all_bases(twrap, bases)
-        for base in bases:
-            self._add_type(base, twrap)
-            if base is not twrap:
-                self.add(base)
+        closure: dict[TWrap[Any], set[TWrap[Any]]] = {}
+        self._all_bases(twrap, closure)
+        for derived, bases in closure.items():
+            for base in bases:
+                self._add_type(base, derived)
+
+    def remove(self, twrap: TWrap[Any]) -> None:
+        if twrap not in self._content.get(twrap, default=()):
+            raise KeyError(twrap)
+        for base in self._all_bases(twrap, {}):
+            self._content.discard(base, twrap)
 
     def __contains__(self, twrap: TWrap[Any]) -> bool:
         return twrap in self._content
@@ -25,23 +31,27 @@ class TypeSuperTree:
     def __delitem__(self, twrap: TWrap[Any]) -> None:
         del self._content[twrap]
 
+    def freeze(self) -> FrozenTypeSuperTree:
+        return FrozenTypeSuperTree({base: tuple(derived) for base, derived in self._content}, footprint(self))
+
     def _add_type(self, base: TWrap[Any], derived: TWrap[Any]) -> None:
         self._content.push(base, derived)
 
     @staticmethod
-    def _recurse_all_bases(
+    def _all_bases(
         twrap: TWrap[Any],
-        seen: set[TWrap[Any]],
-    ) -> None:
-        if twrap in seen:
-            return
-        seen.add(twrap)
+        closure: dict[TWrap[Any], set[TWrap[Any]]],
+    ) -> set[TWrap[Any]]:
+        if (bases := closure.get(twrap)) is not None:
+            return bases
+        bases = closure[twrap] = {twrap}
         for node in twrap.nodes:
             for base in node.bases:
                 origin = get_origin(base.origin)
                 if (origin or base.origin) in (object, Generic, ForwardRef):
                     continue
-                TypeSuperTree._recurse_all_bases(base, seen)
+                bases |= TypeSuperTree._all_bases(base, closure)
+        return bases
 
     def copy(self) -> "TypeSuperTree":
         new_tree = TypeSuperTree()
@@ -0,0 +1,34 @@
+import sys
+import types
+import typing
+from collections.abc import Mapping
+from typing import Any
+
+_PRIVATE = sys.version_info < (3, 15)
+_eval_type: Any = getattr(typing, "_eval_type", None) if _PRIVATE else None
+_type_check: Any = getattr(typing, "_type_check", None) if _PRIVATE else None
+
+
+def _holder() -> None: ...
+
+
+def eval_type(
+    value: Any,
+    globalns: dict[str, Any],
+    localns: Mapping[str, Any] | None,
+    type_params: tuple[Any, ...] = (),
+    *,
+    recursive_guard: frozenset[str] = frozenset(),
+) -> Any:
+    if _eval_type is not None:
+        return _eval_type(value, globalns, localns, type_params, recursive_guard=recursive_guard)
+    holder = types.FunctionType(_holder.__code__, globalns)
+    holder.__annotations__ = {"value": value}
+    holder.__type_params__ = type_params
+    return typing.get_type_hints(holder, globalns, localns, include_extras=True)["value"]
+
+
+def type_check(value: Any, message: str, *, is_argument: bool, allow_special_forms: bool) -> Any:
+    if _type_check is not None:
+        return _type_check(value, message, is_argument=is_argument, allow_special_forms=allow_special_forms)
+    return value
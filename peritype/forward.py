@@ -0,0 +1,125 @@
+import contextlib
+import threading
+from collections.abc import Iterator, Mapping
+from types import CodeType, ModuleType
+from typing import Any, ForwardRef
+
+from peritype import compat
+
+type _Key = tuple[str, bool, bool]
+type _Entry = tuple[Any, tuple[tuple[str, Any], ...]]
+
+_MISSING = object()
+_codes: dict[str, CodeType] = {}
+_resolved: dict[str, tuple[dict[str, Any], dict[_Key, _Entry]]] = {}
+_lock = threading.Lock()
+_tracking = threading.local()
+
+
+class _Recorder(Mapping[str, Any]):
+    __slots__ = ("names", "namespace")
+
+    def __init__(self, namespace: dict[str, Any]) -> None:
+        self.namespace = namespace
+        self.names: dict[str, Any] = {}
+
+    def __getitem__(self, key: str, /) -> Any:
+        value = self.names[key] = self.namespace.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.namespace)
+
+    def __len__(self) -> int:
+        return len(self.namespace)
+
+
+def evaluate(
+    value: str,
+    globalns: dict[str, Any],
+    namespace: dict[str, Any] | None,
+    type_params: tuple[Any, ...],
+    *,
+    is_argument: bool,
+    is_class: bool,
+) -> Any:
+    if type_params:
+        ref = ForwardRef(value, is_argument=is_argument, is_class=is_class)
+        if namespace is None:
+            return compat.eval_type(ref, globalns, globalns, type_params)
+        return compat.eval_type(ref, namespace, globalns, type_params)
+    key = (value, is_argument, is_class)
+    entries = _entries(globalns)
+    if (entry := entries.get(key)) is not None and _valid(entry[1], globalns, namespace):
+        _track(entry[1])
+        return entry[0]
+    scope = globalns if namespace is None else namespace
+    recorder = _Recorder(globalns)
+    hint = compat.type_check(
+        eval(_compile(value), scope, recorder),
+        "Forward references must evaluate to types.",
+        is_argument=is_argument,
+        allow_special_forms=is_class,
+    )
+    result = compat.eval_type(hint, scope, recorder, recursive_guard=frozenset((value,)))
+    deps = (*recorder.names.items(),)
+    if _valid(deps, globalns, namespace):
+        entries[key] = (result, deps)
+    _track(deps)
+    return result
+
+
+@contextlib.contextmanager
+def track() -> Iterator[list[tuple[str, Any]]]:
+    previous: list[tuple[str, Any]] | None = getattr(_tracking, "touched", None)
+    touched = _tracking.touched = []
+    try:
+        yield touched
+    finally:
+        _tracking.touched = previous
+
+
+def invalidate(module: str | ModuleType | None = None) -> None:
+    with _lock:
+        if module is None:
+            _resolved.clear()
+            _codes.clear()
+        else:
+            _resolved.pop(module if isinstance(module, str) else module.__name__, None)
+
+
+def _track(deps: tuple[tuple[str, Any], ...]) -> None:
+    touched: list[tuple[str, Any]] | None = getattr(_tracking, "touched", None)
+    if touched is not None:
+        touched.extend(dep for dep in deps if dep[1] is not _MISSING)
+
+
+def _compile(value: str) -> CodeType:
+    if (code := _codes.get(value)) is None:
+        try:
+            code = compile(f"({value},)[0]" if value.startswith("*") else value, "<string>", "eval")
+        except SyntaxError:
+            raise SyntaxError(f"Forward reference must be an expression -- got {value!r}") from None
+        with _lock:
+            code = _codes.setdefault(value, code)
+    return code
+
+
+def _entries(globalns: dict[str, Any]) -> dict[_Key, _Entry]:
+    name = globalns.get("__name__", "")
+    table = _resolved.get(name)
+    if table is None or table[0] is not globalns:
+        with _lock:
+            table = _resolved[name] = (globalns, {})
+    return table[1]
+
+
+def _valid(deps: tuple[tuple[str, Any], ...], globalns: dict[str, Any], namespace: dict[str, Any] | None) -> bool:
+    for name, value in deps:
+        if globalns.get(name, _MISSING) is not value:
+            return False
+        if value is _MISSING and namespace is not None and name in namespace:
+            return False
+    return True
@@ -1,8 +1,15 @@
+import contextlib
 import inspect
+import weakref
 from collections.abc import Callable
-from functools import cached_property
-from typing import TYPE_CHECKING, Any, get_type_hints, override
-
+from functools import partial
+from types import MethodType
+from typing import TYPE_CHECKING, Any, cast, override
+
+import peritype
+from peritype import persist
+from peritype.sync import locked_cached_property
+from peritype.template import substitute
 from peritype.twrap import TWrap
 
 if TYPE_CHECKING:
@@ -13,19 +20,58 @@ class FWrap[**FuncP, FuncT]:
     def __init__(self, func: Callable[FuncP, FuncT]) -> None:
         if isinstance(func, FWrap):
             raise TypeError(f"Cannot wrap {func}, already wrapped")
-        self.func = func
-        self.bound_to = getattr(self.func, "__self__", None)
+        self._func: Callable[..., Any] = func
+        self._self_ref: weakref.ref[Any] | None = None
+        if isinstance(func, MethodType):
+            with contextlib.suppress(TypeError):
+                self._self_ref = weakref.ref(func.__self__)
+                self._func = func.__func__
         self._signature_hints: dict[str, Any] | None = None
 
+    @property
+    def func(self) -> Callable[FuncP, FuncT]:
+        if self._self_ref is None:
+            return self._func
+        if (instance := self._self_ref()) is None:
+            raise ReferenceError(f"Instance bound to {self._func.__qualname__} no longer exists")
+        return MethodType(self._func, instance)
+
+    @property
+    def bound_to(self) -> Any:
+        if self._self_ref is not None:
+            return self._self_ref()
+        return getattr(self._func, "__self__", None)
+
     @property
     def name(self) -> str:
-        return self.func.__name__ if hasattr(self.func, "__name__") else str(self.func)
+        return self._func.__name__ if hasattr(self._func, "__name__") else str(self._func)
 
-    @cached_property
+    @locked_cached_property
     def signature(self) -> inspect.Signature:
-        return inspect.signature(self.func)
-
-    @cached_property
+        if isinstance(self._func, partial) or self._source is None:
+            return inspect.signature(self.func)
+        return self._source._method_signature
+
+    @locked_cached_property
+    def _method_signature(self) -> inspect.Signature:
+        signature = self.signature
+        params = [*signature.parameters.values()]
+        if params and params[0].kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
+            return signature.replace(parameters=params[1:])
+        return signature
+
+    @locked_cached_property
+    def _source(self) -> "FWrap[..., Any] | None":
+        func = self._func
+        if self._self_ref is not None:
+            return peritype.wrap_func(func)
+        if isinstance(func, MethodType):
+            return peritype.wrap_func(func.__func__)
+        if isinstance(func, partial):
+            return peritype.wrap_func(cast(partial[Any], func).func)
+        return None
+
+    @locked_cached_property
     def parameters(self) -> dict[str, inspect.Parameter]:
         return {**self.signature.parameters}
 
@@ -33,12 +79,22 @@ class FWrap[**FuncP, FuncT]:
         all_params = [*self.parameters.values()]
         return all_params[index]
 
+    @locked_cached_property
+    def _type_hints(self) -> dict[str, Any]:
+        if (source := self._source) is None:
+            return persist.get_type_hints(self.func)
+        if isinstance(self._func, partial):
+            return {n: c for n, c in source._type_hints.items() if n in self.parameters or n == "return"}
+        return source._type_hints
+
     def get_signature_hints(self, belongs_to: "TWrap[Any] | None" = None) -> "dict[str, TWrap[Any]]":
+        if belongs_to is not None:
+            return belongs_to.bind_method(self).get_signature_hints()
         if self._signature_hints is None:
-            self._signature_hints = {
-                n: self._transform_annotation(c, belongs_to.type_var_lookup if belongs_to else None)
-                for n, c in get_type_hints(self.func, include_extras=True).items()
-            }
+            if (source := self._source) is not None and not isinstance(self._func, partial):
+                self._signature_hints = source.get_signature_hints()
+            else:
+                self._signature_hints = {n: self._transform_annotation(c, None) for n, c in self._type_hints.items()}
         return self._signature_hints
 
     def get_signature_hint(self, index: int, belongs_to: "TWrap[Any] | None" = None) -> "TWrap[Any]":
@@ -54,13 +110,13 @@ class FWrap[**FuncP, FuncT]:
     def _transform_annotation(anno: Any, lookup: "TypeVarLookup | None") -> Any:
         from peritype import wrap_type
 
-        if lookup is not None and anno in lookup:
-            return wrap_type(lookup[anno], lookup=lookup)
-        return wrap_type(anno, lookup=lookup)
+        if lookup is None:
+            return wrap_type(anno)
+        return wrap_type(substitute(anno, lookup.origin_mapping))
 
     @override
     def __str__(self) -> str:
-        return f"{self.func.__qualname__}"
+        return f"{self._func.__qualname__}"
 
     @override
     def __repr__(self) -> str:
@@ -68,20 +124,36 @@ class FWrap[**FuncP, FuncT]:
 
     @override
     def __hash__(self) -> int:
-        return hash(self.func)
+        return hash(self._func)
 
     def bind(self, belongs_to: "TWrap[Any]") -> "BoundFWrap[FuncP, FuncT]":
-        return BoundFWrap(self.func, belongs_to)
+        return belongs_to.bind_method(self)
 
 
 class BoundFWrap[**FuncP, FuncT](FWrap[FuncP, FuncT]):
-    def __init__(self, func: Callable[FuncP, FuncT], belongs_to: "TWrap[Any]") -> None:
+    def __init__(
+        self,
+        func: Callable[FuncP, FuncT],
+        belongs_to: "TWrap[Any]",
+        unbound: "FWrap[FuncP, FuncT] | None" = None,
+    ) -> None:
         super().__init__(func)
         self._belongs_to = belongs_to
+        self._unbound = unbound if unbound is not None else peritype.wrap_func(func)
 
     @override
     def get_signature_hints(self, belongs_to: "TWrap[Any] | None" = None) -> "dict[str, TWrap[Any]]":
-        return super().get_signature_hints(belongs_to=belongs_to or self._belongs_to)
+        if belongs_to is not None and belongs_to is not self._belongs_to:
+            return self._unbound.get_signature_hints(belongs_to)
+        if self._signature_hints is None:
+            lookup = self._belongs_to.type_var_lookup
+            if lookup.origin_mapping:
+                self._signature_hints = {
+                    n: self._transform_annotation(c, lookup) for n, c in self._unbound._type_hints.items()
+                }
+            else:
+                self._signature_hints = self._unbound.get_signature_hints()
+        return self._signature_hints
 
     @override
     def get_signature_hint(self, index: int, belongs_to: "TWrap[Any] | None" = None) -> "TWrap[Any]":
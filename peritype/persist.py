@@ -0,0 +1,487 @@
+import atexit
+import contextlib
+import inspect
+import marshal
+import mmap
+import os
+import struct
+import sys
+import threading
+import types
+import typing
+import weakref
+from collections.abc import Iterable
+from pathlib import Path
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    Final,
+    Literal,
+    NotRequired,
+    Required,
+    TypeVar,
+    Union,  # pyright: ignore[reportDeprecated]
+    cast,
+    get_args,
+    get_origin,
+)
+
+from peritype import compat, forward, stats
+
+_MAGIC = b"PTYCACHE"
+_HEADER = struct.Struct("<8sII")
+_VERSION = 2
+_SPECIAL_FORMS: dict[Any, str] = {
+    Annotated: "Annotated",
+    ClassVar: "ClassVar",
+    Final: "Final",
+    Literal: "Literal",
+    NotRequired: "NotRequired",
+    Required: "Required",
+    Union: "Union",  # pyright: ignore[reportDeprecated]
+    types.UnionType: "Union",
+}
+_CONSTANTS = (str, int, float, bool, bytes, types.NoneType)
+
+type _Stamp = tuple[int, int]
+_MISSING = object()
+_OWNER_BOUND = object()
+
+
+class _UnencodableError(Exception):
+    pass
+
+
+class _Section:
+    __slots__ = ("dirty", "entries", "span", "stamp")
+
+    def __init__(self, stamp: _Stamp, span: tuple[int, int] | None, entries: dict[str, Any] | None) -> None:
+        self.stamp = stamp
+        self.span = span
+        self.entries = entries
+        self.dirty = False
+
+
+class PersistentCache:
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._sections: dict[str, _Section] = {}
+        self._stamps: dict[str, _Stamp | None] = {}
+        self._exported: dict[tuple[str, int], tuple[Any, set[str]]] = {}
+        self._decoded: dict[Any, Any] = {}
+        self._data: mmap.mmap | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with self.path.open("rb") as file:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        try:
+            magic, version, index_size = _HEADER.unpack_from(data)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(version)
+            offset = _HEADER.size + index_size
+            tag, index = marshal.loads(data[_HEADER.size : offset])
+            if tag != sys.implementation.cache_tag:
+                raise ValueError(tag)
+            for module, (stamp, length) in index.items():
+                self._sections[module] = _Section(stamp, (offset, offset + length), None)
+                offset += length
+            if offset > len(data):
+                raise EOFError
+        except (ValueError, EOFError, TypeError, struct.error):
+            self._sections.clear()
+            data.close()
+        else:
+            self._data = data
+
+    def _raw(self, section: _Section) -> bytes:
+        if section.span is None or self._data is None:
+            raise ValueError(section)
+        start, end = section.span
+        return self._data[start:end]
+
+    def get(self, obj: Any) -> dict[str, Any] | None:
+        module, qualname = _owner_key(obj)
+        with self._lock:
+            entries = self._entries(module)
+            entry = entries.get(qualname) if entries is not None else None
+            if entry is not None and any(self._stamp(dep) != stamp for dep, stamp in entry[0]):
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+        try:
+            hints = {name: self._decode(value, obj) for name, value in entry[1].items()}
+        except (AttributeError, KeyError, TypeError, ValueError, _UnencodableError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return hints
+
+    def _decode(self, value: Any, owner: Any) -> Any:
+        hint = self._decoded.get(value, _MISSING)
+        if hint is _MISSING:
+            try:
+                hint = self._decoded[value] = _decode(value, None)
+            except _UnencodableError:
+                hint = self._decoded[value] = _OWNER_BOUND
+        if hint is _OWNER_BOUND:
+            hint = _decode(value, owner)
+        return hint
+
+    def put(self, obj: Any, hints: dict[str, Any], touched: Iterable[tuple[str, Any]] = ()) -> None:
+        module, qualname = _owner_key(obj)
+        if "<locals>" in qualname or _resolve(module, qualname) is not _unwrap(obj):
+            return
+        try:
+            encoded = {name: _encode(hint, obj) for name, hint in hints.items()}
+        except _UnencodableError:
+            return
+        with self._lock:
+            if (stamp := self._stamp(module)) is None:
+                return
+            modules = _modules_of((*getattr(obj, "__mro__", ())[1:], *hints.values()), set())
+            for name, value in touched:
+                modules |= self._exporters(name, value)
+            deps: list[tuple[str, _Stamp]] = []
+            for dep in sorted(modules - {module, "builtins"}):
+                if (dep_stamp := self._stamp(dep)) is not None:
+                    deps.append((dep, dep_stamp))
+            if (entries := self._entries(module)) is None:
+                entries = {}
+                self._sections[module] = _Section(stamp, None, entries)
+            entries[qualname] = ((*deps,), encoded)
+            self._sections[module].dirty = True
+            self._dirty = True
+
+    def _exporters(self, name: str, value: Any) -> set[str]:
+        key = (name, id(value))
+        if (cached := self._exported.get(key)) is None or cached[0] is not value:
+            modules = _modules_of((value,), set())
+            for module, namespace in (*sys.modules.items(),):
+                if getattr(namespace, "__dict__", {}).get(name, _MISSING) is value:
+                    modules.add(module)
+            cached = self._exported[key] = (value, modules)
+        return cached[1]
+
+    def _stamp(self, module: str) -> _Stamp | None:
+        if module not in self._stamps:
+            self._stamps[module] = _source_stamp(module)
+        return self._stamps[module]
+
+    def _entries(self, module: str) -> dict[str, Any] | None:
+        section = self._sections.get(module)
+        if section is None:
+            return None
+        if section.entries is None:
+            try:
+                if self._stamp(module) != section.stamp:
+                    raise ValueError(module)
+                section.entries = marshal.loads(self._raw(section))
+            except (EOFError, ValueError, TypeError):
+                del self._sections[module]
+                return None
+        return section.entries
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            index: dict[str, tuple[_Stamp, int]] = {}
+            blobs: list[bytes] = []
+            for module, section in self._sections.items():
+                raw = marshal.dumps(section.entries) if section.dirty or section.span is None else self._raw(section)
+                index[module] = (section.stamp, len(raw))
+                blobs.append(raw)
+            index_data = marshal.dumps((sys.implementation.cache_tag, index))
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with tmp.open("wb") as file:
+                file.write(_HEADER.pack(_MAGIC, _VERSION, len(index_data)))
+                file.write(index_data)
+                for blob in blobs:
+                    file.write(blob)
+            if self._data is not None:
+                self._data.close()
+                self._data = None
+            os.replace(tmp, self.path)
+            offset = _HEADER.size + len(index_data)
+            for section, blob in zip(self._sections.values(), blobs, strict=True):
+                section.span = (offset, offset + len(blob))
+                section.dirty = False
+                offset += len(blob)
+            with contextlib.suppress(OSError, ValueError), self.path.open("rb") as file:
+                self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._dirty = False
+
+    def info(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "path": str(self.path),
+                "hits": self.hits,
+                "misses": self.misses,
+                "modules": len(self._sections),
+            }
+
+
+_STORE: PersistentCache | None = None
+
+
+def configure(path: str | os.PathLike[str] | None, *, autosave: bool = True) -> None:
+    global _STORE
+    if _STORE is not None:
+        atexit.unregister(_STORE.save)
+    _STORE = PersistentCache(path) if path is not None else None
+    if _STORE is not None and autosave:
+        atexit.register(_STORE.save)
+
+
+def save() -> None:
+    if _STORE is not None:
+        _STORE.save()
+
+
+def get_type_hints(obj: Any) -> dict[str, Any]:
+    if isinstance(obj, type):
+        merged: dict[str, Any] = {}
+        for base in reversed(obj.__mro__):
+            merged |= get_class_hints(base)
+        return merged
+    store = _STORE
+    if store is None:
+        return _evaluate_hints(obj)
+    if (hints := store.get(obj)) is not None:
+        return hints
+    with forward.track() as touched:
+        hints = _evaluate_hints(obj)
+    store.put(obj, hints, touched)
+    return hints
+
+
+def get_class_hints(cls: type[Any]) -> dict[str, Any]:
+    if (hints := _class_hints.get(cls)) is not None:
+        return hints
+    store = _STORE
+    if not get_annotation_names(cls):
+        hints = {}
+    elif store is None:
+        hints = stats.timed("get_type_hints", _evaluate_class_hints, cls)
+    elif (stored := store.get(cls)) is None:
+        with forward.track() as touched:
+            hints = stats.timed("get_type_hints", _evaluate_class_hints, cls)
+        store.put(cls, hints, touched)
+    else:
+        hints = stored
+    with _class_hints_lock:
+        _attribute_hints.pop(cls, None)
+        return _class_hints.setdefault(cls, hints)
+
+
+def get_class_hint(cls: type[Any], name: str) -> Any:
+    if (hints := _class_hints.get(cls)) is not None:
+        return hints[name]
+    if (partial := _attribute_hints.get(cls)) is not None and name in partial:
+        return partial[name]
+    if name not in get_annotation_names(cls):
+        raise KeyError(name)
+    if _STORE is not None and _STORE.get(cls) is not None:
+        return get_class_hints(cls)[name]
+    hint = stats.timed("get_type_hints", _evaluate_class_hint, cls, name)
+    with _class_hints_lock:
+        return _attribute_hints.setdefault(cls, {}).setdefault(name, hint)
+
+
+def get_annotation_names(cls: type[Any]) -> tuple[str, ...]:
+    if getattr(cls, "__no_type_check__", False):
+        return ()
+    return (*inspect.get_annotations(cls),)
+
+
+def clear_class_hints() -> None:
+    with _class_hints_lock:
+        _class_hints.clear()
+        _attribute_hints.clear()
+
+
+_class_hints = weakref.WeakKeyDictionary[type[Any], dict[str, Any]]()
+_attribute_hints = weakref.WeakKeyDictionary[type[Any], dict[str, Any]]()
+_class_hints_lock = threading.Lock()
+
+
+def _evaluate_hints(obj: Any) -> dict[str, Any]:
+    if isinstance(obj, types.FunctionType | types.MethodType):
+        return stats.timed("get_type_hints", _evaluate_function_hints, obj)
+    return stats.timed("get_type_hints", typing.get_type_hints, obj, include_extras=True)
+
+
+def _evaluate_class_hints(cls: type[Any]) -> dict[str, Any]:
+    namespace = dict(vars(cls))
+    return {name: _evaluate(cls, value, namespace) for name, value in inspect.get_annotations(cls).items()}
+
+
+def _evaluate_class_hint(cls: type[Any], name: str) -> Any:
+    return _evaluate(cls, inspect.get_annotations(cls)[name], dict(vars(cls)))
+
+
+def _evaluate(cls: type[Any], value: Any, namespace: dict[str, Any]) -> Any:
+    if value is None:
+        return types.NoneType
+    module = getattr(sys.modules.get(cls.__module__), "__dict__", {})
+    if isinstance(value, str):
+        return forward.evaluate(value, module, namespace, cls.__type_params__, is_argument=False, is_class=True)
+    return compat.eval_type(value, namespace, module, cls.__type_params__)
+
+
+def _evaluate_function_hints(func: types.FunctionType | types.MethodType) -> dict[str, Any]:
+    if getattr(func, "__no_type_check__", False):
+        return {}
+    target: Any = func
+    while hasattr(target, "__wrapped__"):
+        target = target.__wrapped__
+    globalns: dict[str, Any] = getattr(target, "__globals__", {})
+    type_params: tuple[Any, ...] = getattr(func, "__type_params__", ())
+    hints: dict[str, Any] = {}
+    for name, value in func.__annotations__.items():
+        if value is None:
+            hints[name] = types.NoneType
+        elif isinstance(value, str):
+            hints[name] = forward.evaluate(value, globalns, None, type_params, is_argument=True, is_class=False)
+        else:
+            hints[name] = compat.eval_type(value, globalns, globalns, type_params)
+    return hints
+
+
+def _unwrap(obj: Any) -> Any:
+    return getattr(obj, "__func__", obj)
+
+
+def _owner_key(obj: Any) -> tuple[str, str]:
+    obj = _unwrap(obj)
+    return getattr(obj, "__module__", None) or "", getattr(obj, "__qualname__", None) or ""
+
+
+def _source_stamp(module: str) -> _Stamp | None:
+    file: str | None = getattr(sys.modules.get(module), "__file__", None)
+    if file is None:
+        return None
+    with contextlib.suppress(OSError):
+        stat = os.stat(file)
+        return stat.st_mtime_ns, stat.st_size
+    return None
+
+
+def _modules_of(values: Iterable[Any], modules: set[str]) -> set[str]:
+    for value in values:
+        if isinstance(value, types.ModuleType):
+            modules.add(value.__name__)
+            continue
+        if isinstance(module := getattr(value, "__module__", None), str):
+            modules.add(module)
+        _modules_of(cast(list[Any], value) if isinstance(value, list) else get_args(value), modules)
+    return modules
+
+
+def _resolve(module: str, qualname: str) -> Any:
+    target: Any = sys.modules.get(module)
+    for part in qualname.split("."):
+        if target is None:
+            return None
+        target = getattr(target, part, None)
+    return target
+
+
+def _encode(hint: Any, owner: Any) -> Any:
+    if hint is None or hint is types.NoneType:
+        return None
+    if hint is Ellipsis:
+        return ("e",)
+    if isinstance(hint, TypeVar):
+        if _find_type_param(owner, hint.__name__) is not hint:
+            raise _UnencodableError
+        return ("v", hint.__name__)
+    if isinstance(hint, list):
+        return ("L", (*(_encode(h, owner) for h in cast(list[Any], hint)),))
+    origin = get_origin(hint)
+    if origin is None:
+        return _encode_ref(hint)
+    args = get_args(hint)
+    if origin is Literal:
+        if not all(isinstance(a, _CONSTANTS) for a in args):
+            raise _UnencodableError
+        return ("l", args)
+    if origin is Annotated:
+        metadata: tuple[Any, ...] = hint.__metadata__
+        if not all(isinstance(m, _CONSTANTS) for m in metadata):
+            raise _UnencodableError
+        return ("a", _encode(args[0], owner), metadata)
+    if origin in _SPECIAL_FORMS:
+        return ("s", _SPECIAL_FORMS[origin], (*(_encode(a, owner) for a in args),))
+    return ("g", _encode_ref(origin), (*(_encode(a, owner) for a in args),))
+
+
+def _encode_ref(value: Any) -> Any:
+    if value is Any:
+        return ("c", "typing", "Any")
+    module: str | None = getattr(value, "__module__", None)
+    qualname: str | None = getattr(value, "__qualname__", None)
+    if not module or not qualname or "<locals>" in qualname or _resolve(module, qualname) is not value:
+        raise _UnencodableError
+    return ("c", module, qualname)
+
+
+def _decode(value: Any, owner: Any) -> Any:
+    if value is None:
+        return types.NoneType
+    match value[0]:
+        case "c":
+            if (resolved := _resolve(value[1], value[2])) is None:
+                raise _UnencodableError
+            return resolved
+        case "g":
+            return _subscript(_decode(value[1], owner), (*(_decode(a, owner) for a in value[2]),))
+        case "s":
+            return _subscript(getattr(typing, value[1]), (*(_decode(a, owner) for a in value[2]),))
+        case "l":
+            return _subscript(Literal, value[1])
+        case "a":
+            return Annotated[_decode(value[1], owner), *value[2]]
+        case "L":
+            return [_decode(a, owner) for a in value[1]]
+        case "e":
+            return Ellipsis
+        case "v":
+            return _find_type_param(owner, value[1])
+        case _:
+            raise _UnencodableError
+
+
+def _subscript(origin: Any, args: tuple[Any, ...]) -> Any:
+    return origin[args[0] if len(args) == 1 else args]
+
+
+def _find_type_param(owner: Any, name: str) -> Any:
+    owner = _unwrap(owner)
+    candidates: list[Any] = [owner]
+    if not isinstance(owner, type):
+        module, qualname = _owner_key(owner)
+        if isinstance(cls := _resolve(module, qualname.rpartition(".")[0]), type):
+            candidates.append(cls)
+    for candidate in candidates:
+        for cls in getattr(candidate, "__mro__", (candidate,)):
+            for param in (
+                *(getattr(cls, "__type_params__", None) or ()),
+                *(getattr(cls, "__parameters__", None) or ()),
+            ):
+                if getattr(param, "__name__", None) == name:
+                    return param
+    raise _UnencodableError
@@ -0,0 +1,108 @@
+import sys
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+ENABLED = False
+
+_call_counts: dict[str, int] = {}
+_call_seconds: dict[str, float] = {}
+_build_by_type: dict[str, float] = {}
+_computations: dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def enable() -> None:
+    global ENABLED
+    ENABLED = True
+
+
+def disable() -> None:
+    global ENABLED
+    ENABLED = False
+
+
+def reset() -> None:
+    from peritype.wrap import _BOUND_CACHE, _FWRAP_CACHE, _MATCH_CACHE, _TWRAP_CACHE  # pyright: ignore[reportPrivateUsage]
+
+    with _lock:
+        _call_counts.clear()
+        _call_seconds.clear()
+        _build_by_type.clear()
+        _computations.clear()
+    _TWRAP_CACHE.reset_counters()
+    _FWRAP_CACHE.reset_counters()
+    _BOUND_CACHE.reset_counters()
+    _MATCH_CACHE.reset_counters()
+
+
+def record_time(name: str, elapsed: float) -> None:
+    with _lock:
+        _call_counts[name] = _call_counts.get(name, 0) + 1
+        _call_seconds[name] = _call_seconds.get(name, 0.0) + elapsed
+
+
+def record_build(name: str, built: object, elapsed: float) -> None:
+    record_time(name, elapsed)
+    type_name = str(built)
+    with _lock:
+        _build_by_type[type_name] = _build_by_type.get(type_name, 0.0) + elapsed
+
+
+def count(name: str) -> None:
+    with _lock:
+        _computations[name] = _computations.get(name, 0) + 1
+
+
+def timed[**P, R](name: str, func: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs) -> R:
+    if not ENABLED:
+        return func(*args, **kwargs)
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        record_time(name, time.perf_counter() - start)
+
+
+_OWNED = (dict, list, tuple, set, frozenset)
+
+
+def approx_size(obj: object) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(vars(obj))
+    for cls in type(obj).__mro__:
+        slots: Any = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            slot = cls.__dict__.get(name)
+            if slot is None or name in ("__dict__", "__weakref__"):
+                continue
+            try:
+                value = slot.__get__(obj, cls)
+            except AttributeError:
+                continue
+            if isinstance(value, _OWNED):
+                size += sys.getsizeof(value)
+    return size
+
+
+def snapshot() -> dict[str, Any]:
+    from peritype.wrap import _BOUND_CACHE, _FWRAP_CACHE, _MATCH_CACHE, _TWRAP_CACHE  # pyright: ignore[reportPrivateUsage]
+
+    caches = {
+        "wrap_type": _TWRAP_CACHE.info(),
+        "wrap_func": _FWRAP_CACHE.info(),
+        "bound_func": _BOUND_CACHE.info(),
+        "match": _MATCH_CACHE.info(),
+    }
+    with _lock:
+        return {
+            "enabled": ENABLED,
+            "caches": caches,
+            "timings": {
+                name: {"count": calls, "total_seconds": _call_seconds[name]} for name, calls in _call_counts.items()
+            },
+            "build_by_type": dict(_build_by_type),
+            "computations": dict(_computations),
+        }
@@ -0,0 +1,121 @@
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, Self, cast, overload
+
+
+class _Call[V]:
+    __slots__ = ("done", "error", "owner", "value", "waiters")
+
+    def __init__(self) -> None:
+        self.owner = threading.get_ident()
+        self.done = False
+        self.waiters = 0
+        self.value: V | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight[K: Hashable, V]:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._finished = threading.Condition(self._lock)
+        self._calls: dict[K, _Call[V]] = {}
+
+    def do(self, key: K, func: Callable[[], V]) -> V:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+            elif call.owner != threading.get_ident():
+                call.waiters += 1
+                while not call.done:
+                    self._finished.wait()
+                if call.error is not None:
+                    raise call.error
+                return cast(V, call.value)
+            else:
+                call = None
+        if call is None:
+            return func()
+        try:
+            call.value = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                call.done = True
+                if call.waiters:
+                    self._finished.notify_all()
+        return call.value
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+class locked_cached_property[I, V]:  # noqa: N801
+    def __init__(self, func: Callable[[I], V]) -> None:
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+        self._flights = SingleFlight[int, V]()
+        self._slot: Any = None
+
+    def __set_name__(self, owner: type[Any], name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type[Any] | None = None) -> Self: ...
+    @overload
+    def __get__(self, instance: I, owner: type[Any] | None = None) -> V: ...
+    def __get__(self, instance: I | None, owner: type[Any] | None = None) -> Self | V:
+        if instance is None:
+            return self
+        return self._flights.do(id(instance), lambda: self._compute(instance))
+
+    def _compute(self, instance: I) -> V:
+        cache: dict[str, Any] = instance.__dict__
+        if self.name in cache:
+            return cache[self.name]
+        value = self.func(instance)
+        cache[self.name] = value
+        return value
+
+    def fill_slot(self, instance: I) -> V:
+        return self._flights.do(id(instance), lambda: self._compute_slot(instance))
+
+    def _compute_slot(self, instance: I) -> V:
+        try:
+            return self._slot.__get__(instance)
+        except AttributeError:
+            pass
+        value = self.func(instance)
+        self._slot.__set__(instance, value)
+        return value
+
+
+class LazySlots(type):
+    _lazy_properties: dict[str, locked_cached_property[Any, Any]]
+
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs: Any) -> "LazySlots":
+        lazy = {k: v for k, v in namespace.items() if isinstance(v, locked_cached_property)}
+        slots = dict.fromkeys(namespace.get("__slots__", ()))
+        for key, prop in lazy.items():
+            del namespace[key]
+            slots[key] = prop.__doc__
+        namespace["__slots__"] = slots
+        if lazy:
+            namespace.setdefault("__getattr__", _fill_lazy_slot)
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        for key, prop in lazy.items():
+            prop.name = key
+            prop._slot = cls.__dict__[key]  # pyright: ignore[reportPrivateUsage]
+        cls._lazy_properties = {**getattr(cls, "_lazy_properties", {}), **lazy}
+        return cls
+
+
+def _fill_lazy_slot(self: Any, name: str) -> Any:
+    prop = type(self)._lazy_properties.get(name)
+    if prop is None:
+        return object.__getattribute__(self, name)
+    return prop.fill_slot(self)
@@ -0,0 +1,145 @@
+import threading
+import weakref
+from typing import Any, Generic, Protocol, TypeVar, get_args, get_origin
+
+from peritype import persist
+from peritype.mapping import TypeVarMapping
+
+_SKIPPED_BASES: tuple[Any, ...] = (object, Generic, Protocol)
+
+
+class GenericTemplate:
+    __slots__ = (
+        "__weakref__",
+        "_attribute_hints",
+        "_attribute_names",
+        "_hints",
+        "_owner",
+        "ancestors",
+        "lookup",
+        "parameters",
+        "wrapped_hints",
+    )
+
+    def __init__(
+        self,
+        owner: type[Any] | None,
+        parameters: tuple[Any, ...],
+        ancestors: dict[type[Any], dict[TypeVar, Any]],
+    ) -> None:
+        self._owner = weakref.ref(owner) if owner is not None else None
+        self.parameters = parameters
+        self.ancestors = ancestors
+        self.lookup: dict[TypeVar, Any] = {}
+        for mapping in reversed(ancestors.values()):
+            self.lookup |= mapping
+        self.wrapped_hints: dict[str, Any] | None = None
+        self._attribute_hints: dict[str, Any] | None = None
+        self._attribute_names: tuple[str, ...] | None = None
+        self._hints: dict[str, Any] = {}
+
+    @property
+    def attribute_hints(self) -> dict[str, Any]:
+        if self._attribute_hints is None:
+            hints: dict[str, Any] = {}
+            for base in reversed(self._mro()):
+                try:
+                    own = persist.get_class_hints(base)
+                except (AttributeError, TypeError, NameError):
+                    continue
+                if own and (mapping := self.ancestors.get(base)):
+                    own = {name: substitute(hint, mapping) for name, hint in own.items()}
+                hints |= own
+            self._attribute_hints = hints
+        return self._attribute_hints
+
+    @property
+    def attribute_names(self) -> tuple[str, ...]:
+        if self._attribute_names is None:
+            names: dict[str, None] = {}
+            for base in reversed(self._mro()):
+                names |= dict.fromkeys(persist.get_annotation_names(base))
+            self._attribute_names = (*names,)
+        return self._attribute_names
+
+    def attribute_hint(self, name: str) -> Any:
+        if self._attribute_hints is not None and name in self._attribute_hints:
+            return self._attribute_hints[name]
+        if name in self._hints:
+            return self._hints[name]
+        for base in self._mro():
+            if name in persist.get_annotation_names(base):
+                hint = persist.get_class_hint(base, name)
+                if mapping := self.ancestors.get(base):
+                    hint = substitute(hint, mapping)
+                return self._hints.setdefault(name, hint)
+        raise AttributeError(f"Attribute '{name}' not found")
+
+    def bind(self, args: tuple[Any, ...]) -> dict[TypeVar, Any]:
+        return {param: args[i] if i < len(args) else Any for i, param in enumerate(self.parameters)}
+
+    def mapping(self, args: tuple[Any, ...]) -> dict[TypeVar, Any]:
+        own = self.bind(args)
+        if not self.lookup:
+            return own
+        return {var: substitute(expr, own) for var, expr in self.lookup.items()} | own
+
+    def _mro(self) -> tuple[type[Any], ...]:
+        owner = self._owner() if self._owner is not None else None
+        return owner.__mro__ if owner is not None else ()
+
+
+_templates = weakref.WeakKeyDictionary[type[Any], GenericTemplate]()
+_lock = threading.Lock()
+_EMPTY = GenericTemplate(None, (), {})
+
+
+def get_template(cls: Any) -> GenericTemplate:
+    if not isinstance(cls, type):
+        return _EMPTY
+    if (template := _templates.get(cls)) is not None:
+        return template
+    template = _build_template(cls)
+    with _lock:
+        return _templates.setdefault(cls, template)
+
+
+def clear_templates() -> None:
+    with _lock:
+        _templates.clear()
+    persist.clear_class_hints()
+
+
+def _build_template(cls: type[Any]) -> GenericTemplate:
+    parameters: tuple[Any, ...] = getattr(cls, "__type_params__", None) or getattr(cls, "__parameters__", None) or ()
+    ancestors: dict[type[Any], dict[TypeVar, Any]] = {}
+    for base in vars(cls).get("__orig_bases__", cls.__bases__):
+        origin = get_origin(base) or base
+        if origin in _SKIPPED_BASES or not isinstance(origin, type):
+            continue
+        template = get_template(origin)
+        bound = ancestors.setdefault(origin, template.bind(get_args(base)))
+        for ancestor, mapping in template.ancestors.items():
+            if ancestor not in ancestors:
+                ancestors[ancestor] = {var: substitute(expr, bound) for var, expr in mapping.items()}
+    return GenericTemplate(cls, parameters, ancestors)
+
+
+def substitute(hint: Any, mapping: TypeVarMapping) -> Any:
+    if isinstance(hint, TypeVar):
+        return _resolve(hint, mapping)
+    if isinstance(hint, type):
+        return hint
+    params: tuple[Any, ...] | None = getattr(hint, "__parameters__", None)
+    if not params or not isinstance(params, tuple) or not any(p in mapping for p in params):
+        return hint
+    try:
+        return hint[*(_resolve(p, mapping) for p in params)]
+    except TypeError:
+        return hint
+
+
+def _resolve(var: Any, mapping: TypeVarMapping) -> Any:
+    if var in mapping:
+        return mapping[var]
+    return var
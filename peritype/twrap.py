@@ -1,38 +1,130 @@
 import inspect
-from collections.abc import Iterator
-from functools import cached_property
-from types import NoneType
-from typing import TYPE_CHECKING, Any, ForwardRef, Literal, TypeVar, cast, get_type_hints, override
+import threading
+import weakref
+from collections.abc import Callable, Hashable, Iterator, Mapping
+from types import NoneType, UnionType
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    ForwardRef,
+    Literal,
+    NotRequired,
+    ParamSpec,
+    Self,
+    TypeVar,
+    TypeVarTuple,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    override,
+)
 
 import peritype
+from peritype import stats
+from peritype.cache import MatchCache
 from peritype.errors import PeritypeError
+from peritype.mapping import TypeVarMapping
+from peritype.sync import LazySlots, locked_cached_property
+from peritype.template import get_template, substitute
+from peritype.validate import compile_validator
 
 if TYPE_CHECKING:
     from peritype.fwrap import BoundFWrap, FWrap
 
 
+class _InternTable[V]:
+    def __init__(self) -> None:
+        self._table = weakref.WeakValueDictionary[Hashable, V]()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> V | None:
+        try:
+            return self._table.get(key)
+        except TypeError:
+            return None
+
+    def add(self, key: Hashable, value: V) -> V:
+        try:
+            with self._lock:
+                return self._table.setdefault(key, value)
+        except TypeError:
+            return value
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
+def _value_key(value: Any) -> Hashable:
+    return (type(value), value)
+
+
+def _node_key(inner_type: Any, generic_params: "tuple[TWrap[Any], ...]") -> Hashable:
+    return (_value_key(inner_type), (*map(id, generic_params),))
+
+
+def _twrap_key(nodes: "tuple[TypeNode[Any], ...]", meta: "TWrapMeta") -> Hashable:
+    return (frozenset(map(id, nodes)), meta)
+
+
+def _structural_hash(key: Hashable, instance: object) -> int:
+    try:
+        return hash(key)
+    except TypeError:
+        return object.__hash__(instance)
+
+
 class TWrapMeta:
-    def __init__(
-        self,
+    __slots__ = ("__weakref__", "_hash", "annotated", "required", "total")
+
+    annotated: tuple[Any, ...]
+    required: bool
+    total: bool
+    _hash: int
+
+    def __new__(
+        cls,
         *,
-        annotated: tuple[Any],
+        annotated: tuple[Any, ...],
         required: bool,
         total: bool,
-    ) -> None:
-        self.annotated = annotated
-        self.required = required
-        self.total = total
-
-    @cached_property
-    def _hash(self) -> int:
-        return hash((self.annotated, self.required, self.total))
+    ) -> Self:
+        key = ((*map(_value_key, annotated),), required, total)
+        if (meta := _interned_metas.get(key)) is not None:
+            return cast(Self, meta)
+        meta = super().__new__(cls)
+        meta.annotated = annotated
+        meta.required = required
+        meta.total = total
+        meta._hash = _structural_hash(key, meta)
+        return cast(Self, _interned_metas.add(key, meta))
 
     @override
     def __hash__(self) -> int:
         return self._hash
 
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_restore, (TWrapMeta, {"annotated": self.annotated, "required": self.required, "total": self.total}))
+
+
+def _restore[R](cls: Callable[..., R], kwargs: dict[str, Any]) -> R:
+    return cls(**kwargs)
+
+
+_interned_metas = _InternTable[TWrapMeta]()
+
 
 class TypeVarLookup:
+    __slots__ = ("origin_mapping", "twrap_mapping")
+
     def __init__(self, origins: dict[TypeVar, Any], twraps: dict[TypeVar, "TWrap[Any]"]) -> NoneType:
         self.origin_mapping = origins
         self.twrap_mapping = twraps
@@ -70,18 +162,102 @@ class TypeVarLookup:
         return self.twrap_mapping[key]
 
 
-class TypeNode[T]:
-    def __init__(
-        self,
+class AttributeHintsView(Mapping[str, "TWrap[Any]"]):
+    __slots__ = ("_node",)
+
+    def __init__(self, node: "TypeNode[Any]") -> None:
+        self._node = node
+
+    @property
+    def _names(self) -> tuple[str, ...]:
+        return get_template(self._node.inner_type).attribute_names
+
+    def __getitem__(self, key: str, /) -> "TWrap[Any]":
+        if key not in self._names:
+            raise KeyError(key)
+        return self._node.get_attribute_hint(key)
+
+    def __contains__(self, key: object, /) -> bool:
+        return key in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+class TypeNode[T](metaclass=LazySlots):
+    __slots__ = (
+        "__weakref__",
+        "_attribute_cache",
+        "_canonical",
+        "_generic_params",
+        "_hash",
+        "_inner_type",
+        "_interned",
+        "_origin",
+        "_origin_params",
+    )
+
+    _origin: Any
+    _generic_params: "tuple[TWrap[Any], ...] | None"
+    _inner_type: type[T]
+    _origin_params: tuple[Any, ...]
+    _attribute_cache: "dict[str, TWrap[Any]] | None"
+    _canonical: "TypeNode[T] | None"
+    _interned: bool
+    _hash: int
+
+    def __new__(
+        cls,
         origin: Any,
-        generic_params: "tuple[TWrap[Any], ...]",
+        generic_params: "tuple[TWrap[Any], ...] | None",
         inner_type: type[T],
         origin_params: tuple[Any, ...],
-    ) -> None:
-        self._origin = origin
-        self._generic_params = generic_params
-        self._inner_type = inner_type
-        self._origin_params = origin_params
+    ) -> Self:
+        spelling: Hashable = None
+        if generic_params is not None:
+            spelling = (_node_key(inner_type, generic_params), _value_key(origin))
+            if (node := _spelled_nodes.get(spelling)) is not None:
+                return cast(Self, node)
+        node = super().__new__(cls)
+        node._origin = origin
+        node._generic_params = generic_params
+        node._inner_type = inner_type
+        node._origin_params = origin_params
+        node._attribute_cache = None
+        node._canonical = None
+        node._interned = False
+        if generic_params is None:
+            return node
+        _ = node.canonical
+        return cast(Self, _spelled_nodes.add(spelling, node))
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (TypeNode, (self._origin, self._generic_params, self._inner_type, self._origin_params))
+
+    @property
+    def canonical(self) -> "TypeNode[T]":
+        if not self._interned:
+            key = _node_key(self._inner_type, (*(param.canonical for param in self.generic_params),))
+            self._hash = _structural_hash(key, self)
+            canonical = _interned_nodes.add(key, self)
+            if canonical is not self:
+                self._canonical = canonical
+            self._interned = True
+        return self if self._canonical is None else self._canonical
+
+    @property
+    def resolved(self) -> bool:
+        return self._generic_params is not None
 
     @property
     def origin(self) -> Any:
@@ -89,6 +265,8 @@ class TypeNode[T]:
 
     @property
     def generic_params(self) -> "tuple[TWrap[Any], ...]":
+        if self._generic_params is None:
+            self._generic_params = (*(peritype.wrap_type(var) for var in self._origin_params),)
         return self._generic_params
 
     @property
@@ -113,7 +291,7 @@ class TypeNode[T]:
             return f"'{v.__forward_arg__}'"
         return str(v)
 
-    @cached_property
+    @locked_cached_property
     def _str(self) -> str:
         if not self._origin_params:
             return self._format_type(self._inner_type)
@@ -127,39 +305,39 @@ class TypeNode[T]:
     def __repr__(self) -> str:
         return f"<TypeNode {self._str}>"
 
-    @cached_property
-    def _hash(self) -> int:
-        return hash((self._inner_type, self._generic_params))
-
     @override
     def __hash__(self) -> int:
+        if not self._interned:
+            return self.canonical._hash
         return self._hash
 
     @override
     def __eq__(self, value: object) -> bool:
+        if self is value:
+            return True
         if not isinstance(value, TypeNode):
             return False
-        return hash(self) == hash(value)  # pyright: ignore[reportUnknownArgumentType]
+        return self.canonical is cast("TypeNode[Any]", value).canonical
 
     def __getitem__(self, index: int) -> "TWrap[Any]":
-        return self._generic_params[index]
+        return self.generic_params[index]
 
-    @cached_property
+    @locked_cached_property
     def base_name(self) -> str:
         return self._format_type(self._inner_type)
 
-    @cached_property
+    @locked_cached_property
     def contains_any(self) -> bool:
         if self._inner_type is Any or self._inner_type is Ellipsis:  # pyright: ignore[reportUnnecessaryComparison]
             return True
         if isinstance(self._inner_type, tuple) and Any in self._inner_type:
             return True
-        for node in self._generic_params:
+        for node in self.generic_params:
             if node.contains_any:
                 return True
         return False
 
-    @cached_property
+    @locked_cached_property
     def bases(self) -> tuple["TWrap[Any]", ...]:
         bases: list[TWrap[Any]] = []
         if hasattr(self._inner_type, "__orig_bases__"):
@@ -172,58 +350,59 @@ class TypeNode[T]:
                 bases.append(peritype.wrap_type(base, lookup=self.type_var_lookup))
         return (*bases,)
 
-    @cached_property
+    @locked_cached_property
     def type_var_lookup(self) -> TypeVarLookup:
-        parameters = getattr(self._inner_type, "__type_params__", None) or getattr(
-            self._inner_type, "__parameters__", None
-        )
-        origin_lookup = dict(zip(parameters, self._origin_params, strict=True)) if parameters else {}
-        twrap_lookup = dict(zip(parameters, self._generic_params, strict=True)) if parameters else {}
-        lookup = TypeVarLookup(origin_lookup, twrap_lookup)
-        base_lookup = TypeVarLookup({}, {})
-        if hasattr(self._inner_type, "__orig_bases__"):
-            origin_bases: tuple[type[Any], ...] = getattr(self._inner_type, "__orig_bases__", ())
-            for base in origin_bases:
-                base_wrap = peritype.wrap_type(base, lookup=lookup)
-                base_lookup |= base_wrap.type_var_lookup
-        return base_lookup | lookup
-
-    @cached_property
+        if stats.ENABLED:
+            stats.count("type_var_lookup")
+        template = get_template(self._inner_type)
+        origins = template.mapping(self._origin_params)
+        twraps = dict(zip(template.parameters, self.generic_params, strict=False))
+        for var, value in origins.items():
+            if var not in twraps:
+                twraps[var] = peritype.wrap_type(value)
+        return TypeVarLookup(origins, twraps)
+
+    @locked_cached_property
     def attribute_hints(self) -> "dict[str, TWrap[Any]]":
-        if self._inner_type is NoneType:
-            return {}
-        return self._get_recursive_attribute_hints(self._inner_type)
-
-    def _get_recursive_attribute_hints(self, cls: type[Any]) -> "dict[str, TWrap[Any]]":
-        attr_hints: dict[str, TWrap[Any]] = {}
-        try:
-            for base in cls.__bases__:
-                attr_hints |= self._get_recursive_attribute_hints(base)
-            raw_ints: dict[str, type[Any] | TypeVar] = get_type_hints(cls, include_extras=True)
-            for attr_name, hint in raw_ints.items():
-                if isinstance(hint, TypeVar):
-                    if hint in self.type_var_lookup:
-                        attr_hints[attr_name] = peritype.wrap_type(self.type_var_lookup[hint])
-                    else:
-                        raise PeritypeError(f"TypeVar ~{hint.__name__} could not be found in lookup", cls=cls)
-                else:
-                    attr_hints[attr_name] = peritype.wrap_type(hint, lookup=self.type_var_lookup)
-        except (AttributeError, TypeError, NameError):
-            return attr_hints
+        if stats.ENABLED:
+            stats.count("attribute_hints")
+        template = get_template(self._inner_type)
+        if not template.parameters and template.wrapped_hints is not None:
+            return template.wrapped_hints
+        mapping = template.bind(self._origin_params)
+        attr_hints = {name: self._wrap_hint(hint, mapping) for name, hint in template.attribute_hints.items()}
+        if not template.parameters:
+            template.wrapped_hints = attr_hints
         return attr_hints
 
-    @cached_property
+    def get_attribute_hint(self, name: str) -> "TWrap[Any]":
+        if (cache := self._attribute_cache) is None:
+            cache = self._attribute_cache = {}
+        elif (twrap := cache.get(name)) is not None:
+            return twrap
+        template = get_template(self._inner_type)
+        if template.wrapped_hints is not None and name in template.wrapped_hints:
+            return template.wrapped_hints[name]
+        hint = template.attribute_hint(name)
+        return cache.setdefault(name, self._wrap_hint(hint, template.bind(self._origin_params)))
+
+    def _wrap_hint(self, hint: Any, mapping: dict[TypeVar, Any]) -> "TWrap[Any]":
+        if isinstance(hint, TypeVar) and hint not in mapping:
+            raise PeritypeError(f"TypeVar ~{hint.__name__} could not be found in lookup", cls=self._inner_type)
+        return peritype.wrap_type(substitute(hint, mapping) if mapping else hint)
+
+    @locked_cached_property
     def init(self) -> "FWrap[..., Any]":
         if not hasattr(self._inner_type, "__init__"):
             raise TypeError("No __init__ method found in type nodes")
         init_func = self._inner_type.__init__
         return peritype.wrap_func(init_func)
 
-    @cached_property
+    @locked_cached_property
     def signature(self) -> inspect.Signature:
         return self.init.signature
 
-    @cached_property
+    @locked_cached_property
     def parameters(self) -> dict[str, inspect.Parameter]:
         return {**self.signature.parameters}
 
@@ -242,6 +421,10 @@ class TypeNode[T]:
                 return True
         return False
 
+    @locked_cached_property
+    def _param_matchers(self) -> "tuple[Callable[[TWrap[Any]], bool], ...]":
+        return (*(param.compile_matcher() for param in self.generic_params),)
+
     def _nodes_intersect(self, b: "TypeNode[Any]") -> bool:
         if self._origin is Any or b._origin is Any:
             return True
@@ -251,46 +434,117 @@ class TypeNode[T]:
         if self._inner_type is not b._inner_type:
             return False
 
-        if not self._generic_params and not b._generic_params:
+        if not self._origin_params and not b._origin_params:
             return True
 
-        if len(self._generic_params) != len(b._generic_params):
+        if len(self._origin_params) != len(b._origin_params):
             return False
 
-        for i in range(len(self._generic_params)):
-            if not self._generic_params[i].match(b._generic_params[i]):
+        a_params = self.generic_params
+        b_params = b.generic_params
+        for i in range(len(a_params)):
+            if not a_params[i].match(b_params[i]):
                 return False
         return True
 
 
-class TWrap[T]:
-    def __init__(
-        self,
+def _substitute_hint(hint: Any, values: dict[Any, Any]) -> Any:
+    if isinstance(hint, TypeVar | ParamSpec | TypeVarTuple):
+        return values.get(hint, hint)
+    if isinstance(hint, type):
+        if values.keys().isdisjoint(parameters := get_template(hint).parameters):
+            return hint
+        return cast(Any, hint)[*(values.get(param, Any) for param in parameters)]
+    if isinstance(hint, list):
+        items = [_substitute_hint(item, values) for item in cast(list[Any], hint)]
+        return hint if all(a is b for a, b in zip(items, cast(list[Any], hint), strict=True)) else items
+    if not (args := get_args(hint)):
+        parameters = getattr(hint, "__parameters__", None)
+        if isinstance(parameters, tuple) and not values.keys().isdisjoint(parameters):
+            raise PeritypeError(f"Type variables of {hint!r} cannot be substituted")
+        return hint
+    new_args = (*(_substitute_hint(arg, values) for arg in args),)
+    if all(a is b for a, b in zip(new_args, args, strict=True)):
+        return hint
+    origin = get_origin(hint)
+    try:
+        return (Union if origin is UnionType else cast(Any, origin))[*new_args]  # pyright: ignore[reportDeprecated]
+    except TypeError as error:
+        raise PeritypeError(f"Type variables of {hint!r} cannot be substituted") from error
+
+
+class TWrap[T](metaclass=LazySlots):
+    __slots__ = ("__weakref__", "_canonical", "_hash", "_interned", "_meta", "_method_cache", "_nodes", "_origin")
+
+    _origin: Any
+    _nodes: tuple[TypeNode[Any], ...]
+    _meta: TWrapMeta
+    _method_cache: "dict[Any, BoundFWrap[..., Any]] | None"
+    _canonical: "TWrap[T] | None"
+    _interned: bool
+    _hash: int
+
+    def __new__(
+        cls,
         *,
         origin: Any,
         nodes: tuple[TypeNode[Any], ...],
         meta: TWrapMeta,
-    ) -> None:
-        self._origin = origin
-        self._nodes = nodes
-        self._meta = meta
-        self._method_cache: dict[str, BoundFWrap[..., Any]] = {}
+    ) -> Self:
+        resolved = all(node._interned for node in nodes)
+        spelling: Hashable = None
+        if resolved:
+            spelling = (_twrap_key(nodes, meta), _value_key(origin))
+            if (twrap := _spelled_twraps.get(spelling)) is not None:
+                return cast(Self, twrap)
+        twrap = super().__new__(cls)
+        twrap._origin = origin
+        twrap._nodes = nodes
+        twrap._meta = meta
+        twrap._method_cache = None
+        twrap._canonical = None
+        twrap._interned = False
+        if not resolved:
+            return twrap
+        _ = twrap.canonical
+        return cast(Self, _spelled_twraps.add(spelling, twrap))
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
 
-    @cached_property
-    def _hash(self) -> int:
-        return hash(((*sorted(self._nodes, key=str),), self._meta))
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_restore, (TWrap, {"origin": self._origin, "nodes": self._nodes, "meta": self._meta}))
+
+    @property
+    def canonical(self) -> "TWrap[T]":
+        if not self._interned:
+            key = _twrap_key((*(node.canonical for node in self._nodes),), self._meta)
+            self._hash = _structural_hash(key, self)
+            canonical = _interned_twraps.add(key, self)
+            if canonical is not self:
+                self._canonical = canonical
+            self._interned = True
+        return self if self._canonical is None else self._canonical
 
     @override
     def __hash__(self) -> int:
+        if not self._interned:
+            return self.canonical._hash
         return self._hash
 
     @override
     def __eq__(self, value: object) -> bool:
+        if self is value:
+            return True
         if not isinstance(value, TWrap):
             return False
-        return hash(self) == hash(value)  # pyright: ignore[reportUnknownArgumentType]
+        return self.canonical is cast("TWrap[Any]", value).canonical
 
-    @cached_property
+    @locked_cached_property
     def _str(self) -> str:
         return " | ".join(str(n) for n in self._nodes)
 
@@ -298,7 +552,7 @@ class TWrap[T]:
     def __str__(self) -> str:
         return self._str
 
-    @cached_property
+    @locked_cached_property
     def _repr(self) -> str:
         return f"<Type {self}>"
 
@@ -321,7 +575,7 @@ class TWrap[T]:
     def total(self) -> bool:
         return self._meta.total
 
-    @cached_property
+    @locked_cached_property
     def annotations(self) -> tuple[Any, ...]:
         return self._meta.annotated
 
@@ -329,54 +583,65 @@ class TWrap[T]:
     def nodes(self) -> tuple["TypeNode[Any]", ...]:
         return self._nodes
 
-    @cached_property
+    @locked_cached_property
     def type_var_lookup(self) -> TypeVarLookup:
         lookup = TypeVarLookup({}, {})
         for node in self._nodes:
             lookup |= node.type_var_lookup
         return lookup
 
-    @cached_property
+    @locked_cached_property
     def contains_any(self) -> bool:
         return any(node.contains_any for node in self._nodes)
 
-    @cached_property
+    @locked_cached_property
     def union(self) -> bool:
         return len([n for n in self._nodes if n.inner_type is not NoneType]) > 1
 
-    @cached_property
+    @locked_cached_property
     def nullable(self) -> bool:
         return any(n.inner_type is NoneType for n in self._nodes)
 
-    @cached_property
+    @locked_cached_property
     def attribute_hints(self) -> "dict[str, TWrap[Any]]":
         if self.union:
             raise TypeError("Cannot get attributes of union types")
         return self._nodes[0].attribute_hints
 
-    @cached_property
+    @locked_cached_property
+    def lazy_attribute_hints(self) -> "AttributeHintsView":
+        if self.union:
+            raise TypeError("Cannot get attributes of union types")
+        return AttributeHintsView(self._nodes[0])
+
+    def get_attribute_hint(self, name: str) -> "TWrap[Any]":
+        if self.union:
+            raise TypeError("Cannot get attributes of union types")
+        return self._nodes[0].get_attribute_hint(name)
+
+    @locked_cached_property
     def init(self) -> "BoundFWrap[..., Any]":
         if self.union:
             raise TypeError("Cannot get __init__ of union types")
-        return self._nodes[0].init.bind(self)
+        return self.bind_method(self._nodes[0].init)
 
-    @cached_property
+    @locked_cached_property
     def signature(self) -> inspect.Signature:
         if self.union:
             raise TypeError("Cannot get signature of union types")
         return inspect.signature(self._nodes[0].inner_type)
 
-    @cached_property
+    @locked_cached_property
     def parameters(self) -> dict[str, inspect.Parameter]:
         return {**self.signature.parameters}
 
-    @cached_property
+    @locked_cached_property
     def inner_type(self) -> Any:
         if self.union:
             raise TypeError("Cannot get inner type of union types")
         return self._nodes[0].inner_type
 
-    @cached_property
+    @locked_cached_property
     def generic_params(self) -> "tuple[TWrap[Any], ...]":
         if self.union:
             raise TypeError("Cannot get generic params of union types")
@@ -390,18 +655,125 @@ class TWrap[T]:
     def get_method(self, method_name: str) -> "BoundFWrap[..., Any]":
         if self.union:
             raise TypeError("Cannot get methods of union types")
-        if method_name in self._method_cache:
-            return self._method_cache[method_name]
-        return self._nodes[0].get_method(method_name).bind(self)
+        if self._method_cache is not None and (bound := self._method_cache.get(method_name)) is not None:
+            return bound
+        bound = self.bind_method(self._nodes[0].get_method(method_name))
+        return cast("dict[Any, BoundFWrap[..., Any]]", self._method_cache).setdefault(method_name, bound)
+
+    def bind_method[**FuncP, FuncT](self, fwrap: "FWrap[FuncP, FuncT]") -> "BoundFWrap[FuncP, FuncT]":
+        from peritype.fwrap import BoundFWrap
+
+        if (cache := self._method_cache) is None:
+            cache = self._method_cache = {}
+        elif (bound := cache.get(fwrap.func)) is not None:
+            return bound
+        return cache.setdefault(fwrap.func, BoundFWrap(fwrap.func, self, fwrap))
+
+    def substitute(self, mapping: Mapping[TypeVar, Any] | TypeVarMapping) -> "TWrap[Any]":
+        values = {var: value.origin if isinstance(value := mapping[var], TWrap) else value for var in mapping}
+        origins = [_substitute_hint(node.origin, values) for node in self._nodes]
+        if all(origin is node.origin for origin, node in zip(origins, self._nodes, strict=True)):
+            return self
+        hint: Any = origins[0] if len(origins) == 1 else Union[*origins]  # pyright: ignore[reportDeprecated]
+        if self._meta.annotated:
+            hint = Annotated[hint, *self._meta.annotated]
+        if not self._meta.required:
+            hint = NotRequired[hint]
+        return peritype.wrap_type(hint)
 
     def match(self, other: Any) -> bool:
+        if other is self:
+            return True
         other_wrap: TWrap[Any]
         if isinstance(other, TWrap):
-            other_wrap = cast(TWrap[Any], other)
+            other_wrap = cast("TWrap[Any]", other)
         else:
             other_wrap = peritype.wrap_type(other)
+        if not _MATCH_CACHE.enabled:
+            return self._matcher(other_wrap)
+        result = _MATCH_CACHE.get(self, other_wrap)
+        if result is None:
+            result = self._matcher(other_wrap)
+            _MATCH_CACHE.set(self, other_wrap, result)
+        return result
+
+    def compile_matcher(self) -> "Callable[[TWrap[Any]], bool]":
+        return self._matcher
+
+    @locked_cached_property
+    def _matcher(self) -> "Callable[[TWrap[Any]], bool]":
+        return _compile_matcher(self._nodes)
+
+    def check(self, value: Any, *, sample: int | None = None) -> bool:
+        return self.validator(sample=sample)(value)
+
+    def validator(self, *, sample: int | None = None) -> Callable[[Any], bool]:
+        validators = self._validators
+        if (validator := validators.get(sample)) is None:
+            validator = validators.setdefault(sample, compile_validator(self, sample))
+        return validator
+
+    @locked_cached_property
+    def _validators(self) -> dict[int | None, Callable[[Any], bool]]:
+        return {}
+
+
+def _match_anything(other: TWrap[Any]) -> bool:
+    return True
+
+
+def _compile_matcher(nodes: tuple[TypeNode[Any], ...]) -> Callable[[TWrap[Any]], bool]:
+    if len(nodes) == 1 and not nodes[0]._origin_params:
+        return _compile_flat_matcher(nodes[0])
+    table: dict[int, list[TypeNode[Any]]] = {}
+    for node in nodes:
+        if node._origin is Any or node._origin is Ellipsis:
+            return _match_anything
+        table.setdefault(id(node._inner_type), []).append(node)
+
+    def match(other: TWrap[Any]) -> bool:
+        for b in other._nodes:
+            if b._origin is Any or b._origin is Ellipsis:
+                return True
+            candidates = table.get(id(b._inner_type))
+            if candidates is None:
+                continue
+            for a in candidates:
+                if len(a._origin_params) != len(b._origin_params):
+                    continue
+                if not a._origin_params:
+                    return True
+                params = b._generic_params
+                if params is None:
+                    params = b.generic_params
+                for i, matcher in enumerate(a._param_matchers):
+                    if not matcher(params[i]):
+                        break
+                else:
+                    return True
+        return False
+
+    return match
+
+
+def _compile_flat_matcher(node: TypeNode[Any]) -> Callable[[TWrap[Any]], bool]:
+    inner_type = node._inner_type
+    if node._origin is Any or node._origin is Ellipsis:
+        return _match_anything
 
-        for a in self._nodes:
-            if a.match(other_wrap):
+    def match(other: TWrap[Any]) -> bool:
+        for b in other._nodes:
+            if b._inner_type is inner_type and not b._origin_params:
+                return True
+            if b._origin is Any or b._origin is Ellipsis:
                 return True
         return False
+
+    return match
+
+
+_interned_nodes = _InternTable[TypeNode[Any]]()
+_interned_twraps = _InternTable[TWrap[Any]]()
+_spelled_nodes = _InternTable[TypeNode[Any]]()
+_spelled_twraps = _InternTable[TWrap[Any]]()
+_MATCH_CACHE = MatchCache[TWrap[Any]]()
@@ -7,6 +7,7 @@ from typing import (
     ForwardRef,
     NotRequired,
     ParamSpec,
+    Required,
     TypeAliasType,
     TypeVar,
     Union,  # pyright: ignore[reportDeprecated]
@@ -19,19 +20,23 @@ from peritype.mapping import TypeVarMapping
 from peritype.twrap import TWrapMeta
 
 
-def unpack_annotations(cls: Any, meta: TWrapMeta) -> Any:
+def unpack_annotations(
+    cls: Any,
+    annotated: tuple[Any, ...] = (),
+    required: bool = True,
+) -> tuple[Any, TWrapMeta]:
     if isinstance(cls, TypeAliasType):
-        return unpack_annotations(cls.__value__, meta)
+        return unpack_annotations(cls.__value__, annotated, required)
     origin = get_origin(cls)
     if origin is Annotated:
-        cls, *annotated = get_args(cls)
-        meta.annotated = (*annotated,)
-        return unpack_annotations(cls, meta)
+        cls, *metadata = get_args(cls)
+        return unpack_annotations(cls, (*metadata,), required)
     if origin is NotRequired:
-        meta.required = False
-        return unpack_annotations(get_args(cls)[0], meta)
-    meta.total = getattr(cls, "__total__", True)
-    return cls
+        return unpack_annotations(get_args(cls)[0], annotated, False)
+    if origin is Required:
+        return unpack_annotations(get_args(cls)[0], annotated, True)
+    total = getattr(cls, "__total__", True)
+    return cls, TWrapMeta(annotated=annotated, required=required, total=total)
 
 
 def unpack_union(cls: Any) -> tuple[Any, ...]:
@@ -78,12 +83,6 @@ def get_generics[GenT](
     return _cls, ()
 
 
-def use_cache(value: bool) -> None:
-    from peritype import wrap
-
-    wrap.USE_CACHE = value
-
-
 def fill_params_in(cls_: type[Any], vars: tuple[Any, ...]) -> tuple[type[Any], tuple[Any, ...]]:
     params: tuple[Any, ...] = getattr(cls_, "__type_params__", None) or getattr(cls_, "__parameters__", None) or ()
     if cls_ in BUILTIN_PARAM_COUNT:
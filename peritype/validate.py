@@ -0,0 +1,168 @@
+import collections.abc
+import itertools
+from collections.abc import Callable, Collection, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, is_typeddict
+
+if TYPE_CHECKING:
+    from peritype.twrap import TWrap, TypeNode
+
+type Validator = Callable[[Any], bool]
+
+
+def compile_validator(twrap: "TWrap[Any]", sample: int | None = None) -> Validator:
+    if sample is not None and sample < 1:
+        raise ValueError("Sample size must be positive")
+    classes: list[type[Any]] = []
+    validators: list[Validator] = []
+    for node in twrap.nodes:
+        validator = _compile_node(node, sample)
+        if validator is None:
+            return _accept
+        if isinstance(validator, type):
+            classes.append(validator)
+        else:
+            validators.append(validator)
+    simple = (*classes,)
+    if not validators:
+        return lambda value: isinstance(value, simple)
+    if not simple and len(validators) == 1:
+        return validators[0]
+
+    def validate(value: Any) -> bool:
+        if isinstance(value, simple):
+            return True
+        for validator in validators:
+            if validator(value):
+                return True
+        return False
+
+    return validate
+
+
+def _accept(value: Any) -> bool:
+    return True
+
+
+def _compile_node(node: "TypeNode[Any]", sample: int | None) -> Validator | type[Any] | None:
+    origin = node.origin
+    inner_type: Any = node.inner_type
+    if origin is Any or origin is Ellipsis or isinstance(origin, TypeVar):
+        return None
+    if inner_type is Literal:
+        return _compile_literal(node.origin_params)
+    if is_typeddict(inner_type):
+        return _compile_typed_dict(node, sample)
+    if not isinstance(inner_type, type) or _is_static_protocol(inner_type):
+        return None
+    params = node.origin_params
+    if not params or all(p is Any for p in params):
+        return inner_type
+    if inner_type is tuple:
+        return _compile_tuple(node, sample)
+    if inner_type is type:
+        return _compile_type(node)
+    if issubclass(inner_type, Mapping) and len(params) == 2:
+        return _compile_mapping(inner_type, node, sample)
+    if issubclass(inner_type, Collection) and len(params) == 1:
+        return _compile_collection(inner_type, node, sample)
+    return inner_type
+
+
+def _is_static_protocol(cls: type[Any]) -> bool:
+    return getattr(cls, "_is_protocol", False) and not getattr(cls, "_is_runtime_protocol", False)
+
+
+def _compile_literal(values: tuple[Any, ...]) -> Validator:
+    allowed = {(type(v), v) for v in values}
+
+    def validate(value: Any) -> bool:
+        try:
+            return (type(value), value) in allowed
+        except TypeError:
+            return False
+
+    return validate
+
+
+def _compile_collection(cls: type[Any], node: "TypeNode[Any]", sample: int | None) -> Validator:
+    element = node.generic_params[0].validator(sample=sample)
+    if element is _accept:
+        return cls
+
+    def validate(value: Any) -> bool:
+        return isinstance(value, cls) and all(map(element, _sampled(value, sample)))
+
+    return validate
+
+
+def _compile_mapping(cls: type[Any], node: "TypeNode[Any]", sample: int | None) -> Validator:
+    key_param, value_param = node.generic_params
+    key = key_param.validator(sample=sample)
+    item = value_param.validator(sample=sample)
+    if key is _accept and item is _accept:
+        return cls
+
+    def validate(value: Any) -> bool:
+        if not isinstance(value, cls):
+            return False
+        for k, v in _sampled(value.items(), sample):
+            if not key(k) or not item(v):
+                return False
+        return True
+
+    return validate
+
+
+def _compile_tuple(node: "TypeNode[Any]", sample: int | None) -> Validator:
+    params = node.generic_params
+    if len(params) == 2 and node.origin_params[1] is Ellipsis:
+        return _compile_collection(tuple, node, sample)
+    elements = (*(param.validator(sample=sample) for param in params),)
+    length = len(elements)
+
+    def validate(value: Any) -> bool:
+        if not isinstance(value, tuple) or len(value) != length:  # pyright: ignore[reportUnknownArgumentType]
+            return False
+        for i, element in enumerate(elements):
+            if not element(value[i]):
+                return False
+        return True
+
+    return validate
+
+
+def _compile_type(node: "TypeNode[Any]") -> Validator | type[Any]:
+    bases: list[type[Any]] = []
+    for param_node in node.generic_params[0].nodes:
+        if not isinstance(param_node.inner_type, type) or param_node.origin is Any:
+            return type
+        bases.append(param_node.inner_type)
+    allowed = (*bases,)
+    return lambda value: isinstance(value, type) and issubclass(value, allowed)
+
+
+def _compile_typed_dict(node: "TypeNode[Any]", sample: int | None) -> Validator:
+    required: frozenset[str] = node.inner_type.__required_keys__  # pyright: ignore[reportAttributeAccessIssue]
+    fields: dict[str, Validator] | None = None
+
+    def validate(value: Any) -> bool:
+        nonlocal fields
+        if not isinstance(value, dict) or not required <= value.keys():
+            return False
+        if fields is None:
+            fields = {name: hint.validator(sample=sample) for name, hint in node.attribute_hints.items()}
+        for name, field in fields.items():
+            if name in value and not field(value[name]):
+                return False
+        return True
+
+    return validate
+
+
+def _sampled[E](values: Collection[E], sample: int | None) -> Collection[E] | collections.abc.Iterator[E]:
+    size = len(values)
+    if sample is None or size <= sample:
+        return values
+    if isinstance(values, Sequence):
+        return [values[i * size // sample] for i in range(sample)]
+    return itertools.islice(values, sample)
@@ -0,0 +1,188 @@
+import asyncio
+import importlib
+import inspect
+import os
+import pkgutil
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Any
+
+import peritype
+from peritype import FWrap, TWrap, persist
+
+type WarmupTarget = ModuleType | str
+
+
+class WarmupReport:
+    def __init__(self) -> None:
+        self.types: list[TWrap[Any]] = []
+        self.functions: list[FWrap[..., Any]] = []
+        self.failures: list[tuple[str, Exception]] = []
+        self.module_seconds: dict[str, float] = {}
+        self.seconds = 0.0
+
+    def merge(self, other: "WarmupReport") -> None:
+        self.types.extend(other.types)
+        self.functions.extend(other.functions)
+        self.failures.extend(other.failures)
+        self.module_seconds |= other.module_seconds
+
+    def __repr__(self) -> str:
+        return (
+            f"<WarmupReport {len(self.types)} types, {len(self.functions)} functions, "
+            f"{len(self.failures)} failures in {self.seconds:.3f}s>"
+        )
+
+
+def warmup(
+    targets: WarmupTarget | Iterable[WarmupTarget],
+    *,
+    workers: int | None = None,
+    pin: bool = False,
+) -> WarmupReport:
+    start = time.perf_counter()
+    report = WarmupReport()
+    modules = [*_iter_modules(targets, report)]
+    if workers is None:
+        workers = (os.cpu_count() or 1) if not _gil_enabled() else 1
+    if workers > 1 and len(modules) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for partial in executor.map(lambda m: _warm_module(m, pin=pin), modules):
+                report.merge(partial)
+    else:
+        for module in modules:
+            report.merge(_warm_module(module, pin=pin))
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+async def warmup_async(
+    targets: WarmupTarget | Iterable[WarmupTarget],
+    *,
+    slice_seconds: float = 0.005,
+    pin: bool = False,
+) -> WarmupReport:
+    if slice_seconds <= 0:
+        raise ValueError("Slice budget must be positive")
+    start = time.perf_counter()
+    report = WarmupReport()
+    deadline = start + slice_seconds
+    modules = _iter_modules(targets, report)
+    while (module := next(modules, None)) is not None:
+        seconds = 0.0
+        for name, step in _iter_module_steps(module, pin=pin):
+            step_start = time.perf_counter()
+            _run_step(report, name, step)
+            now = time.perf_counter()
+            seconds += now - step_start
+            if now >= deadline:
+                await asyncio.sleep(0)
+                deadline = time.perf_counter() + slice_seconds
+        report.module_seconds[module.__name__] = seconds
+        if time.perf_counter() >= deadline:
+            await asyncio.sleep(0)
+            deadline = time.perf_counter() + slice_seconds
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def _warm_module(module: ModuleType, *, pin: bool = False) -> WarmupReport:
+    report = WarmupReport()
+    start = time.perf_counter()
+    for name, step in _iter_module_steps(module, pin=pin):
+        _run_step(report, name, step)
+    report.module_seconds[module.__name__] = time.perf_counter() - start
+    return report
+
+
+def _iter_module_steps(module: ModuleType, *, pin: bool = False) -> Iterator[tuple[str, Callable[[], Any]]]:
+    for obj in [*vars(module).values()]:
+        if getattr(obj, "__module__", None) != module.__name__:
+            continue
+        if isinstance(obj, type):
+            yield from _iter_class_steps(obj, pin)
+        elif inspect.isfunction(obj):
+            yield _qualified(obj), lambda func=obj: _warm_function(func)
+
+
+def _iter_class_steps(cls: type[Any], pin: bool) -> Iterator[tuple[str, Callable[[], Any]]]:
+    yield _qualified(cls), lambda: _warm_class(cls, pin)
+    for name, member in [*vars(cls).items()]:
+        if isinstance(member, type) and member.__qualname__ == f"{cls.__qualname__}.{name}":
+            yield from _iter_class_steps(member, pin)
+        elif name != "__init__" and (isinstance(member, staticmethod | classmethod) or inspect.isfunction(member)):
+            yield f"{_qualified(cls)}.{name}", lambda name=name: _warm_method(cls, name)
+
+
+def _run_step(report: WarmupReport, name: str, step: Callable[[], Any]) -> None:
+    try:
+        warmed = step()
+    except Exception as error:  # noqa: BLE001
+        report.failures.append((name, error))
+        return
+    if isinstance(warmed, TWrap):
+        report.types.append(warmed)
+    elif isinstance(warmed, FWrap):
+        report.functions.append(warmed)
+
+
+def _warm_class(cls: type[Any], pin: bool) -> TWrap[Any]:
+    persist.get_type_hints(cls)
+    twrap = peritype.pin_type(cls) if pin else peritype.wrap_type(cls)
+    _ = twrap.attribute_hints
+    for node in twrap.nodes:
+        _ = node.bases
+    if "__init__" in vars(cls):
+        twrap.init.get_signature_hints()
+    return twrap
+
+
+def _warm_method(cls: type[Any], name: str) -> FWrap[..., Any]:
+    method = peritype.wrap_type(cls).get_method(name)
+    method.get_signature_hints()
+    return method
+
+
+def _warm_function(func: Callable[..., Any]) -> FWrap[..., Any]:
+    fwrap = peritype.wrap_func(func)
+    fwrap.get_signature_hints()
+    return fwrap
+
+
+def _iter_modules(targets: WarmupTarget | Iterable[WarmupTarget], report: WarmupReport) -> Iterator[ModuleType]:
+    if isinstance(targets, ModuleType | str):
+        targets = (targets,)
+    seen = set[str]()
+    for target in targets:
+        try:
+            module = importlib.import_module(target) if isinstance(target, str) else target
+        except Exception as error:  # noqa: BLE001
+            report.failures.append((str(target), error))
+            continue
+        if module.__name__ not in seen:
+            seen.add(module.__name__)
+            yield module
+        if not hasattr(module, "__path__"):
+            continue
+        for info in pkgutil.walk_packages(module.__path__, f"{module.__name__}.", onerror=lambda _: None):
+            if info.name in seen:
+                continue
+            try:
+                submodule = importlib.import_module(info.name)
+            except Exception as error:  # noqa: BLE001
+                report.failures.append((info.name, error))
+                continue
+            seen.add(info.name)
+            yield submodule
+
+
+def _qualified(obj: Any) -> str:
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def _gil_enabled() -> bool:
+    is_gil_enabled: Callable[[], bool] | None = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled() if is_gil_enabled is not None else True
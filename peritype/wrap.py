@@ -1,15 +1,45 @@
+import contextlib
+import threading
+import time
+import types
 import weakref
-from collections.abc import Callable
-from typing import Any, cast, overload
+from collections.abc import Callable, Hashable, Iterable
+from types import MethodType
+from typing import Annotated, Any, cast, overload
 
-from peritype import FWrap, TWrap
+from peritype import FWrap, TWrap, forward, stats
+from peritype.cache import WrapCache
 from peritype.mapping import TypeVarMapping
-from peritype.twrap import TWrapMeta, TypeNode
+from peritype.sync import SingleFlight
+from peritype.template import clear_templates, substitute
+from peritype.twrap import _MATCH_CACHE, TypeNode  # pyright: ignore[reportPrivateUsage]
 from peritype.utils import fill_params_in, get_generics, unpack_annotations, unpack_union
 
-USE_CACHE = True
-_TWRAP_CACHE: weakref.WeakValueDictionary[Any, TWrap[Any]] = weakref.WeakValueDictionary()
-_FWRAP_CACHE: weakref.WeakValueDictionary[Any, FWrap[..., Any]] = weakref.WeakValueDictionary()
+LAZY_PARAMS = False
+_TWRAP_CACHE = WrapCache[Hashable, TWrap[Any]]()
+_FWRAP_CACHE = WrapCache[Hashable, FWrap[..., Any]]()
+_TWRAP_FLIGHTS = SingleFlight[Hashable, TWrap[Any]]()
+_FWRAP_FLIGHTS = SingleFlight[Hashable, FWrap[..., Any]]()
+_BOUND_CACHE = WrapCache[tuple[Any, int], FWrap[..., Any]]()
+_BOUND_LOCK = threading.Lock()
+_TWRAP_CACHE.on_evict(_MATCH_CACHE.discard)
+_TWRAP_STRONG = _TWRAP_CACHE.strong_entry
+_ANNOTATED: Any = type(Annotated[int, None])
+_PLAIN_KEYS = frozenset((type, types.GenericAlias))
+
+
+def _type_cache_key(cls: Any, lookup: TypeVarMapping | None) -> Hashable:
+    if type(cls) in _PLAIN_KEYS:
+        spelling = cls
+    elif type(cls) is _ANNOTATED:
+        spelling = (_ANNOTATED, cls, (*map(type, cls.__metadata__),))
+    else:
+        spelling = (type(cls), cls)
+    if lookup is not None:
+        params: tuple[Any, ...] | Any = getattr(cls, "__parameters__", None)
+        if isinstance(params, tuple) and params:
+            return (spelling, (*((p, lookup[p]) for p in cast(tuple[Any, ...], params) if p in lookup),))
+    return spelling
 
 
 @overload
@@ -29,32 +59,185 @@ def wrap_type(
     *,
     lookup: TypeVarMapping | None = None,
 ) -> Any:
-    if USE_CACHE and cls in _TWRAP_CACHE:
-        return _TWRAP_CACHE[cls]
-    meta = TWrapMeta(annotated=tuple[Any](), required=True, total=True)
-    unpacked: Any = unpack_annotations(cls, meta)
+    if lookup is not None or (kind := type(cls)) is _ANNOTATED:
+        key = _type_cache_key(cls, lookup)
+    else:
+        key = cls if kind in _PLAIN_KEYS else (kind, cls)
+    try:
+        entry = _TWRAP_STRONG(key)
+        if entry is not None and not stats.ENABLED and _TWRAP_CACHE.enabled:
+            entry.used = True
+            return entry.value
+        cached = _TWRAP_CACHE.get(key)
+    except TypeError:
+        return _build_type(cls, lookup)
+    if cached is not None:
+        return cached
+    return _build_missing_type(key, cls, lookup)
+
+
+def wrap_types(types: Iterable[Any], *, lookup: TypeVarMapping | None = None) -> list[TWrap[Any]]:
+    memo: dict[Hashable, TWrap[Any]] = {}
+    return [_wrap_batched(cls, lookup, memo) for cls in types]
+
+
+def _wrap_batched(cls: Any, lookup: TypeVarMapping | None, memo: dict[Hashable, TWrap[Any]]) -> TWrap[Any]:
+    key = _type_cache_key(cls, lookup)
+    try:
+        if (twrap := memo.get(key)) is not None:
+            return twrap
+        twrap = _TWRAP_CACHE.get(key)
+    except TypeError:
+        return _build_type(cls, lookup, memo)
+    if twrap is None:
+        twrap = _TWRAP_FLIGHTS.do(key, lambda: _build_cached_type(key, cls, lookup, memo))
+    memo[key] = twrap
+    return twrap
+
+
+def _build_missing_type(key: Hashable, cls: Any, lookup: TypeVarMapping | None) -> TWrap[Any]:
+    return _TWRAP_FLIGHTS.do(key, lambda: _build_cached_type(key, cls, lookup))
+
+
+def _build_cached_type(
+    key: Hashable,
+    cls: Any,
+    lookup: TypeVarMapping | None,
+    memo: dict[Hashable, TWrap[Any]] | None = None,
+) -> TWrap[Any]:
+    if (cached := _TWRAP_CACHE.peek(key)) is not None:
+        return cached
+    twrap = _build_type(cls, lookup, memo)
+    _TWRAP_CACHE.set(key, twrap)
+    return twrap
+
+
+def _build_type(
+    cls: Any,
+    lookup: TypeVarMapping | None,
+    memo: dict[Hashable, TWrap[Any]] | None = None,
+) -> TWrap[Any]:
+    start = time.perf_counter() if stats.ENABLED else 0.0
+    unpacked, meta = unpack_annotations(cls)
     nodes = unpack_union(unpacked)
     wrapped_nodes: list[Any] = []
     for node in nodes:
         if node in (None, type(None)):
             node = type(None)
-        root, vars = get_generics(node, lookup, True, True)
-        root, vars = fill_params_in(root, vars)
-        wrapped_vars = (*(wrap_type(var) for var in vars),)
+        root, vars = stats.timed("get_generics", get_generics, node, lookup, True, True)
+        if lookup is not None:
+            vars = (*(substitute(var, lookup) for var in vars),)
+        root, vars = stats.timed("fill_params_in", fill_params_in, root, vars)
+        if LAZY_PARAMS and vars:
+            wrapped_vars = None
+        elif memo is not None:
+            wrapped_vars = (*(_wrap_batched(var, None, memo) for var in vars),)
+        else:
+            wrapped_vars = (*(wrap_type(var) for var in vars),)
         wrapped_node = TypeNode(node, wrapped_vars, root, vars)
         wrapped_nodes.append(wrapped_node)
     twrap = cast(TWrap[Any], TWrap(origin=cls, nodes=(*wrapped_nodes,), meta=meta))
-    if USE_CACHE:
-        _TWRAP_CACHE[cls] = twrap
+    if stats.ENABLED:
+        stats.record_build("wrap_type", twrap, time.perf_counter() - start)
     return twrap
 
 
 def wrap_func[**FuncP, FuncT](
     func: Callable[FuncP, FuncT],
 ) -> FWrap[FuncP, FuncT]:
-    if USE_CACHE and func in _FWRAP_CACHE:
-        return _FWRAP_CACHE[func]
+    if isinstance(func, staticmethod | classmethod):
+        func = cast(Callable[FuncP, FuncT], func.__func__)
+    elif isinstance(func, MethodType) and _BOUND_CACHE.enabled:
+        key = (func.__func__, id(func.__self__))
+        if (cached := _BOUND_CACHE.get(key)) is not None:
+            return cached
+        with contextlib.suppress(TypeError):
+            return _build_bound_func(key, func)
+    if (cached := _FWRAP_CACHE.get(func)) is not None:
+        return cached
+    return _FWRAP_FLIGHTS.do(func, lambda: _build_cached_func(func))
+
+
+def wrap_funcs(funcs: Iterable[Callable[..., Any]]) -> list[FWrap[..., Any]]:
+    memo: dict[Callable[..., Any], FWrap[..., Any]] = {}
+    wrapped: list[FWrap[..., Any]] = []
+    for func in funcs:
+        if (fwrap := memo.get(func)) is None:
+            fwrap = memo[func] = wrap_func(func)
+        wrapped.append(fwrap)
+    return wrapped
+
+
+def _build_cached_func(func: Callable[..., Any]) -> FWrap[..., Any]:
+    if (cached := _FWRAP_CACHE.peek(func)) is not None:
+        return cached
+    start = time.perf_counter() if stats.ENABLED else 0.0
     fwrap = FWrap(func)
-    if USE_CACHE:
-        _FWRAP_CACHE[func] = fwrap
+    _FWRAP_CACHE.set(func, fwrap)
+    if stats.ENABLED:
+        stats.record_build("wrap_func", fwrap, time.perf_counter() - start)
     return fwrap
+
+
+def _build_bound_func(key: tuple[Any, int], method: MethodType) -> FWrap[..., Any]:
+    with _BOUND_LOCK:
+        if (cached := _BOUND_CACHE.peek(key)) is not None:
+            return cached
+        weakref.finalize(method.__self__, _BOUND_CACHE.evict, key)
+        start = time.perf_counter() if stats.ENABLED else 0.0
+        fwrap = FWrap(method)
+        _BOUND_CACHE.set(key, fwrap)
+    if stats.ENABLED:
+        stats.record_build("wrap_func", fwrap, time.perf_counter() - start)
+    return fwrap
+
+
+def use_lazy_params(value: bool) -> None:
+    global LAZY_PARAMS
+    LAZY_PARAMS = value
+
+
+def configure_cache(*, enabled: bool | None = None, maxsize: int | None = None) -> None:
+    for cache in (_TWRAP_CACHE, _FWRAP_CACHE, _BOUND_CACHE):
+        if enabled is not None:
+            cache.enabled = enabled
+        if maxsize is not None:
+            cache.resize(maxsize)
+
+
+def configure_match_cache(*, enabled: bool | None = None, maxsize: int | None = None) -> None:
+    if enabled is not None:
+        _MATCH_CACHE.enabled = enabled
+    if maxsize is not None:
+        _MATCH_CACHE.resize(maxsize)
+
+
+def pin_type(cls: Any, *, lookup: TypeVarMapping | None = None) -> TWrap[Any]:
+    twrap = wrap_type(cls, lookup=lookup)
+    _TWRAP_CACHE.pin(_type_cache_key(cls, lookup), twrap)
+    return twrap
+
+
+def unpin_type(cls: Any, *, lookup: TypeVarMapping | None = None) -> None:
+    with contextlib.suppress(TypeError):
+        _TWRAP_CACHE.unpin(_type_cache_key(cls, lookup))
+
+
+def evict_type(cls: Any, *, lookup: TypeVarMapping | None = None) -> bool:
+    try:
+        return _TWRAP_CACHE.evict(_type_cache_key(cls, lookup))
+    except TypeError:
+        return False
+
+
+def clear_cache() -> None:
+    clear_templates()
+    forward.invalidate()
+    _TWRAP_CACHE.clear()
+    _FWRAP_CACHE.clear()
+    _BOUND_CACHE.clear()
+    _MATCH_CACHE.clear()
+
+
+def clear_match_cache() -> None:
+    _MATCH_CACHE.clear()
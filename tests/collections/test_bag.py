@@ -1,5 +1,7 @@
 from typing import Any
 
+import pytest
+
 from peritype.collections import TypeBag
 from peritype.wrap import wrap_type
 
@@ -64,3 +66,145 @@ def test_match_union() -> None:
     assert twrap_int not in bag
     assert bag.contains_matching(twrap_int)
     assert bag.get_matching(twrap_int) == twrap_union
+
+
+def test_match_nested_generics() -> None:
+    bag = TypeBag()
+
+    class TestType[T]: ...
+
+    class Other: ...
+
+    twrap_list = wrap_type(TestType[list[int]])
+    twrap_dict = wrap_type(TestType[dict[str, int | None]])
+    bag.add(twrap_list)
+    bag.add(twrap_dict)
+    bag.add(wrap_type(TestType[list[str]]))
+
+    assert bag.get_matching(wrap_type(TestType[list[int | Other]])) == twrap_list
+    assert bag.get_matching(wrap_type(TestType[dict[str, None]])) == twrap_dict
+    assert bag.get_matching(wrap_type(TestType[dict[int, int]])) is None
+    assert bag.get_matching(wrap_type(TestType[list[Other]])) is None
+    assert bag.get_all(wrap_type(TestType[dict[Any, Any]])) == {twrap_dict}
+    assert bag.get_all(wrap_type(TestType[list[Any]])) == {twrap_list, wrap_type(TestType[list[str]])}
+
+
+def test_match_wildcard_entries() -> None:
+    bag = TypeBag()
+
+    class TestType[T]: ...
+
+    twrap_any = wrap_type(TestType[dict[str, Any]])
+    twrap_tuple = wrap_type(TestType[tuple[int, ...]])
+    bag.add(twrap_any)
+    bag.add(twrap_tuple)
+
+    assert bag.get_matching(wrap_type(TestType[dict[str, list[int]]])) == twrap_any
+    assert bag.get_matching(wrap_type(TestType[dict[int, list[int]]])) is None
+    assert bag.get_matching(wrap_type(TestType[tuple[int, str]])) == twrap_tuple
+    assert bag.get_all(wrap_type(TestType[Any])) == {twrap_any, twrap_tuple}
+
+
+def test_cached_results_invalidated_on_add() -> None:
+    bag = TypeBag()
+
+    class TestType[T]: ...
+
+    class Other: ...
+
+    query = wrap_type(TestType[int | str])
+    assert bag.get_matching(query) is None
+    assert bag.get_all(wrap_type(TestType[Any])) == set()
+
+    bag.add(wrap_type(Other))
+    assert query in bag._matching  # pyright: ignore[reportPrivateUsage]
+
+    bag.add(wrap_type(TestType[str]))
+    assert bag.get_matching(query) == wrap_type(TestType[str])
+    assert bag.get_all(wrap_type(TestType[Any])) == {wrap_type(TestType[str])}
+
+
+def test_copy_cached_results() -> None:
+    bag = TypeBag()
+
+    class TestType[T]: ...
+
+    query = wrap_type(TestType[int | str])
+    assert bag.get_matching(query) is None
+
+    new_bag = bag.copy()
+    assert new_bag.get_matching(query) is None
+    new_bag.add(wrap_type(TestType[int]))
+
+    assert new_bag.get_matching(query) == wrap_type(TestType[int])
+    assert bag.get_matching(query) is None
+
+
+def test_remove_from_bag() -> None:
+    bag = TypeBag()
+
+    class TestType[T]: ...
+
+    twrap_int = wrap_type(TestType[int])
+    twrap_any = wrap_type(TestType[list[Any]])
+    bag.add(twrap_int)
+    bag.add(twrap_any)
+    query = wrap_type(TestType[int | str])
+    assert bag.get_matching(query) == twrap_int
+
+    bag.remove(twrap_int)
+    assert twrap_int not in bag
+    assert bag.get_matching(query) is None
+    assert bag.get_all(wrap_type(TestType[Any])) == {twrap_any}
+
+    bag.discard(twrap_int)
+    with pytest.raises(KeyError):
+        bag.remove(twrap_int)
+
+    bag.remove(twrap_any)
+    assert bag.get_all(wrap_type(TestType[Any])) == set()
+    bag.add(twrap_int)
+    assert bag.get_matching(query) == twrap_int
+
+
+def test_copy_is_independent() -> None:
+    bag = TypeBag()
+
+    class TestType[T]: ...
+
+    twrap_int = wrap_type(TestType[int])
+    twrap_str = wrap_type(TestType[str])
+    bag.add(twrap_int)
+
+    new_bag = bag.copy()
+    new_bag.remove(twrap_int)
+    new_bag.add(twrap_str)
+    bag.add(wrap_type(TestType[bytes]))
+
+    assert bag.get_all(wrap_type(TestType[Any])) == {twrap_int, wrap_type(TestType[bytes])}
+    assert new_bag.get_all(wrap_type(TestType[Any])) == {twrap_str}
+    assert new_bag.get_matching(wrap_type(TestType[int | bytes])) is None
+    assert twrap_int not in new_bag
+
+    new_bag.add(twrap_int)
+    assert new_bag.get_matching(wrap_type(TestType[int | bytes])) == twrap_int
+
+
+def test_copy_read_then_mutate() -> None:
+    bag = TypeBag()
+
+    class TestType[T]: ...
+
+    twrap_int = wrap_type(TestType[int])
+    bag.add(twrap_int)
+    query = wrap_type(TestType[Any])
+    entries = bag._bag  # pyright: ignore[reportPrivateUsage]
+
+    new_bag = bag.copy()
+    assert bag._bag is entries  # pyright: ignore[reportPrivateUsage]
+    assert new_bag.get_all(query) == {twrap_int}
+    new_bag.add(wrap_type(TestType[str]))
+    new_bag.remove(twrap_int)
+
+    assert bag.get_all(query) == {twrap_int}
+    assert new_bag.get_all(query) == {wrap_type(TestType[str])}
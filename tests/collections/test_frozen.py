@@ -0,0 +1,106 @@
+from typing import Any
+
+import pytest
+
+from peritype import evict_type, use_lazy_params, wrap_type
+from peritype.collections import TypeBag, TypeMap, TypeSetMap, TypeSuperTree
+from peritype.collections.frozen import footprint
+
+
+def test_freeze_type_map() -> None:
+    map = TypeMap[Any, int]()
+    map[wrap_type(int)] = 1
+    map = map.copy()
+    map[wrap_type(str)] = 2
+
+    frozen = map.freeze()
+    map[wrap_type(float)] = 3
+
+    assert dict(frozen) == {wrap_type(int): 1, wrap_type(str): 2}
+    assert frozen[wrap_type(int)] == 1
+    assert frozen.get(wrap_type(float), default=0) == 0
+    assert len(frozen) == 2
+    assert frozen.freeze() is frozen
+    assert frozen.report.entries == 2
+
+
+def test_freeze_type_set_map() -> None:
+    map = TypeSetMap[Any, int]()
+    map.push(wrap_type(int), 1)
+    map.push(wrap_type(int), 2)
+
+    frozen = map.freeze()
+    map.push(wrap_type(int), 3)
+
+    assert set(frozen[wrap_type(int)]) == {1, 2}
+    assert frozen.count(wrap_type(int)) == 2
+    assert frozen.count(wrap_type(str)) == 0
+    assert frozen.report.saved > 0
+
+
+def test_freeze_type_bag() -> None:
+    bag = TypeBag()
+
+    class TestType[T]: ...
+
+    twrap_int = wrap_type(TestType[int])
+    twrap_any = wrap_type(TestType[list[Any]])
+    bag.add(twrap_int)
+    bag.add(twrap_any)
+    assert bag.get_matching(wrap_type(TestType[str])) is None
+
+    frozen = bag.freeze()
+    bag.add(wrap_type(TestType[str]))
+
+    assert twrap_int in frozen
+    assert wrap_type(TestType[str]) not in frozen
+    assert frozen.get_matching(twrap_int) == twrap_int
+    assert frozen.get_matching(wrap_type(TestType[str])) is None
+    assert frozen.get_matching(wrap_type(TestType[list[int]])) == twrap_any
+    assert frozen.get_all(twrap_any) == {twrap_any}
+    assert frozen.get_all(wrap_type(TestType[Any])) == {twrap_int, twrap_any}
+    assert frozen.get_all(wrap_type(TestType[bytes])) == set()
+    assert frozen.report.entries == 2
+    with pytest.raises(AttributeError):
+        frozen.add(twrap_int)  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_freeze_type_bag_is_read_only() -> None:
+    bag = TypeBag()
+
+    class TestType[T]: ...
+
+    eager = wrap_type(TestType[list[int]])
+    bag.add(eager)
+    frozen = bag.freeze()
+    use_lazy_params(True)
+    try:
+        evict_type(TestType[list[int]])
+        lazy = wrap_type(TestType[list[int]])
+    finally:
+        use_lazy_params(False)
+
+    assert lazy is not eager
+    assert lazy in frozen
+    assert frozen.get_all(lazy) == {lazy}
+    before = footprint(frozen)
+    for cls in (int, str, bytes):
+        assert frozen.get_matching(wrap_type(TestType[cls])) is None
+        assert frozen.get_all(wrap_type(TestType[cls | Any])) == {lazy}
+    assert footprint(frozen) == before
+
+
+def test_freeze_super_tree() -> None:
+    tree = TypeSuperTree()
+
+    class SuperType: ...
+
+    class SubType(SuperType): ...
+
+    tree.add(wrap_type(SubType))
+    frozen = tree.freeze()
+    tree.remove(wrap_type(SubType))
+
+    assert set(frozen[wrap_type(SuperType)]) == {wrap_type(SuperType), wrap_type(SubType)}
+    assert wrap_type(SubType) in frozen
+    assert frozen.report.after < frozen.report.before
@@ -1,4 +1,6 @@
-from typing import Any
+from typing import Any, cast
+
+import pytest
 
 from peritype import wrap_type
 from peritype.collections import TypeMap, TypeSetMap
@@ -63,3 +65,87 @@ def test_type_set_map() -> None:
 
     value = map.get(wrap_type(int))
     assert value is None
+
+
+def test_type_map_copy() -> None:
+    map = TypeMap[Any, int]()
+    map[wrap_type(int)] = 1
+    map[wrap_type(str)] = 2
+
+    new_map = map.copy()
+    new_map[wrap_type(int)] = 3
+    del new_map[wrap_type(str)]
+    new_map[wrap_type(float)] = 4
+    map[wrap_type(bytes)] = 5
+
+    assert dict(map) == {wrap_type(int): 1, wrap_type(str): 2, wrap_type(bytes): 5}
+    assert dict(new_map) == {wrap_type(int): 3, wrap_type(float): 4}
+    assert len(new_map) == 2
+    assert wrap_type(str) not in new_map
+    with pytest.raises(KeyError):
+        del new_map[wrap_type(str)]
+
+
+def test_type_map_copy_chain() -> None:
+    map = TypeMap[Any, int]()
+    types: list[type] = [type(f"TestType{i}", (), {}) for i in range(40)]
+    for i, cls in enumerate(types):
+        map[wrap_type(cls)] = i
+        map = map.copy()
+
+    assert len(map) == 40
+    assert all(map[wrap_type(cls)] == i for i, cls in enumerate(types))
+    assert map._depth <= 16  # pyright: ignore[reportPrivateUsage]
+
+
+def test_type_set_map_copy() -> None:
+    map = TypeSetMap[Any, int]()
+    map.push(wrap_type(int), 1)
+
+    new_map = map.copy()
+    new_map.push(wrap_type(int), 2)
+    map.discard(wrap_type(int), 1)
+
+    assert wrap_type(int) not in map
+    assert new_map[wrap_type(int)] == {1, 2}
+
+
+def test_type_set_map_copy_read_then_mutate() -> None:
+    map = TypeSetMap[Any, int]()
+    map.push(wrap_type(int), 1)
+    content = map._content  # pyright: ignore[reportPrivateUsage]
+
+    new_map = map.copy()
+    assert map._content is content  # pyright: ignore[reportPrivateUsage]
+    new_map[wrap_type(int)].add(2)
+    for _, values in new_map:
+        values.add(3)
+    new_map.push(wrap_type(int), 4)
+    new_map.discard(wrap_type(int), 1)
+
+    assert map._content is content  # pyright: ignore[reportPrivateUsage]
+    assert map[wrap_type(int)] == {1}
+    assert new_map[wrap_type(int)] == {4}
+
+
+def test_type_set_map_reads_are_copies() -> None:
+    map = TypeSetMap[Any, int]()
+    map.push(wrap_type(int), 1)
+
+    map[wrap_type(int)].add(2)
+    cast(set[int], map.get(wrap_type(int))).add(3)
+    for _, values in map:
+        values.add(4)
+    assert map[wrap_type(int)] == {1}
+    assert map[wrap_type(int)] is not map[wrap_type(int)]
+
+    layered = map.copy()
+    layered[wrap_type(int)].add(2)
+    cast(set[int], layered.get(wrap_type(int))).add(3)
+    assert layered[wrap_type(int)] == {1}
+
+    layered.push(wrap_type(str), 5)
+    layered[wrap_type(str)].add(6)
+    layered[wrap_type(int)].add(7)
+    assert dict(layered) == {wrap_type(int): {1}, wrap_type(str): {5}}
+    assert dict(map) == {wrap_type(int): {1}}
@@ -1,5 +1,7 @@
 from typing import Any
 
+import pytest
+
 from peritype import wrap_type
 from peritype.collections import TypeSuperTree
 
@@ -81,3 +83,65 @@ def test_not_fully_defined_not_in_super_tree() -> None:
 
     assert wrap_type(TestType[int]) in tree
     assert wrap_type(TestType[Any]) not in tree
+
+
+def test_diamond_in_super_tree() -> None:
+    tree = TypeSuperTree()
+
+    class Root: ...
+
+    class Left(Root): ...
+
+    class Right(Root): ...
+
+    class Leaf(Left, Right): ...
+
+    tree.add(wrap_type(Leaf))
+
+    assert tree[wrap_type(Root)] == {wrap_type(Root), wrap_type(Left), wrap_type(Right), wrap_type(Leaf)}
+    assert tree[wrap_type(Left)] == {wrap_type(Left), wrap_type(Leaf)}
+    assert tree[wrap_type(Right)] == {wrap_type(Right), wrap_type(Leaf)}
+
+
+def test_remove_from_super_tree() -> None:
+    tree = TypeSuperTree()
+
+    class SuperType: ...
+
+    class SubType(SuperType): ...
+
+    class OtherType(SuperType): ...
+
+    tree.add(wrap_type(SubType))
+    tree.add(wrap_type(OtherType))
+    tree.remove(wrap_type(SubType))
+
+    assert wrap_type(SubType) not in tree
+    assert tree[wrap_type(SuperType)] == {wrap_type(SuperType), wrap_type(OtherType)}
+
+    tree.remove(wrap_type(SuperType))
+    assert tree[wrap_type(SuperType)] == {wrap_type(OtherType)}
+    with pytest.raises(KeyError):
+        tree.remove(wrap_type(SuperType))
+
+    tree.remove(wrap_type(OtherType))
+    assert wrap_type(SuperType) not in tree
+    assert wrap_type(OtherType) not in tree
+
+
+def test_copy_super_tree() -> None:
+    tree = TypeSuperTree()
+
+    class SuperType: ...
+
+    class SubType(SuperType): ...
+
+    class OtherType(SuperType): ...
+
+    tree.add(wrap_type(SubType))
+    new_tree = tree.copy()
+    new_tree.add(wrap_type(OtherType))
+    tree.remove(wrap_type(SubType))
+
+    assert tree[wrap_type(SuperType)] == {wrap_type(SuperType)}
+    assert new_tree[wrap_type(SuperType)] == {wrap_type(SuperType), wrap_type(SubType), wrap_type(OtherType)}
@@ -0,0 +1,246 @@
+import gc
+from typing import Any
+
+import pytest
+
+from peritype import (
+    clear_cache,
+    clear_match_cache,
+    configure_cache,
+    configure_match_cache,
+    evict_type,
+    pin_type,
+    stats,
+    unpin_type,
+    wrap_func,
+    wrap_type,
+)
+from peritype.cache import MatchCache, WrapCache
+
+
+class _Value:
+    pass
+
+
+def test_cache_lru_keeps_strong_references() -> None:
+    cache = WrapCache[str, _Value](maxsize=2)
+    cache.set("a", _Value())
+    cache.set("b", _Value())
+    assert cache.get("a") is not None
+    cache.set("c", _Value())
+    gc.collect()
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_cache_pin() -> None:
+    cache = WrapCache[str, _Value](maxsize=1)
+    cache.pin("a", _Value())
+    cache.set("b", _Value())
+    cache.set("c", _Value())
+    gc.collect()
+
+    assert cache.is_pinned("a")
+    assert "a" in cache
+    assert "b" not in cache
+
+    cache.unpin("a")
+    cache.set("d", _Value())
+    gc.collect()
+    assert "a" not in cache
+
+
+def test_cache_evict() -> None:
+    cache = WrapCache[str, _Value]()
+    value = _Value()
+    cache.pin("a", value)
+
+    assert cache.evict("a")
+    assert "a" not in cache
+    assert not cache.is_pinned("a")
+    assert not cache.evict("a")
+
+
+def test_cache_disabled() -> None:
+    cache = WrapCache[str, _Value]()
+    cache.enabled = False
+    value = _Value()
+    cache.set("a", value)
+    assert cache.get("a") is None
+
+
+def test_cache_negative_size() -> None:
+    with pytest.raises(ValueError):
+        WrapCache[str, _Value](maxsize=-1)
+
+
+def test_wrap_type_cache_depends_on_lookup() -> None:
+    class Super[T]:
+        pass
+
+    class Child[T](Super[T]):
+        pass
+
+    int_base = wrap_type(Child[int])[0].bases[0]
+    str_base = wrap_type(Child[str])[0].bases[0]
+
+    assert int_base.match(Super[int])
+    assert str_base.match(Super[str])
+    assert not str_base.match(Super[int])
+
+
+def _type_cache_hits() -> int:
+    return stats.snapshot()["caches"]["wrap_type"]["hits"]
+
+
+def test_wrap_type_evict() -> None:
+    class TestType:
+        pass
+
+    _ = wrap_type(TestType)
+    assert evict_type(TestType)
+    assert not evict_type(TestType)
+
+    stats.enable()
+    try:
+        hits = _type_cache_hits()
+        _ = wrap_type(TestType)
+        assert _type_cache_hits() == hits
+    finally:
+        stats.disable()
+
+
+def test_wrap_type_pin() -> None:
+    class TestType:
+        pass
+
+    pin_type(TestType)
+    configure_cache(maxsize=0)
+    stats.enable()
+    try:
+        gc.collect()
+        hits = _type_cache_hits()
+        _ = wrap_type(TestType)
+        assert _type_cache_hits() == hits + 1
+    finally:
+        stats.disable()
+        unpin_type(TestType)
+        configure_cache(maxsize=1024)
+
+
+def test_configure_cache_disabled() -> None:
+    class TestType:
+        pass
+
+    configure_cache(enabled=False)
+    try:
+        _ = wrap_type(TestType)
+        assert not evict_type(TestType)
+    finally:
+        configure_cache(enabled=True)
+    _ = wrap_type(TestType)
+    clear_cache()
+    assert not evict_type(TestType)
+
+
+def test_bound_func_cache() -> None:
+    class TestType:
+        def method(self) -> None: ...
+
+    instances = [TestType() for _ in range(4)]
+    configure_cache(maxsize=2)
+    try:
+        clear_cache()
+        fwraps = [wrap_func(instance.method) for instance in instances]
+        info = stats.snapshot()["caches"]["bound_func"]
+        assert info["entries"] == 4
+        assert info["strong_entries"] == 2
+        assert info["maxsize"] == 2
+        del fwraps
+        gc.collect()
+        assert stats.snapshot()["caches"]["bound_func"]["entries"] == 2
+        clear_cache()
+        assert stats.snapshot()["caches"]["bound_func"]["entries"] == 0
+    finally:
+        configure_cache(maxsize=1024)
+
+
+def test_match_cache_lru() -> None:
+    cache = MatchCache[_Value](maxsize=2)
+    a, b, c = _Value(), _Value(), _Value()
+    cache.set(a, b, True)
+    cache.set(a, c, False)
+    assert cache.get(a, b) is True
+    cache.set(b, c, True)
+
+    assert cache.get(a, c) is None
+    assert cache.get(a, b) is True
+    assert cache.get(b, c) is True
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_match_cache_discard() -> None:
+    cache = MatchCache[_Value]()
+    a, b, c = _Value(), _Value(), _Value()
+    cache.set(a, b, True)
+    cache.set(c, a, False)
+    cache.set(b, c, True)
+    cache.discard(a)
+
+    assert len(cache) == 1
+    assert cache.get(b, c) is True
+    cache.clear()
+    assert len(cache) == 0
+
+
+def _match_info() -> dict[str, Any]:
+    return stats.snapshot()["caches"]["match"]
+
+
+def test_wrap_match_cache() -> None:
+    class TestType[T]:
+        pass
+
+    configure_match_cache(enabled=True)
+    try:
+        twrap = wrap_type(TestType[int] | None)
+        other = wrap_type(TestType[int])
+        clear_match_cache()
+        stats.reset()
+        assert twrap.match(other)
+        assert twrap.match(other)
+        assert not twrap.match(TestType[str])
+        assert _match_info()["hits"] == 1
+        assert _match_info()["entries"] == 2
+
+        assert evict_type(TestType[int])
+        assert _match_info()["entries"] == 1
+        clear_cache()
+        assert _match_info()["entries"] == 0
+    finally:
+        configure_match_cache(enabled=False)
+
+
+def test_cache_evict_listener_only_when_entry_leaves() -> None:
+    cache = WrapCache[str, _Value](maxsize=1)
+    evicted: list[_Value] = []
+    cache.on_evict(evicted.append)
+    a, b = _Value(), _Value()
+    cache.set("a", a)
+    cache.set("b", b)
+
+    assert "a" in cache
+    assert evicted == []
+    assert cache.evictions == 0
+
+    del a
+    cache.set("c", _Value())
+    gc.collect()
+    assert "a" not in cache
+    assert cache.evictions == 1
+
+    assert cache.evict("b")
+    assert evicted == [b]
+    assert cache.evictions == 2
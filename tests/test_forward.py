@@ -0,0 +1,116 @@
+import importlib
+import sys
+import threading
+import typing
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from peritype import clear_cache, compat, forward, persist, wrap_func, wrap_type
+from peritype.template import clear_templates
+
+SOURCE = """
+from __future__ import annotations
+
+
+class Item:
+    pass
+
+
+class Model:
+    items: list[Item]
+    parent: Model | None
+
+
+class Other:
+    Alias = int
+    items: list[Alias]
+
+
+class Another:
+    Alias = str
+    items: list[Alias]
+
+
+class Box[T]:
+    items: list[T]
+
+
+def build(items: list[Item]) -> Model: ...
+"""
+
+
+@pytest.fixture
+def module(tmp_path: Path) -> Any:
+    (tmp_path / "forward_models.py").write_text(SOURCE)
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield importlib.import_module("forward_models")
+    finally:
+        sys.path.remove(str(tmp_path))
+        sys.modules.pop("forward_models", None)
+        clear_cache()
+
+
+def test_forward_matches_get_type_hints(module: Any) -> None:
+    for obj in (module.Model, module.Other, module.Another, module.Box, module.build):
+        assert persist.get_type_hints(obj) == typing.get_type_hints(obj)
+
+
+def test_forward_public_fallback(module: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(compat, "_eval_type", None)
+    monkeypatch.setattr(compat, "_type_check", None)
+    forward.invalidate()
+    clear_templates()
+    for obj in (module.Model, module.Other, module.Another, module.Box, module.build):
+        assert persist.get_type_hints(obj) == typing.get_type_hints(obj)
+
+
+def test_forward_shared_across_owners(module: Any) -> None:
+    forward.invalidate()
+    _ = wrap_type(module.Model).attribute_hints
+    _ = wrap_func(module.build).get_signature_hints()
+    _, entries = forward._resolved["forward_models"]  # pyright: ignore[reportPrivateUsage]
+    assert ("list[Item]", False, True) in entries
+    assert ("list[Item]", True, False) in entries
+    assert wrap_type(module.Other).attribute_hints["items"] == wrap_type(list[int])
+    assert wrap_type(module.Another).attribute_hints["items"] == wrap_type(list[str])
+    assert ("list[Alias]", False, True) not in entries
+    forward.invalidate(module)
+    assert "forward_models" not in forward._resolved  # pyright: ignore[reportPrivateUsage]
+
+
+def test_forward_module_reloaded(module: Any) -> None:
+    old = module.Item
+    assert wrap_type(module.Model).attribute_hints["items"] == wrap_type(list[old])
+    module = importlib.reload(module)
+    assert module.Item is not old
+    assert wrap_type(module.Model).attribute_hints["items"] == wrap_type(list[module.Item])
+
+
+def test_forward_same_string_across_modules_concurrently() -> None:
+    modules = [{"__name__": "forward_ints", "Item": int}, {"__name__": "forward_strs", "Item": str}]
+    barrier = threading.Barrier(len(modules))
+    results: dict[str, set[Any]] = {}
+
+    def run(globalns: dict[str, Any]) -> None:
+        seen = results[globalns["__name__"]] = set()
+        barrier.wait()
+        for _ in range(2000):
+            forward.invalidate(globalns["__name__"])
+            seen.add(forward.evaluate("list[Item]", globalns, None, (), is_argument=False, is_class=True))
+
+    threads = [threading.Thread(target=run, args=(globalns,)) for globalns in modules]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+        forward.invalidate()
+
+    assert results == {"forward_ints": {list[int]}, "forward_strs": {list[str]}}
@@ -0,0 +1,153 @@
+import gc
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Annotated, Any, Literal
+
+import pytest
+
+from peritype import clear_cache, persist, wrap_type
+from peritype.persist import PersistentCache
+
+SOURCE = """
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+
+class Box[T]:
+    value: T
+
+
+class Model(Box[int]):
+    name: str | None
+    kind: Literal["a", "b"]
+    children: list[Model]
+    meta: Annotated[dict[str, int], "meta"]
+
+    def method(self, a: int, b: Model | None = None) -> list[Box[str]]: ...
+"""
+
+
+@pytest.fixture
+def module(tmp_path: Path) -> Any:
+    (tmp_path / "persisted_models.py").write_text(SOURCE)
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield importlib.import_module("persisted_models")
+    finally:
+        sys.path.remove(str(tmp_path))
+        sys.modules.pop("persisted_models", None)
+        persist.configure(None)
+        clear_cache()
+
+
+def _hints(module: ModuleType) -> dict[str, Any]:
+    model = wrap_type(module.Model)
+    hints = {name: str(hint) for name, hint in model.attribute_hints.items()}
+    hints |= {name: str(hint) for name, hint in model.get_method("method").get_signature_hints().items()}
+    return hints
+
+
+def test_persistent_cache_roundtrip(module: Any, tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "hints.bin"
+    persist.configure(path, autosave=False)
+    expected = _hints(module)
+    persist.save()
+
+    store = PersistentCache(path)
+    assert store.get(module.Box) == {"value": module.Box.__type_params__[0]}
+    assert store.get(module.Model) == {
+        "name": str | None,
+        "kind": Literal["a", "b"],
+        "children": list[module.Model],
+        "meta": Annotated[dict[str, int], "meta"],
+    }
+    persist.configure(path, autosave=False)
+    clear_cache()
+    gc.collect()
+    assert _hints(module) == expected
+    assert persist._STORE is not None  # pyright: ignore[reportPrivateUsage]
+    assert persist._STORE.info()["hits"] >= 2  # pyright: ignore[reportPrivateUsage]
+
+
+def test_persistent_cache_invalidated_by_source_change(module: Any, tmp_path: Path) -> None:
+    path = tmp_path / "hints.bin"
+    persist.configure(path, autosave=False)
+    _ = _hints(module)
+    persist.save()
+
+    source = Path(module.__file__)
+    source.write_text(SOURCE + "\n# changed\n")
+    store = PersistentCache(path)
+    assert store.get(module.Model) is None
+    assert store.get(module.Box) is None
+    assert store.info()["misses"] == 2
+
+
+def test_persistent_cache_skips_local_types(tmp_path: Path) -> None:
+    class TestType:
+        value: int
+
+    store = PersistentCache(tmp_path / "hints.bin")
+    store.put(TestType, {"value": int})
+    assert store.get(TestType) is None
+
+
+def test_persistent_cache_corrupted_file(tmp_path: Path) -> None:
+    path = tmp_path / "hints.bin"
+    path.write_bytes(b"garbage")
+    assert PersistentCache(path).info()["modules"] == 0
+
+
+def test_persistent_cache_sections_decoded_lazily(module: Any, tmp_path: Path) -> None:
+    path = tmp_path / "hints.bin"
+    persist.configure(path, autosave=False)
+    _ = _hints(module)
+    persist.save()
+
+    store = PersistentCache(path)
+    sections = store._sections  # pyright: ignore[reportPrivateUsage]
+    assert sections["persisted_models"].entries is None
+    assert store.get(module.Model) is not None
+    assert sections["persisted_models"].entries is not None
+    store.save()
+    assert store.get(module.Box) is not None
+
+
+ALIASES = """
+Alias = list[int]
+"""
+
+ALIASED = """
+from __future__ import annotations
+
+from persisted_aliases import Alias
+
+
+class Model:
+    items: Alias
+"""
+
+
+def test_persistent_cache_invalidated_by_touched_module(tmp_path: Path) -> None:
+    (tmp_path / "persisted_aliases.py").write_text(ALIASES)
+    (tmp_path / "persisted_aliased.py").write_text(ALIASED)
+    sys.path.insert(0, str(tmp_path))
+    try:
+        aliased = importlib.import_module("persisted_aliased")
+        path = tmp_path / "hints.bin"
+        persist.configure(path, autosave=False)
+        assert wrap_type(aliased.Model).attribute_hints["items"] == wrap_type(list[int])
+        persist.save()
+        assert PersistentCache(path).get(aliased.Model) == {"items": list[int]}
+
+        (tmp_path / "persisted_aliases.py").write_text(ALIASES.replace("int", "str"))
+        assert PersistentCache(path).get(aliased.Model) is None
+    finally:
+        sys.path.remove(str(tmp_path))
+        sys.modules.pop("persisted_aliases", None)
+        sys.modules.pop("persisted_aliased", None)
+        persist.configure(None)
+        clear_cache()
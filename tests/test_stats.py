@@ -0,0 +1,92 @@
+import sys
+
+from peritype import stats, wrap_func, wrap_type
+
+
+def test_stats_disabled_by_default() -> None:
+    stats.reset()
+
+    class TestType:
+        attr: int
+
+    _ = wrap_type(TestType).attribute_hints
+
+    snapshot = stats.snapshot()
+    assert not snapshot["enabled"]
+    assert snapshot["timings"] == {}
+    assert snapshot["computations"] == {}
+    assert snapshot["caches"]["wrap_type"]["misses"] > 0
+
+
+def test_stats_cache_counters() -> None:
+    class TestType:
+        pass
+
+    stats.enable()
+    stats.reset()
+    try:
+        twrap = wrap_type(TestType)
+        assert wrap_type(TestType) is twrap
+    finally:
+        stats.disable()
+
+    info = stats.snapshot()["caches"]["wrap_type"]
+    assert info["misses"] == 1
+    assert info["hits"] == 1
+    assert info["entries"] > 0
+    assert info["approx_bytes"] > 0
+
+
+def test_stats_enabled() -> None:
+    class TestType[T]:
+        attr: T
+
+        def __init__(self, value: T) -> None: ...
+
+    stats.enable()
+    stats.reset()
+    try:
+        twrap = wrap_type(TestType[int])
+        _ = twrap.attribute_hints
+        _ = wrap_func(TestType.__init__).get_signature_hints(belongs_to=twrap)
+        snapshot = stats.snapshot()
+    finally:
+        stats.disable()
+
+    assert snapshot["enabled"]
+    assert snapshot["timings"]["wrap_type"]["count"] >= 1
+    assert snapshot["timings"]["wrap_func"]["count"] == 1
+    assert snapshot["timings"]["get_generics"]["count"] >= 1
+    assert snapshot["timings"]["fill_params_in"]["count"] >= 1
+    assert snapshot["timings"]["get_type_hints"]["count"] >= 2
+    assert str(twrap) in snapshot["build_by_type"]
+    assert snapshot["computations"]["attribute_hints"] == 1
+    assert snapshot["computations"]["type_var_lookup"] >= 1
+
+
+def test_stats_reset() -> None:
+    stats.enable()
+    try:
+        _ = wrap_type(list[int])
+    finally:
+        stats.disable()
+    stats.reset()
+
+    snapshot = stats.snapshot()
+    assert snapshot["timings"] == {}
+    assert snapshot["build_by_type"] == {}
+    assert snapshot["caches"]["wrap_type"]["hits"] == 0
+
+
+def test_stats_approx_size_counts_slots() -> None:
+    class TestType:
+        __slots__ = ("items", "name")
+
+        def __init__(self) -> None:
+            self.items = list(range(100))
+
+    instance = TestType()
+    assert stats.approx_size(instance) == sys.getsizeof(instance) + sys.getsizeof(instance.items)
+
+    twrap = wrap_type(dict[str, list[int]])
+    assert stats.approx_size(twrap) > sys.getsizeof(twrap)
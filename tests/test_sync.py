@@ -0,0 +1,186 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from peritype import wrap_type
+from peritype.sync import LazySlots, SingleFlight, locked_cached_property
+
+THREADS = 8
+
+
+def test_single_flight_one_builder() -> None:
+    flights = SingleFlight[str, int]()
+    calls: list[int] = []
+    barrier = threading.Barrier(THREADS)
+
+    def build() -> int:
+        calls.append(1)
+        time.sleep(0.05)
+        return 42
+
+    def run() -> int:
+        barrier.wait()
+        return flights.do("key", build)
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = [*pool.map(lambda _: run(), range(THREADS))]
+
+    assert results == [42] * THREADS
+    assert len(calls) == 1
+    assert len(flights) == 0
+
+
+def test_single_flight_shares_errors() -> None:
+    flights = SingleFlight[str, int]()
+    barrier = threading.Barrier(THREADS)
+
+    def build() -> int:
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    def run() -> str:
+        barrier.wait()
+        try:
+            flights.do("key", build)
+        except ValueError as error:
+            return str(error)
+        return ""
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = [*pool.map(lambda _: run(), range(THREADS))]
+
+    assert results == ["boom"] * THREADS
+    assert len(flights) == 0
+
+
+def test_single_flight_reentrant() -> None:
+    flights = SingleFlight[str, int]()
+
+    assert flights.do("key", lambda: flights.do("key", lambda: 1) + 1) == 2
+
+
+def test_locked_cached_property() -> None:
+    barrier = threading.Barrier(THREADS)
+
+    class TestType:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        @locked_cached_property
+        def value(self) -> object:
+            self.calls += 1
+            time.sleep(0.05)
+            return object()
+
+    instance = TestType()
+
+    def run() -> object:
+        barrier.wait()
+        return instance.value
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = [*pool.map(lambda _: run(), range(THREADS))]
+
+    assert instance.calls == 1
+    assert all(result is results[0] for result in results)
+    assert instance.value is results[0]
+    assert isinstance(TestType.value, locked_cached_property)
+
+
+def test_locked_cached_property_error() -> None:
+    class TestType:
+        @locked_cached_property
+        def value(self) -> int:
+            raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        _ = TestType().value
+
+
+def test_lazy_slots() -> None:
+    calls: list[int] = []
+
+    class TestType(metaclass=LazySlots):
+        __slots__ = ("base",)
+
+        def __init__(self, base: int) -> None:
+            self.base = base
+
+        @locked_cached_property
+        def value(self) -> int:
+            calls.append(self.base)
+            return self.base * 2
+
+    instance = TestType(21)
+    barrier = threading.Barrier(THREADS)
+
+    def run() -> int:
+        barrier.wait()
+        return instance.value
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = [*pool.map(lambda _: run(), range(THREADS))]
+
+    assert results == [42] * THREADS
+    assert calls == [21]
+    assert not hasattr(instance, "__dict__")
+    assert TestType(1).value == 2
+
+
+def test_lazy_slots_error() -> None:
+    class TestType(metaclass=LazySlots):
+        @locked_cached_property
+        def value(self) -> int:
+            raise ValueError("boom")
+
+    with pytest.raises(ValueError) as info:
+        _ = TestType().value
+    assert info.value.__context__ is None
+
+
+def test_lazy_slots_property_error() -> None:
+    class TestType(metaclass=LazySlots):
+        @locked_cached_property
+        def value(self) -> int:
+            return 1
+
+        @property
+        def broken(self) -> int:
+            return self.missing  # pyright: ignore[reportAttributeAccessIssue]
+
+    instance = TestType()
+    with pytest.raises(AttributeError) as info:
+        _ = instance.broken
+    assert info.value.name == "missing"
+    with pytest.raises(AttributeError) as info:
+        _ = instance.other  # pyright: ignore[reportAttributeAccessIssue]
+    assert info.value.name == "other"
+    assert instance.value == 1
+
+
+def test_wraps_have_no_dict() -> None:
+    twrap = wrap_type(dict[str, list[int]])
+    assert twrap.contains_any is False
+    assert not hasattr(twrap, "__dict__")
+    assert not hasattr(twrap.nodes[0], "__dict__")
+
+
+def test_wrap_type_concurrent() -> None:
+    class Model[T]:
+        attr: T
+
+    classes: list[Any] = [type(f"Model{i}", (), {}) for i in range(50)]
+    barrier = threading.Barrier(THREADS)
+
+    def run() -> list[Any]:
+        barrier.wait()
+        return [wrap_type(Model[cls | None]).attribute_hints["attr"] for cls in classes]
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = [*pool.map(lambda _: run(), range(THREADS))]
+
+    for result in results:
+        assert all(a is b for a, b in zip(result, results[0], strict=True))
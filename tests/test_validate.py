@@ -0,0 +1,108 @@
+from collections.abc import Sequence
+from typing import Any, Literal, NotRequired, Protocol, TypedDict
+
+import pytest
+
+from peritype import wrap_type
+
+
+class Item(TypedDict):
+    name: str
+    tags: NotRequired[list[str]]
+    children: NotRequired[list["Item"]]
+
+
+def test_check_simple_types() -> None:
+    class TestType:
+        pass
+
+    assert wrap_type(int).check(1)
+    assert not wrap_type(int).check("1")
+    assert wrap_type(TestType).check(TestType())
+    assert wrap_type(Any).check(object())
+    assert wrap_type(None).check(None)
+    assert not wrap_type(None).check(0)
+
+
+def test_check_unions() -> None:
+    twrap = wrap_type(int | str | list[int] | None)
+
+    assert twrap.check(1)
+    assert twrap.check("1")
+    assert twrap.check(None)
+    assert twrap.check([1, 2])
+    assert not twrap.check([1, "2"])
+    assert not twrap.check(1.0)
+
+
+def test_check_collections() -> None:
+    assert wrap_type(list[int]).check([1, 2, 3])
+    assert not wrap_type(list[int]).check((1, 2, 3))
+    assert wrap_type(set[str]).check({"a"})
+    assert not wrap_type(frozenset[str]).check(frozenset({1}))
+    assert wrap_type(dict[str, list[int]]).check({"a": [1]})
+    assert not wrap_type(dict[str, list[int]]).check({1: [1]})
+    assert wrap_type(Sequence[int]).check((1, 2))
+    assert wrap_type(list[Any]).check([1, "2"])
+
+
+def test_check_tuples() -> None:
+    assert wrap_type(tuple[int, str]).check((1, "a"))
+    assert not wrap_type(tuple[int, str]).check((1, 2))
+    assert not wrap_type(tuple[int, str]).check((1,))
+    assert wrap_type(tuple[int, ...]).check((1, 2, 3))
+    assert not wrap_type(tuple[int, ...]).check((1, "2"))
+
+
+def test_check_literal() -> None:
+    twrap = wrap_type(Literal["a", 1])
+
+    assert twrap.check("a")
+    assert twrap.check(1)
+    assert not twrap.check(True)
+    assert not twrap.check("b")
+    assert not twrap.check([])
+
+
+def test_check_type() -> None:
+    assert wrap_type(type[int]).check(bool)
+    assert not wrap_type(type[int]).check(str)
+    assert not wrap_type(type[int]).check(1)
+
+
+def test_check_typed_dict() -> None:
+    twrap = wrap_type(Item)
+
+    assert twrap.check({"name": "a"})
+    assert twrap.check({"name": "a", "tags": ["b"], "children": [{"name": "c"}]})
+    assert not twrap.check({"tags": []})
+    assert not twrap.check({"name": "a", "children": [{"name": 1}]})
+    assert not twrap.check([("name", "a")])
+
+
+def test_check_static_protocol() -> None:
+    class TestProtocol(Protocol):
+        def method(self) -> None: ...
+
+    assert wrap_type(TestProtocol).check(1)
+
+
+def test_validator_cached() -> None:
+    twrap = wrap_type(list[int])
+
+    assert twrap.validator() is twrap.validator()
+    assert twrap.validator(sample=10) is twrap.validator(sample=10)
+    assert twrap.validator() is not twrap.validator(sample=10)
+
+
+def test_check_sampled() -> None:
+    values: list[Any] = [*range(1000)]
+    values[1] = "1"
+    twrap = wrap_type(list[int])
+
+    assert not twrap.check(values)
+    assert twrap.check(values, sample=10)
+    assert not twrap.check(values, sample=1000)
+    assert not wrap_type(dict[str, int]).check({"a": "1"} | {str(i): i for i in range(1000)}, sample=10)
+    with pytest.raises(ValueError):
+        twrap.validator(sample=0)
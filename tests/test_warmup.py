@@ -0,0 +1,127 @@
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from peritype import WarmupReport, clear_cache, stats, warmup, warmup_async, wrap_type
+
+MODELS = """
+class Model:
+    name: str
+    children: list["Model"]
+
+    def __init__(self, name: str) -> None: ...
+
+    def rename(self, name: str) -> "Model": ...
+
+    @staticmethod
+    def build(name: str) -> "Model": ...
+
+    class Nested:
+        value: int
+
+
+def make(name: str) -> Model: ...
+"""
+
+BROKEN = """
+class Broken:
+    def method(self) -> "Missing": ...
+
+
+def broken() -> "Missing": ...
+"""
+
+
+@pytest.fixture
+def package(tmp_path: Path) -> Any:
+    root = tmp_path / "warm_pkg"
+    root.mkdir()
+    (root / "__init__.py").write_text("")
+    (root / "models.py").write_text(MODELS)
+    (root / "broken.py").write_text(BROKEN)
+    (root / "failing.py").write_text("raise RuntimeError('import failed')\n")
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield "warm_pkg"
+    finally:
+        sys.path.remove(str(tmp_path))
+        for name in [*sys.modules]:
+            if name.startswith("warm_pkg"):
+                del sys.modules[name]
+        clear_cache()
+
+
+def _failed(report: WarmupReport) -> set[str]:
+    return {name for name, _ in report.failures}
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_warmup_package(package: str, workers: int) -> None:
+    report = warmup(package, workers=workers)
+    models = sys.modules["warm_pkg.models"]
+
+    assert {str(t) for t in report.types} == {"Model", "Broken", "Model.Nested"}
+    assert {f.name for f in report.functions} == {"rename", "build", "make"}
+    assert _failed(report) == {"warm_pkg.failing", "warm_pkg.broken.Broken.method", "warm_pkg.broken.broken"}
+    assert set(report.module_seconds) == {"warm_pkg", "warm_pkg.models", "warm_pkg.broken"}
+
+    stats.enable()
+    stats.reset()
+    try:
+        twrap = wrap_type(models.Model)
+        assert twrap in report.types
+        assert twrap.attribute_hints["children"].generic_params[0] is twrap
+        assert stats.snapshot()["caches"]["wrap_type"]["hits"] == 1
+    finally:
+        stats.disable()
+
+
+def test_warmup_modules(package: str) -> None:
+    import warm_pkg.models  # pyright: ignore[reportMissingImports]
+
+    report = warmup([warm_pkg.models, "warm_pkg.broken"], pin=True)
+    assert len(report.types) == 3
+    assert report.seconds > 0
+
+
+def test_warmup_async_yields(package: str) -> None:
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def run() -> WarmupReport:
+        ticker = asyncio.create_task(tick())
+        try:
+            return await warmup_async(package, slice_seconds=1e-9)
+        finally:
+            ticker.cancel()
+
+    report = asyncio.run(run())
+    assert {str(t) for t in report.types} == {"Model", "Broken", "Model.Nested"}
+    assert len(report.failures) == 3
+    assert ticks >= len(report.types) + len(report.functions)
+
+
+def test_warmup_async_cancel(package: str) -> None:
+    async def run() -> None:
+        task = asyncio.create_task(warmup_async(package, slice_seconds=1e-9))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert "warm_pkg.failing" not in sys.modules
+
+
+def test_warmup_async_invalid_budget(package: str) -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(warmup_async(package, slice_seconds=0))
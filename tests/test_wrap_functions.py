@@ -1,4 +1,11 @@
-from peritype import FWrap, wrap_func, wrap_type
+import gc
+import weakref
+from dataclasses import dataclass
+from functools import partial
+
+import pytest
+
+from peritype import FWrap, clear_cache, stats, wrap_func, wrap_funcs, wrap_type
 
 
 def test_wrap_basic_func() -> None:
@@ -112,3 +119,85 @@ def test_wrap_init_with_union() -> None:
     signature_hints = fwrap2.get_signature_hints(belongs_to=twrap)
     assert signature_hints["value"].match(P2)
     assert signature_hints["return"].match(None)
+
+
+def test_wrap_funcs_batch() -> None:
+    def func1(x: int) -> None: ...
+
+    def func2(x: str) -> None: ...
+
+    fwraps = wrap_funcs([func1, func2, func1])
+
+    assert [f.func for f in fwraps] == [func1, func2, func1]
+    assert fwraps[0] is fwraps[2]
+    assert fwraps[0] is wrap_func(func1)
+    assert fwraps[1].get_signature_hint(0).match(str)
+
+
+def test_wrap_hints_per_owner() -> None:
+    class TestType[T]:
+        def __init__(self, value: T) -> None: ...
+
+        def get(self) -> list[T]: ...
+
+    clear_cache()
+    stats.enable()
+    stats.reset()
+    try:
+        fwrap = wrap_func(TestType.get)
+        assert fwrap.get_signature_hints(belongs_to=wrap_type(TestType[int]))["return"].match(list[int])
+        assert fwrap.get_signature_hints(belongs_to=wrap_type(TestType[str]))["return"].match(list[str])
+        assert stats.snapshot()["timings"]["get_type_hints"]["count"] == 1
+    finally:
+        stats.disable()
+
+    twrap = wrap_type(TestType[bytes])
+    assert twrap.get_method("get") is twrap.get_method("get")
+    assert twrap.get_method("get") is fwrap.bind(twrap)
+    assert twrap.init is twrap.get_method("__init__")
+    assert twrap.init.get_signature_hints()["value"].match(bytes)
+    assert twrap.init.get_signature_hints(belongs_to=wrap_type(TestType[int]))["value"].match(int)
+
+
+def test_wrap_bound_methods() -> None:
+    @dataclass
+    class TestType:
+        value: int
+
+        def method(self, x: int) -> str: ...
+
+    instance = TestType(1)
+    fwrap = wrap_func(instance.method)
+    assert wrap_func(instance.method) is fwrap
+    assert wrap_func(TestType(2).method) is not fwrap
+    assert fwrap.bound_to is instance
+    assert [*fwrap.parameters] == ["x"]
+    assert fwrap.get_signature_hints() is wrap_func(TestType.method).get_signature_hints()
+    assert fwrap(1) is None
+
+    ref = weakref.ref(instance)
+    del instance
+    gc.collect()
+    assert ref() is None
+    assert fwrap.bound_to is None
+    with pytest.raises(ReferenceError):
+        _ = fwrap.func
+
+
+def test_wrap_unwrapped_callables() -> None:
+    class TestType:
+        @staticmethod
+        def static(x: int) -> int: ...
+
+        @classmethod
+        def klass(cls, x: int) -> int: ...
+
+    def func(x: int, y: str) -> bool: ...
+
+    assert wrap_func(vars(TestType)["static"]) is wrap_func(TestType.static)
+    assert wrap_func(vars(TestType)["klass"]) is wrap_func(TestType.klass.__func__)
+    assert [*wrap_func(TestType.klass).parameters] == ["x"]
+
+    fwrap = wrap_func(partial(func, 1))
+    assert [*fwrap.parameters] == ["y"]
+    assert fwrap.get_signature_hints() == {"y": wrap_type(str), "return": wrap_type(bool)}
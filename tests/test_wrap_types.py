@@ -1,9 +1,12 @@
+import copy
+import pickle
 from collections.abc import Coroutine
-from typing import Annotated, Any, Concatenate, Generic, NotRequired, get_origin
+from typing import Annotated, Any, Concatenate, Generic, Literal, NotRequired, TypeVar, get_origin
 
 import pytest
 
-from peritype import TWrap, wrap_type
+from peritype import TWrap, clear_cache, evict_type, stats, use_lazy_params, wrap_type, wrap_types
+from peritype.errors import PeritypeError
 
 
 def test_wrap_basic_type() -> None:
@@ -353,3 +356,294 @@ def test_wrapped_annotated_type() -> None:
     assert twrap.match(GenericType)
     assert twrap.generic_params[0].match(int)
     assert twrap.annotations == ("meta",)
+
+
+def test_wrap_interned() -> None:
+    class TestType[T]: ...
+
+    assert wrap_type(TestType) == wrap_type(TestType[Any])
+    assert wrap_type(TestType).canonical is wrap_type(TestType[Any]).canonical
+    assert wrap_type(TestType).origin is TestType
+    assert wrap_type(list[int])[0] is wrap_type(list[int] | None)[0]
+    assert wrap_type(Annotated[list[int], "a"])[0] is wrap_type(list[int])[0]
+    assert wrap_type(Annotated[int, "a"]) is not wrap_type(Annotated[int, "b"])
+
+
+type IntAlias = int
+
+
+def test_wrap_interned_keeps_spelling() -> None:
+    literals = [wrap_type(Literal[True]), wrap_type(Literal[1]), wrap_type(Literal[1.0])]
+
+    assert len({id(twrap) for twrap in literals}) == 3
+    assert len(set(literals)) == 3
+    assert [twrap.origin for twrap in literals] == [Literal[True], Literal[1], Literal[1.0]]
+    assert wrap_type(Literal[1]).check(1)
+    assert not wrap_type(Literal[True]).check(1)
+    assert wrap_type(Annotated[int, 1]) != wrap_type(Annotated[int, True])
+
+    assert wrap_type(IntAlias).origin is IntAlias
+    assert wrap_type(int).origin is int
+
+
+class PickledType[T]:
+    attr: T
+
+
+def test_wrap_copy_and_pickle() -> None:
+    hints = [int, IntAlias, PickledType, PickledType[int] | None, Annotated[dict[str, list[int]], "meta"]]
+    for twrap in map(wrap_type, hints):
+        assert copy.copy(twrap) is twrap
+        assert copy.deepcopy(twrap) is twrap
+        assert pickle.loads(pickle.dumps(twrap)) is twrap
+        assert pickle.loads(pickle.dumps(twrap.nodes[0])) is twrap.nodes[0]
+        assert pickle.loads(pickle.dumps(twrap._meta)) is twrap._meta  # pyright: ignore[reportPrivateUsage]
+
+    twrap = wrap_type(PickledType[int])
+    assert copy.deepcopy({"wrap": twrap})["wrap"] is twrap
+    assert pickle.loads(pickle.dumps(twrap)).attribute_hints["attr"] is wrap_type(int)
+
+
+def test_wrap_unhashable_annotation() -> None:
+    twrap = wrap_type(Annotated[int, []])
+
+    assert twrap.annotations == ([],)
+    assert twrap != wrap_type(Annotated[int, []])
+    assert hash(twrap) == hash(twrap)
+
+
+def test_wrap_lazy_params() -> None:
+    class TestType[T]: ...
+
+    use_lazy_params(True)
+    try:
+        twrap = wrap_type(dict[str, list[TestType[int | None]]])
+    finally:
+        use_lazy_params(False)
+
+    assert not twrap[0].resolved
+    assert twrap.inner_type is dict
+    assert not twrap.nullable
+    assert str(twrap).startswith("dict[str, list[")
+    assert not twrap.match(list[Any])
+    assert not twrap[0].resolved
+
+    assert twrap.generic_params[1].generic_params[0].generic_params[0].nullable
+    assert twrap[0].resolved
+    assert twrap.match(dict[str, list[TestType[int]]])
+
+
+def test_wrap_lazy_params_equality() -> None:
+    class TestType[T]: ...
+
+    use_lazy_params(True)
+    try:
+        lazy = wrap_type(TestType[list[int]])
+    finally:
+        use_lazy_params(False)
+    evict_type(TestType[list[int]])
+    eager = wrap_type(TestType[list[int]])
+
+    assert eager[0].resolved
+    assert not lazy[0].resolved
+    assert lazy == eager
+    assert hash(lazy) == hash(eager)
+    assert lazy.canonical is eager
+    assert {eager: 1}[lazy] == 1
+
+
+def test_wrap_types_batch() -> None:
+    class TestType[T]: ...
+
+    types: list[Any] = [int, TestType[list[int]], list[int] | None, Annotated[int, []], int]
+    twraps = wrap_types(types)
+
+    assert len(twraps) == 5
+    assert twraps[0] is wrap_type(int)
+    assert twraps[1] is wrap_type(TestType[list[int]])
+    assert twraps[2].nullable
+    assert twraps[2][0] is twraps[1].generic_params[0][0]
+    assert twraps[3].annotations == ([],)
+    assert twraps[4] is twraps[0]
+
+
+def test_wrap_compiled_matcher() -> None:
+    class TestType[T]: ...
+
+    twrap = wrap_type(dict[str, list[TestType[int]]] | int | None)
+    matcher = twrap.compile_matcher()
+
+    assert twrap.compile_matcher() is matcher
+    assert matcher(wrap_type(int))
+    assert matcher(wrap_type(None))
+    assert matcher(wrap_type(Any))
+    assert matcher(wrap_type(dict[str, list[TestType[int]]]))
+    assert matcher(wrap_type(dict[str, list[TestType[Any]]]))
+    assert not matcher(wrap_type(dict[str, list[TestType[str]]]))
+    assert not matcher(wrap_type(dict[str, list[int]]))
+    assert not matcher(wrap_type(str))
+    assert wrap_type(Any).compile_matcher()(wrap_type(str))
+    assert wrap_type(list[int]).compile_matcher()(wrap_type(list))
+    assert not wrap_type(list[int]).compile_matcher()(wrap_type(set[int]))
+
+
+def test_type_nested_type_vars() -> None:
+    class Base[T]:
+        items: dict[str, list[T]]
+        cache: dict[str, T | None]
+
+        def get(self) -> list[T]: ...
+
+    class Child[U](Base[list[U]]):
+        pairs: list[tuple[U, ...]]
+
+    tw = wrap_type(Child[int])
+    attrs = tw.attribute_hints
+    assert attrs["items"] == wrap_type(dict[str, list[list[int]]])
+    assert attrs["cache"] == wrap_type(dict[str, list[int] | None])
+    assert attrs["pairs"] == wrap_type(list[tuple[int, ...]])
+    assert tw[0].bases[0] == wrap_type(Base[list[int]])
+    assert tw.get_method("get").get_return_hint() == wrap_type(list[list[int]])
+
+
+def test_type_substitute() -> None:
+    t = TypeVar("t")
+
+    class Repository(Generic[t]):
+        item: t
+
+    template = wrap_type(Repository)
+    assert template.substitute({t: int}) == wrap_type(Repository[int])
+    assert template.substitute({t: wrap_type(str)}).attribute_hints["item"] == wrap_type(str)
+    assert wrap_type(t | None).substitute({t: int}) == wrap_type(int | None)
+    assert template.substitute({}) is template
+    assert wrap_type(int).substitute({t: str}) is wrap_type(int)
+
+
+class SubstitutedType[T]:
+    item: T
+
+
+type SubstitutedAlias = SubstitutedType
+type SubstitutedNested = Annotated[dict[str, SubstitutedType] | None, "meta"]
+
+
+def test_type_substitute_union_and_alias() -> None:
+    t = SubstitutedType.__type_params__[0]
+    assert isinstance(t, TypeVar)
+
+    assert wrap_type(SubstitutedType | None).substitute({t: str}) == wrap_type(SubstitutedType[str] | None)
+    assert wrap_type(SubstitutedType | int).substitute({t: str}) == wrap_type(SubstitutedType[str] | int)
+    assert wrap_type(SubstitutedAlias).substitute({t: str}) == wrap_type(SubstitutedType[str])
+    substituted = wrap_type(SubstitutedNested).substitute({t: str})
+    assert substituted == wrap_type(Annotated[dict[str, SubstitutedType[str]] | None, "meta"])
+    assert substituted.annotations == ("meta",)
+    assert not wrap_type(NotRequired[SubstitutedType]).substitute({t: str}).required
+
+    class Opaque:
+        __parameters__ = (t,)
+
+    with pytest.raises(PeritypeError):
+        wrap_type(Opaque()).substitute({t: str})
+
+
+def test_type_template_shared() -> None:
+    class Base[T]:
+        value: T
+
+    class Child[T](Base[list[T]]):
+        other: T
+
+    clear_cache()
+    stats.enable()
+    stats.reset()
+    try:
+        for cls in (int, str, bytes, float):
+            assert wrap_type(Child[cls]).attribute_hints["value"] == wrap_type(list[cls])
+        assert stats.snapshot()["timings"]["get_type_hints"]["count"] == 2
+    finally:
+        stats.disable()
+
+
+def test_type_hints_evaluated_once_per_class() -> None:
+    class Top:
+        top: int
+
+    class Left(Top):
+        left: str
+
+    class Right(Top):
+        right: bytes
+
+    class Bottom(Left, Right):
+        top: Annotated[int, "bottom"]
+
+    clear_cache()
+    stats.enable()
+    stats.reset()
+    try:
+        for cls in (Bottom, Left, Right, Bottom | None, list[Bottom]):
+            _ = wrap_type(cls).nodes[0].attribute_hints
+        assert stats.snapshot()["timings"]["get_type_hints"]["count"] == 4
+    finally:
+        stats.disable()
+    hints = wrap_type(Bottom).attribute_hints
+    assert list(hints) == ["top", "right", "left"]
+    assert hints["top"].annotations == ("bottom",)
+    assert wrap_type(Bottom | None).attribute_hints is hints
+
+
+def test_type_hints_shared_type_var() -> None:
+    t = TypeVar("t")
+
+    class Base(Generic[t]):
+        base: t
+
+    class Child(Base[int], Generic[t]):
+        child: list[t]
+
+    hints = wrap_type(Child[str]).attribute_hints
+    assert hints["base"] == wrap_type(int)
+    assert hints["child"] == wrap_type(list[str])
+
+
+def test_type_get_attribute_hint() -> None:
+    class Base[T]:
+        value: T
+        broken: "Missing"  # noqa: F821  # pyright: ignore[reportUndefinedVariable]
+
+    class Child[T](Base[list[T]]):
+        other: T
+
+    clear_cache()
+    stats.enable()
+    stats.reset()
+    try:
+        twrap = wrap_type(Child[int])
+        assert twrap.get_attribute_hint("value") == wrap_type(list[int])
+        assert twrap.get_attribute_hint("value") is twrap.get_attribute_hint("value")
+        assert stats.snapshot()["timings"]["get_type_hints"]["count"] == 1
+    finally:
+        stats.disable()
+    with pytest.raises(NameError):
+        twrap.get_attribute_hint("broken")
+    with pytest.raises(AttributeError):
+        twrap.get_attribute_hint("missing")
+    with pytest.raises(TypeError):
+        wrap_type(Child[int] | int).get_attribute_hint("value")
+
+
+def test_type_lazy_attribute_hints() -> None:
+    class Model:
+        a: int
+        b: "list[int]"
+
+    view = wrap_type(Model).lazy_attribute_hints
+    assert list(view) == ["a", "b"]
+    assert len(view) == 2
+    assert "a" in view
+    assert "c" not in view
+    assert view["b"] == wrap_type(list[int])
+    with pytest.raises(KeyError):
+        view["c"]
+    assert dict(view) == wrap_type(Model).attribute_hints